@@ -10,29 +10,42 @@ Supports multiple strategies running simultaneously, each with:
 How it works:
 1. Load configuration and credentials
 2. Initialize all strategy instances
-3. Enter main loop:
+3. Enter main loop (asyncio):
    - Every 5 minutes: For each ENABLED strategy, check entry/exit
+     (strategies are checked concurrently - blocking exchange/SDK calls
+     run on worker threads via asyncio.to_thread)
+   - On price stream ticks (at most every few seconds): re-check exits
+     for strategies in a position, so trailing stops fire between checks
    - Every hour: Send heartbeat
-   - On errors: Alert and pause
-4. Loop forever (until manually stopped)
+   - On errors: Retry transient network errors, alert and pause on anything else
+4. Loop forever (until STOP file, SIGTERM/SIGUSR1 or Ctrl+C)
 """
 
 import os
 import sys
-import json
+import asyncio
 import time
+import signal
+import queue
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict
-import pytz
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+import orjson
+import requests
 from dotenv import load_dotenv
+from hyperliquid.utils.error import ServerError
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.exchange import HyperLiquidClient
-from src.strategy import OvernightRecoveryStrategy
+from src.strategy import OvernightRecoveryStrategy, EntryReason
 from src.oi_strategy import OIStrategy
 from src.bh_strategy import BHInsightsStrategy
 from src.melon_strategy import MelonStrategy
@@ -44,6 +57,13 @@ from src.command_handler import CommandHandler
 # Solana client - only imported if enabled
 SolanaDEXClient = None
 
+# uvloop (libuv event loop) - optional, Linux/macOS only. Installed in __main__
+# so that importing this module never changes the caller's event loop policy
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 # Strategy registry - maps names to classes
 STRATEGY_CLASSES = {
@@ -53,6 +73,44 @@ STRATEGY_CLASSES = {
     'pastel_melon': MelonStrategy
 }
 
+# Timezones (looked up once, not per call)
+UTC = timezone.utc
+NY_TZ = ZoneInfo('America/New_York')
+
+# Timeout for balance checks on the Telegram command path (seconds)
+# Keeps /enable and /reallocate responsive when the exchange is slow
+BALANCE_CHECK_TIMEOUT = 2
+
+# Errors that are worth riding out (network blips, exchange 5xx) instead of pausing
+TRANSIENT_ERRORS = (requests.Timeout, requests.ConnectionError, ServerError)
+
+# How often unsaved config changes are flushed to disk (seconds)
+CONFIG_FLUSH_INTERVAL = 1
+
+# Config sections (and keys within them) the bot reads without defaults
+REQUIRED_CONFIG_KEYS = {
+    'strategies': (),
+    'exchange': ('testnet', 'retry_attempts', 'request_timeout_seconds'),
+    'bot': ('loop_interval_seconds',),
+    'risk': (),
+}
+
+# Emergency STOP file and how often the watcher task stat()s it (seconds)
+STOP_FILE = Path('./STOP')
+STOP_FILE_CHECK_INTERVAL = 1
+
+# Strategies with their own handlers - skipped by the generic entry/exit loop
+SPECIAL_STRATEGIES = ('bh', 'pastel_melon')
+
+# Routine entry rejections that are not worth recording in the state file
+_UNRECORDED_ENTRY_REASONS = (EntryReason.NOT_ENTRY_HOUR, EntryReason.COOLDOWN)
+
+# Strategy names in display order (STRATEGY_CLASSES is fixed at import)
+STRATEGY_NAMES = tuple(STRATEGY_CLASSES)
+
+# Upper-case labels used in trade alerts, e.g. 'oi' -> 'OI'
+STRATEGY_LABELS = {name: name.upper() for name in STRATEGY_CLASSES}
+
 STRATEGY_DESCRIPTIONS = {
     'overnight': 'Buy at 3 PM EST, trailing stop 1%',
     'oi': 'Open Interest signals, never sell at loss',
@@ -60,6 +118,90 @@ STRATEGY_DESCRIPTIONS = {
     'pastel_melon': 'Pastel Melon - Solana memecoin calls'
 }
 
+# Telegram HTML templates for trade alerts (filled with str.format_map)
+_ENTRY_TMPL = (
+    "📈 <b>[{name}] ENTRY</b>\n\n"
+    "<b>Price:</b> ${price:,.2f}\n"
+    "<b>Size:</b> {size:.4f} BTC (${usd:,.0f})\n"
+    "<b>Time:</b> {time}\n"
+    "<b>Reason:</b> {reason}"
+)
+
+_EXIT_TMPL = (
+    "{emoji} <b>[{name}] EXIT</b>\n\n"
+    "<b>Entry:</b> ${entry:,.2f}\n"
+    "<b>Exit:</b> ${exit:,.2f}\n"
+    "<b>P&L:</b> {pct:+.2f}% (${usd:+,.2f})\n"
+    "<b>Reason:</b> {reason}"
+)
+
+_CLOSE_TMPL = (
+    "{emoji} <b>[{name}] CLOSED</b>\n\n"
+    "<b>Entry:</b> ${entry:,.2f}\n"
+    "<b>Exit:</b> ${exit:,.2f}\n"
+    "<b>P&L:</b> {pct:+.2f}% (${usd:+,.2f})"
+)
+
+
+@dataclass
+class Decision:
+    """
+    Outcome of evaluating one strategy for one loop iteration
+
+    action is 'enter', 'exit' or 'none'. Entry decisions carry size_usd;
+    exit decisions carry size_btc and the position being closed.
+    """
+    strategy: str
+    action: str
+    price: float
+    reason: str
+    size_usd: Optional[float] = None
+    size_btc: Optional[float] = None
+    position: Optional[dict] = None
+
+
+@dataclass(frozen=True, repr=False)
+class Credentials:
+    """
+    Secrets read from the environment (.env), once at startup
+
+    accounts maps each upper-case account NAME with both NAME_API_KEY and
+    NAME_API_SECRET set to its (key, secret); HYPERLIQUID is the default
+    account. repr is disabled so the secrets can't end up in a log line.
+    """
+    hyperliquid_api_key: Optional[str]
+    hyperliquid_api_secret: Optional[str]
+    telegram_bot_token: Optional[str]
+    telegram_chat_id: Optional[str]
+    solana_private_key: Optional[str]
+    solana_rpc_url: str
+    clickhouse_password: str
+    accounts: Dict[str, Tuple[str, str]]
+
+    @classmethod
+    def from_env(cls) -> 'Credentials':
+        """Build from os.environ (call after load_dotenv())"""
+        env = os.environ
+        suffix = '_API_KEY'
+        accounts = {}
+        for key, api_key in env.items():
+            if key.endswith(suffix):
+                name = key[:-len(suffix)]
+                api_secret = env.get(f"{name}_API_SECRET")
+                if api_key and api_secret:
+                    accounts[name] = (api_key, api_secret)
+
+        return cls(
+            hyperliquid_api_key=env.get('HYPERLIQUID_API_KEY'),
+            hyperliquid_api_secret=env.get('HYPERLIQUID_API_SECRET'),
+            telegram_bot_token=env.get('TELEGRAM_BOT_TOKEN'),
+            telegram_chat_id=env.get('TELEGRAM_CHAT_ID'),
+            solana_private_key=env.get('SOLANA_PRIVATE_KEY'),
+            solana_rpc_url=env.get('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com'),
+            clickhouse_password=env.get('CLICKHOUSE_PASSWORD', ''),
+            accounts=accounts
+        )
+
 
 class TradingBot:
     """
@@ -79,11 +221,15 @@ class TradingBot:
 
         # Load configuration
         print("Loading configuration...")
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = self._load_config(config_path)
+
+        # Config edits from Telegram commands are batched - see _mark_config_dirty()
+        self._config_lock = threading.Lock()
+        self._config_dirty = False
 
         # Load environment variables (.env file)
         load_dotenv()
+        self._credentials = Credentials.from_env()
 
         # Setup logging
         self._setup_logging()
@@ -94,28 +240,93 @@ class TradingBot:
 
         # Bot state
         self.is_running = True
+        self._stop_event = asyncio.Event()  # Set by SIGTERM/SIGINT/SIGUSR1 - wakes the loop sleep
         self.is_paused = False
         self.last_heartbeat = None
         self.loop_count = 0
+        self._consecutive_errors = 0  # Transient loop errors in a row (reset on success)
 
         # Track balance for daily reset
         self.daily_start_balance = None
         self.last_daily_reset = None
 
+        # Last balance seen by a command - fallback when the exchange is unreachable
+        self.last_known_balance = None
+
+        # (name, strategy) pairs for the generic entry/exit loop (see _rebuild_dispatch)
+        self._dispatch = ()
+        # Decision.action -> bound method that places the order
+        self._executors = {'enter': self._execute_entry, 'exit': self._execute_exit}
+
+        # Serializes trading between the main loop (generic, BH and Melon
+        # strategies), the tick-driven exit watcher (see _exit_watch_loop)
+        # and state-changing Telegram commands, so a position is never sold twice
+        self._strategy_lock = asyncio.Lock()
+        self._price_event = asyncio.Event()
+        self._rebuild_dispatch()  # Warns about enabled-but-not-loaded strategies at startup
+
         self.logger.info("Bot initialized successfully")
 
+    @staticmethod
+    def _load_config(config_path: str) -> dict:
+        """
+        Read config.json and check it has everything the bot needs
+
+        Parsed with orjson (one C call). Missing sections/keys are reported
+        all at once here, instead of as a KeyError halfway through startup
+        or on the first loop iteration.
+
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Configuration dictionary
+
+        Raises:
+            Exception: If the file isn't valid JSON or required keys are missing
+        """
+        try:
+            config = orjson.loads(Path(config_path).read_bytes())
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Invalid JSON in {config_path}: {e}") from e
+
+        if not isinstance(config, dict):
+            raise Exception(f"{config_path} must contain a JSON object")
+
+        missing = []
+        for section, keys in REQUIRED_CONFIG_KEYS.items():
+            if not isinstance(config.get(section), dict):
+                missing.append(section)
+                continue
+            missing.extend(f"{section}.{key}" for key in keys if key not in config[section])
+
+        if missing:
+            raise Exception(f"Missing required config in {config_path}: {', '.join(missing)}")
+
+        return config
+
     def _setup_logging(self):
-        """Setup logging to file and console"""
+        """
+        Setup logging to file and console
+
+        Records are handed to a QueueListener thread that does the actual
+        file/console writes, so logging never blocks the trading loop on disk I/O.
+
+        The file rolls over at midnight UTC: logs/trades.log is today,
+        logs/trades.log.YYYY-MM-DD are the previous 30 days.
+        """
         log_dir = Path('./logs')
         log_dir.mkdir(exist_ok=True)
 
         self.logger = logging.getLogger('TradingBot')
         self.logger.setLevel(logging.INFO)
+        self._log_listener = None
 
         # Avoid duplicate handlers
         if not self.logger.handlers:
-            log_file = log_dir / f"trades_{datetime.now().strftime('%Y-%m-%d')}.log"
-            file_handler = logging.FileHandler(log_file)
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                log_dir / 'trades.log', when='midnight', utc=True, backupCount=30, delay=True
+            )
             file_handler.setLevel(logging.INFO)
 
             console_handler = logging.StreamHandler()
@@ -128,21 +339,32 @@ class TradingBot:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            self._log_listener.start()
 
     def _initialize_components(self):
         """Initialize all bot components"""
+        creds = self._credentials
+
         # Exchange client (HyperLiquid for perps)
         self.exchange = HyperLiquidClient(
-            api_key=os.getenv('HYPERLIQUID_API_KEY'),
-            api_secret=os.getenv('HYPERLIQUID_API_SECRET'),
+            api_key=creds.hyperliquid_api_key,
+            api_secret=creds.hyperliquid_api_secret,
             testnet=self.config['exchange']['testnet'],
             retry_attempts=self.config['exchange']['retry_attempts'],
             timeout=self.config['exchange']['request_timeout_seconds']
         )
         self.logger.info(f"Exchange: {'TESTNET' if self.config['exchange']['testnet'] else 'MAINNET'}")
 
+        # Live prices over websocket (REST polling is the fallback)
+        if self.config['exchange'].get('price_stream', True):
+            self.exchange.start_price_stream()
+            self.logger.info("Price stream started (allMids websocket)")
+
         # Solana DEX client (for Pastel Melon strategy)
         self.solana_client = None
         if self.config.get('solana', {}).get('enabled'):
@@ -150,8 +372,8 @@ class TradingBot:
                 global SolanaDEXClient
                 from src.solana_client import SolanaDEXClient
                 self.solana_client = SolanaDEXClient(
-                    private_key=os.getenv('SOLANA_PRIVATE_KEY'),
-                    rpc_url=os.getenv('SOLANA_RPC_URL', 'https://api.mainnet-beta.solana.com'),
+                    private_key=creds.solana_private_key,
+                    rpc_url=creds.solana_rpc_url,
                     slippage_bps=self.config.get('solana', {}).get('slippage_bps', 100),
                     priority_fee_lamports=self.config.get('solana', {}).get('priority_fee_lamports', 100000)
                 )
@@ -168,15 +390,21 @@ class TradingBot:
 
                 # Special handling for BH strategy - inject Clickhouse password from env
                 if name == 'bh':
-                    params['clickhouse_password'] = os.getenv('CLICKHOUSE_PASSWORD', '')
+                    params['clickhouse_password'] = creds.clickhouse_password
 
                 # Special handling for Pastel Melon strategy - inject Clickhouse password from env
                 if name == 'pastel_melon':
-                    params['clickhouse_password'] = os.getenv('CLICKHOUSE_PASSWORD', '')
+                    params['clickhouse_password'] = creds.clickhouse_password
 
                 self.strategies[name] = strategy_class(params)
                 self.logger.info(f"Strategy loaded: {name}")
 
+        # Bound reset_daily_state methods (the strategy set is fixed after startup)
+        self._daily_resets = tuple(
+            strategy.reset_daily_state for strategy in self.strategies.values()
+            if hasattr(strategy, 'reset_daily_state')
+        )
+
         # State manager
         self.state_manager = StateManager('./state')
         self.state_manager.load_state()
@@ -184,12 +412,15 @@ class TradingBot:
 
         # Notifier
         self.notifier = TelegramNotifier(
-            bot_token=os.getenv('TELEGRAM_BOT_TOKEN'),
-            chat_id=os.getenv('TELEGRAM_CHAT_ID'),
+            bot_token=creds.telegram_bot_token,
+            chat_id=creds.telegram_chat_id,
             enabled=True
         )
         self.logger.info("Telegram notifier initialized")
 
+        # Deliver alerts from a background thread so Telegram never blocks trading
+        self.notifier.start_background_sender()
+
         # Risk manager
         self.risk_manager = RiskManager(self.config['risk'])
         self.logger.info(f"Risk Manager: {self.risk_manager}")
@@ -199,25 +430,122 @@ class TradingBot:
         self.logger.info("Command handler initialized")
 
         # Register bot commands with Telegram (for dropdown menu)
+        # (the command listener itself runs as a task on the event loop - see run())
         self.notifier.set_bot_commands()
 
-        # Start listening for Telegram commands in background
-        self.notifier.start_listening_for_commands(self.command_handler)
-        self.logger.info("Telegram command listener started")
-
     def save_config(self):
-        """Save current config to disk"""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        """
+        Save current config to disk
+
+        Writes to a temp file then atomically renames it over the config,
+        so a crash mid-write can never leave a truncated config.json.
+        """
+        with self._config_lock:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            self._config_dirty = False
+
+        tmp_path = f"{self.config_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_path)
+
+    def _mark_config_dirty(self):
+        """
+        Flag the config as changed
+
+        The main loop writes it out within CONFIG_FLUSH_INTERVAL, so a burst
+        of Telegram commands results in a single disk write.
+        """
+        self._config_dirty = True
+
+    async def _config_flush_loop(self):
+        """Background task: save the config whenever it has unsaved changes"""
+        while True:
+            await asyncio.sleep(CONFIG_FLUSH_INTERVAL)
+            if self._config_dirty:
+                try:
+                    await asyncio.to_thread(self.save_config)
+                except Exception as e:
+                    self.logger.error(f"Failed to save config: {e}")
+
+    def _request_stop(self, signum=None, frame=None):
+        """
+        Signal handler: stop the main loop after the current iteration
+
+        Installed for SIGTERM (Railway redeploys, `kill`), SIGINT (Ctrl+C)
+        and SIGUSR1 (operator stop: `kill -USR1 <pid>`). Wakes the
+        inter-iteration sleep immediately instead of waiting out the loop
+        interval.
+        """
+        if signum == signal.SIGINT:
+            self.logger.info("Shutdown requested by user (Ctrl+C)")
+        elif signum is not None:
+            self.logger.warning("Received %s - shutting down", signal.Signals(signum).name)
+        self.is_running = False
+        self._stop_event.set()
 
     def _check_stop_file(self) -> bool:
         """Check if STOP file exists (emergency shutdown)"""
-        stop_file = Path('./STOP')
-        if stop_file.exists():
+        if STOP_FILE.exists():
             self.logger.warning("STOP file detected - shutting down")
             return True
         return False
 
+    async def _stop_file_watch_loop(self):
+        """
+        Background task: stop the bot as soon as a STOP file appears
+
+        Polls every STOP_FILE_CHECK_INTERVAL instead of once per main-loop
+        iteration, so `touch STOP` takes effect within a second rather than
+        after up to a full loop interval - same path as a stop signal.
+        """
+        while self.is_running:
+            if self._check_stop_file():
+                self._request_stop()
+                return
+            await asyncio.sleep(STOP_FILE_CHECK_INTERVAL)
+
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """
+        Check if an error (or anything it was raised from) is a transient network error
+
+        The exchange client wraps SDK/requests errors in generic Exceptions,
+        so walk the __cause__/__context__ chain to find the original.
+        """
+        seen = set()
+        while error is not None and id(error) not in seen:
+            if isinstance(error, TRANSIENT_ERRORS):
+                return True
+            seen.add(id(error))
+            error = error.__cause__ or error.__context__
+        return False
+
+    def _rebuild_dispatch(self):
+        """
+        Rebuild the dispatch table for the generic entry/exit loop
+
+        One (name, strategy) pair per enabled strategy, excluding
+        BH/Pastel Melon (own handlers) and anything not loaded.
+        Called at startup and from enable/disable/reallocate, so the loop
+        never re-filters names per iteration (and only warns once about
+        stale names).
+        """
+        dispatch = []
+        for strategy_name in self.state_manager.get_enabled_strategies():
+            if strategy_name in SPECIAL_STRATEGIES:
+                continue  # Handled by their own handlers
+
+            if strategy_name not in self.strategies:
+                self.logger.warning("Strategy %s enabled but not loaded", strategy_name)
+                continue
+
+            dispatch.append((strategy_name, self.strategies[strategy_name]))
+
+        self._dispatch = tuple(dispatch)
+
     def _handle_bh_strategy(self, current_time: datetime):
         """
         Handle BH Insights strategy specially - it monitors Clickhouse for signals
@@ -243,8 +571,8 @@ class TradingBot:
         # Get pending signals
         pending = strategy.get_pending_signals()
 
-        for asset, signal in pending.items():
-            action = signal['action']
+        for asset, pending_signal in pending.items():
+            action = pending_signal.action
 
             # Create position key for this asset under BH strategy
             position_key = f"bh_{asset.lower()}"
@@ -300,18 +628,18 @@ class TradingBot:
 
                     # Send notification
                     emoji = "📈" if action == 'LONG' else "📉"
-                    self.notifier.send_message(
+                    self.notifier.queue_message(
                         f"{emoji} <b>[BH] {action} {asset}</b>\n\n"
                         f"<b>Price:</b> ${fill_price:,.2f}\n"
                         f"<b>Size:</b> {fill_size:.4f} {asset} (${position_size_usd:,.0f})\n"
-                        f"<b>Signal:</b> {signal['raw_text'][:100]}..."
+                        f"<b>Signal:</b> {pending_signal.raw_text[:100]}..."
                     )
 
                     self.logger.info(f"[BH] {action} {asset}: {fill_size:.4f} @ ${fill_price:,.2f}")
 
                 except Exception as e:
                     self.logger.error(f"[BH] Failed to place {action} order on {asset}: {e}")
-                    self.notifier.send_error_alert(f"[BH] {action} {asset} failed: {str(e)}", None)
+                    self.notifier.queue_error_alert(f"[BH] {action} {asset} failed: {str(e)}", None)
 
             elif action == 'EXIT':
                 # Check if in position for this asset
@@ -360,19 +688,19 @@ class TradingBot:
 
                     # Send notification
                     emoji = "🟢" if profit_pct >= 0 else "🔴"
-                    self.notifier.send_message(
+                    self.notifier.queue_message(
                         f"{emoji} <b>[BH] EXIT {asset}</b>\n\n"
                         f"<b>Entry:</b> ${entry_price:,.2f}\n"
                         f"<b>Exit:</b> ${fill_price:,.2f}\n"
                         f"<b>P&L:</b> {profit_pct:+.2f}% (${profit_usd:+,.2f})\n"
-                        f"<b>Signal:</b> {signal['raw_text'][:100]}..."
+                        f"<b>Signal:</b> {pending_signal.raw_text[:100]}..."
                     )
 
                     self.logger.info(f"[BH] EXIT {asset}: ${fill_price:,.2f} ({profit_pct:+.2f}%)")
 
                 except Exception as e:
                     self.logger.error(f"[BH] Failed to exit {asset}: {e}")
-                    self.notifier.send_error_alert(f"[BH] EXIT {asset} failed: {str(e)}", None)
+                    self.notifier.queue_error_alert(f"[BH] EXIT {asset} failed: {str(e)}", None)
 
     def _handle_melon_strategy(self, current_time: datetime):
         """
@@ -405,7 +733,7 @@ class TradingBot:
         # Get pending signals and process them
         pending = strategy.get_pending_signals()
 
-        for address, signal in pending.items():
+        for address, pending_signal in pending.items():
             # Skip if already in position
             if address in strategy.active_positions:
                 strategy.clear_signal(address)
@@ -425,7 +753,7 @@ class TradingBot:
             try:
                 token_info = self.solana_client.get_token_info(address)
                 if token_info['liquidity'] < strategy.min_liquidity:
-                    self.logger.info(f"[Pastel Melon] Skipping {signal['ticker']} - low liquidity: ${token_info['liquidity']:,.0f}")
+                    self.logger.info(f"[Pastel Melon] Skipping {pending_signal['ticker']} - low liquidity: ${token_info['liquidity']:,.0f}")
                     strategy.clear_signal(address)
                     continue
             except Exception as e:
@@ -434,7 +762,7 @@ class TradingBot:
                 continue
 
             # Execute buy
-            self.logger.info(f"[Pastel Melon] Buying {signal['ticker']} for ${usdc_to_spend:,.0f}")
+            self.logger.info(f"[Pastel Melon] Buying {pending_signal['ticker']} for ${usdc_to_spend:,.0f}")
 
             try:
                 tx_sig, fill_price, tokens_received = self.solana_client.buy_token(
@@ -449,27 +777,27 @@ class TradingBot:
                     entry_price=fill_price,
                     tokens_bought=tokens_received,
                     usdc_spent=usdc_to_spend,
-                    signal=signal
+                    signal=pending_signal
                 )
 
                 # Clear the pending signal
                 strategy.clear_signal(address)
 
                 # Send notification
-                self.notifier.send_message(
-                    f"🍈 <b>[PASTEL MELON] BUY {signal['ticker']}</b>\n\n"
+                self.notifier.queue_message(
+                    f"🍈 <b>[PASTEL MELON] BUY {pending_signal['ticker']}</b>\n\n"
                     f"<b>Price:</b> ${fill_price:.8f}\n"
                     f"<b>Size:</b> {tokens_received:,.2f} tokens (${usdc_to_spend:,.0f})\n"
-                    f"<b>FDV at call:</b> ${signal['entry_fdv']:,.0f}\n"
+                    f"<b>FDV at call:</b> ${pending_signal['entry_fdv']:,.0f}\n"
                     f"<b>Targets:</b> 2x, 5x, 10x\n"
                     f"<b>TX:</b> {tx_sig[:16]}..."
                 )
 
-                self.logger.info(f"[Pastel Melon] BUY {signal['ticker']}: {tokens_received:,.2f} @ ${fill_price:.8f}")
+                self.logger.info(f"[Pastel Melon] BUY {pending_signal['ticker']}: {tokens_received:,.2f} @ ${fill_price:.8f}")
 
             except Exception as e:
-                self.logger.error(f"[Pastel Melon] Failed to buy {signal['ticker']}: {e}")
-                self.notifier.send_error_alert(f"[Pastel Melon] BUY {signal['ticker']} failed: {str(e)}", None)
+                self.logger.error(f"[Pastel Melon] Failed to buy {pending_signal['ticker']}: {e}")
+                self.notifier.queue_error_alert(f"[Pastel Melon] BUY {pending_signal['ticker']} failed: {str(e)}", None)
                 strategy.clear_signal(address)
 
         # Check exit targets for active positions
@@ -483,7 +811,7 @@ class TradingBot:
 
                 # Check if token is dead
                 if strategy.check_dead_token(address, token_info['fdv'], token_info['liquidity']):
-                    self.notifier.send_message(
+                    self.notifier.queue_message(
                         f"💀 <b>[MELON] TOKEN DEAD: {position['ticker']}</b>\n\n"
                         f"<b>Entry:</b> ${position['entry_price']:.8f}\n"
                         f"<b>Spent:</b> ${position['usdc_spent']:,.0f}\n"
@@ -520,7 +848,7 @@ class TradingBot:
                         profit_pct = (profit_usd / entry_value) * 100 if entry_value > 0 else 0
 
                         emoji = "🟢" if profit_pct >= 0 else "🔴"
-                        self.notifier.send_message(
+                        self.notifier.queue_message(
                             f"{emoji} <b>[MELON] {target}x EXIT {position['ticker']}</b>\n\n"
                             f"<b>Entry:</b> ${position['entry_price']:.8f}\n"
                             f"<b>Exit:</b> ${sell_price:.8f}\n"
@@ -533,61 +861,134 @@ class TradingBot:
 
                     except Exception as e:
                         self.logger.error(f"[Pastel Melon] Failed to sell tranche {target}x for {position['ticker']}: {e}")
-                        self.notifier.send_error_alert(
+                        self.notifier.queue_error_alert(
                             f"[Pastel Melon] SELL {position['ticker']} {target}x failed: {str(e)}", None
                         )
 
             except Exception as e:
                 self.logger.error(f"[Pastel Melon] Error checking position {address}: {e}")
 
-    def _handle_strategy_entry(self, strategy_name: str, strategy, current_price: float, current_time: datetime):
+    def _evaluate_entry(self, strategy_name: str, strategy, current_price: float,
+                        current_time: datetime, state_view) -> Decision:
         """
-        Handle entry logic for a specific strategy
+        Decide whether a flat strategy should enter
+
+        Runs the strategy's entry check and the risk manager, but places no
+        orders - see _execute_entry().
 
         Args:
             strategy_name: Name of the strategy
             strategy: Strategy instance
             current_price: Current BTC price
             current_time: Current timestamp
-        """
-        # Check if already in position for this strategy
-        if self.state_manager.is_in_position(strategy_name):
-            return
+            state_view: StateSnapshot for this iteration
 
+        Returns:
+            Decision with action 'enter' (size_usd set) or 'none'
+        """
         # Get allocated capital for this strategy
-        allocated_capital = self.state_manager.get_strategy_capital(strategy_name)
+        allocated_capital = state_view.get_strategy_capital(strategy_name)
         if allocated_capital <= 0:
-            return
+            return Decision(strategy_name, 'none', current_price, "No capital allocated")
 
         # Check if should enter
-        should_enter, reason = strategy.should_enter(current_time, current_price)
+        should_enter, reason_code, reason = strategy.should_enter(current_time, current_price)
 
-        self.logger.info(f"[{strategy_name}] Entry check: {should_enter} - {reason}")
+        self.logger.info("[%s] Entry check: %s - %s", strategy_name, should_enter, reason)
 
-        # Record entry check
-        if not reason.startswith("Not entry hour") and not reason.startswith("Cooldown"):
+        # Record entry check (skip the routine wrong-hour / cooldown rejections)
+        if reason_code not in _UNRECORDED_ENTRY_REASONS:
             self.state_manager.record_entry_check(strategy_name, current_time, should_enter, reason)
 
         if not should_enter:
-            return
+            return Decision(strategy_name, 'none', current_price, reason)
 
         # Check risk conditions
         is_safe, risk_reason = self.risk_manager.should_allow_entry(
             current_balance=allocated_capital,
             initial_balance=allocated_capital,
-            consecutive_losses=self.state_manager.get_risk_metrics(strategy_name).get('consecutive_losses', 0),
+            consecutive_losses=state_view.get_risk_metrics(strategy_name).get('consecutive_losses', 0),
             last_data_update=current_time
         )
 
         if not is_safe:
-            self.logger.warning(f"[{strategy_name}] Entry blocked by risk manager: {risk_reason}")
-            return
+            self.logger.warning("[%s] Entry blocked by risk manager: %s", strategy_name, risk_reason)
+            return Decision(strategy_name, 'none', current_price, risk_reason)
 
         # Use the allocated capital for position size
         position_size_usd = allocated_capital * 0.999  # Leave 0.1% for fees
+        return Decision(strategy_name, 'enter', current_price, reason, size_usd=position_size_usd)
+
+    def _evaluate_exit(self, strategy_name: str, strategy, position: Dict, current_price: float,
+                       tick_high: Optional[float] = None, quiet: bool = False) -> Decision:
+        """
+        Decide whether a strategy in position should exit
+
+        Updates the trailing peak and runs the strategy's exit check, but
+        places no orders - see _execute_exit().
+
+        Args:
+            strategy_name: Name of the strategy
+            strategy: Strategy instance
+            position: Position details from the iteration's StateSnapshot
+            current_price: Current BTC price
+            tick_high: Highest streamed price since the last check (None if not streaming)
+            quiet: Only log the exit check when it triggers (for tick-driven checks)
+
+        Returns:
+            Decision with action 'exit' (size_btc and position set) or 'none'
+        """
+        entry_price = position['entry_price']
+        peak_price = position['peak_price']
+
+        # Update peak price - with any higher price the stream saw since the last check
+        if tick_high is not None and tick_high > current_price:
+            new_peak = self.state_manager.update_peak_price(strategy_name, tick_high)
+        else:
+            new_peak = self.state_manager.update_peak_price(strategy_name, current_price)
+        if new_peak and new_peak > peak_price:
+            self.logger.info("[%s] New peak: $%.2f", strategy_name, new_peak)
+            peak_price = new_peak
+
+        # Check if should exit
+        should_exit, reason = strategy.should_exit(current_price, entry_price, peak_price)
+
+        if should_exit or not quiet:
+            self.logger.info("[%s] Exit check: %s - %s", strategy_name, should_exit, reason)
+
+        if not should_exit:
+            return Decision(strategy_name, 'none', current_price, reason)
+
+        return Decision(strategy_name, 'exit', current_price, reason,
+                        size_btc=position['size_btc'], position=position)
+
+    def _evaluate_strategy(self, strategy_name: str, strategy, current_price: float,
+                           current_time: datetime, state_view,
+                           tick_high: Optional[float] = None) -> Decision:
+        """
+        Evaluate exit (if in position) or entry (if flat) for one strategy
+
+        The position is looked up once here and handed to _evaluate_exit(),
+        rather than checked and then fetched again.
+        """
+        position = state_view.get_position_details(strategy_name)
+        if position:
+            return self._evaluate_exit(strategy_name, strategy, position, current_price, tick_high)
+        return self._evaluate_entry(strategy_name, strategy, current_price, current_time, state_view)
+
+    def _execute_entry(self, decision: Decision, current_time: datetime):
+        """
+        Place the BUY order for an 'enter' decision and record the position
+
+        Args:
+            decision: Decision from _evaluate_entry()
+            current_time: Current timestamp
+        """
+        strategy_name = decision.strategy
+        position_size_usd = decision.size_usd
 
         # Place order
-        self.logger.info(f"[{strategy_name}] Placing BUY order for ${position_size_usd:,.0f}")
+        self.logger.info("[%s] Placing BUY order for $%.0f", strategy_name, position_size_usd)
 
         try:
             order_id, fill_price, fill_size = self.exchange.place_market_order(
@@ -603,63 +1004,48 @@ class TradingBot:
                 size_usd=position_size_usd
             )
 
+            # Ticks streamed before the fill must not raise the new position's
+            # peak on its first exit check - start the tick high afresh
+            self.exchange.take_btc_tick_high()
+
             # Send notification
-            self.notifier.send_message(
-                f"📈 <b>[{strategy_name.upper()}] ENTRY</b>\n\n"
-                f"<b>Price:</b> ${fill_price:,.2f}\n"
-                f"<b>Size:</b> {fill_size:.4f} BTC (${position_size_usd:,.0f})\n"
-                f"<b>Time:</b> {current_time.strftime('%H:%M UTC')}\n"
-                f"<b>Reason:</b> {reason[:100]}"
-            )
+            self.notifier.queue_message(_ENTRY_TMPL.format_map({
+                'name': STRATEGY_LABELS[strategy_name],
+                'price': fill_price,
+                'size': fill_size,
+                'usd': position_size_usd,
+                'time': current_time.strftime('%H:%M UTC'),
+                'reason': decision.reason[:100]
+            }))
 
-            self.logger.info(f"[{strategy_name}] ENTRY: {fill_size:.4f} BTC @ ${fill_price:,.2f}")
+            self.logger.info("[%s] ENTRY: %.4f BTC @ $%.2f", strategy_name, fill_size, fill_price)
 
         except Exception as e:
-            self.logger.error(f"[{strategy_name}] Failed to place entry order: {e}")
-            self.notifier.send_error_alert(
+            self.logger.error("[%s] Failed to place entry order: %s", strategy_name, e)
+            self.notifier.queue_error_alert(
                 f"[{strategy_name}] Entry order failed: {str(e)}",
                 None
             )
 
-    def _handle_strategy_exit(self, strategy_name: str, strategy, current_price: float, current_time: datetime):
+    def _execute_exit(self, decision: Decision, current_time: datetime):
         """
-        Handle exit logic for a specific strategy
+        Place the SELL order for an 'exit' decision and close the position
 
         Args:
-            strategy_name: Name of the strategy
-            strategy: Strategy instance
-            current_price: Current BTC price
+            decision: Decision from _evaluate_exit()
             current_time: Current timestamp
         """
-        # Get position details for this strategy
-        position = self.state_manager.get_position_details(strategy_name)
-        if not position:
-            return
-
+        strategy_name = decision.strategy
+        position = decision.position
         entry_price = position['entry_price']
-        peak_price = position['peak_price']
-        size_btc = position['size_btc']
-
-        # Update peak price
-        new_peak = self.state_manager.update_peak_price(strategy_name, current_price)
-        if new_peak and new_peak > peak_price:
-            self.logger.info(f"[{strategy_name}] New peak: ${new_peak:,.2f}")
-            peak_price = new_peak
-
-        # Check if should exit
-        should_exit, reason = strategy.should_exit(current_price, entry_price, peak_price)
-
-        self.logger.info(f"[{strategy_name}] Exit check: {should_exit} - {reason}")
-
-        if not should_exit:
-            return
+        size_btc = decision.size_btc
 
         # Place sell order
-        self.logger.info(f"[{strategy_name}] Placing SELL order for {size_btc:.4f} BTC")
+        self.logger.info("[%s] Placing SELL order for %.4f BTC", strategy_name, size_btc)
 
         try:
             order_id, fill_price, fill_size = self.exchange.place_market_order(
-                'SELL', size_btc * current_price
+                'SELL', size_btc * decision.price
             )
 
             # Calculate profit
@@ -676,26 +1062,27 @@ class TradingBot:
 
             # Send notification
             emoji = "🟢" if profit_pct >= 0 else "🔴"
-            self.notifier.send_message(
-                f"{emoji} <b>[{strategy_name.upper()}] EXIT</b>\n\n"
-                f"<b>Entry:</b> ${entry_price:,.2f}\n"
-                f"<b>Exit:</b> ${fill_price:,.2f}\n"
-                f"<b>P&L:</b> {profit_pct:+.2f}% (${profit_usd:+,.2f})\n"
-                f"<b>Reason:</b> {reason[:100]}"
-            )
-
-            self.logger.info(f"[{strategy_name}] EXIT: {fill_size:.4f} BTC @ ${fill_price:,.2f} ({profit_pct:+.2f}%)")
+            self.notifier.queue_message(_EXIT_TMPL.format_map({
+                'emoji': emoji,
+                'name': STRATEGY_LABELS[strategy_name],
+                'entry': entry_price,
+                'exit': fill_price,
+                'pct': profit_pct,
+                'usd': profit_usd,
+                'reason': decision.reason[:100]
+            }))
+
+            self.logger.info("[%s] EXIT: %.4f BTC @ $%.2f (%+.2f%%)", strategy_name, fill_size, fill_price, profit_pct)
 
         except Exception as e:
-            self.logger.error(f"[{strategy_name}] Failed to place exit order: {e}")
-            self.notifier.send_error_alert(
+            self.logger.error("[%s] Failed to place exit order: %s", strategy_name, e)
+            self.notifier.queue_error_alert(
                 f"[{strategy_name}] Exit order failed: {str(e)}",
                 position
             )
 
-    def _send_heartbeat(self, current_price: float):
+    def _send_heartbeat(self, current_price: float, now: datetime):
         """Send daily heartbeat (once per day)"""
-        now = datetime.now(pytz.UTC)
 
         if self.last_heartbeat:
             time_since = (now - self.last_heartbeat).total_seconds()
@@ -714,9 +1101,9 @@ class TradingBot:
         self.notifier.send_heartbeat(state)
         self.last_heartbeat = now
 
-    def _check_daily_reset(self):
+    def _check_daily_reset(self, current_time: datetime):
         """Check if we need to reset daily statistics"""
-        now_est = datetime.now(pytz.timezone('America/New_York'))
+        now_est = current_time.astimezone(NY_TZ)
         current_date = now_est.date()
 
         if self.last_daily_reset is None:
@@ -734,82 +1121,161 @@ class TradingBot:
             self.state_manager.reset_daily_stats()
 
             # Reset daily state for all strategies
-            for strategy in self.strategies.values():
-                if hasattr(strategy, 'reset_daily_state'):
-                    strategy.reset_daily_state()
+            for reset_daily_state in self._daily_resets:
+                reset_daily_state()
 
             self.last_daily_reset = current_date
 
-    def run_loop_iteration(self):
+    async def _execute_decisions(self, decisions, current_time: datetime):
+        """Place the orders for every 'enter'/'exit' decision concurrently"""
+        executors = self._executors
+        await asyncio.gather(*(
+            asyncio.to_thread(executors[decision.action], decision, current_time)
+            for decision in decisions if decision.action != 'none'
+        ))
+
+    async def _check_exits_on_tick(self):
+        """
+        Run the exit check for every generic strategy in a position
+
+        Called by _exit_watch_loop() between main-loop iterations, so a
+        trailing stop is acted on within seconds instead of at the next
+        5-minute check. Entries still only happen in run_loop_iteration().
+        """
+        async with self._strategy_lock:
+            state_view = self.state_manager.snapshot()
+            in_position = [(name, strategy, position) for name, strategy in self._dispatch
+                           if (position := state_view.get_position_details(name))]
+            if not in_position:
+                return
+
+            current_time = datetime.now(UTC)
+            current_price = await asyncio.to_thread(self.exchange.get_btc_price)
+            tick_high = self.exchange.take_btc_tick_high()
+
+            decisions = await asyncio.gather(*(
+                asyncio.to_thread(self._evaluate_exit, strategy_name, strategy, position,
+                                  current_price, tick_high, True)
+                for strategy_name, strategy, position in in_position
+            ))
+            await self._execute_decisions(decisions, current_time)
+
+    async def _exit_watch_loop(self):
+        """
+        Background task: re-check exits whenever the price stream ticks
+
+        Wakes on _price_event (set from the websocket thread), checks at most
+        once per exit_check_interval_seconds, and skips while paused.
+        """
+        interval = self.config['bot'].get('exit_check_interval_seconds', 5)
+        while self.is_running:
+            await self._price_event.wait()
+            self._price_event.clear()
+
+            if not self.is_paused:
+                try:
+                    await self._check_exits_on_tick()
+                except Exception as e:
+                    # The main loop reports and pauses on persistent errors
+                    self.logger.warning("Tick exit check failed: %s", e)
+
+            await asyncio.sleep(interval)
+
+    def _on_price_tick(self, loop: asyncio.AbstractEventLoop):
+        """Price stream callback (websocket thread) - wake the exit watcher"""
+        try:
+            loop.call_soon_threadsafe(self._price_event.set)
+        except RuntimeError:
+            pass  # Event loop already closed (shutting down)
+
+    async def run_loop_iteration(self):
         """
         Run one iteration of the main loop
 
-        For each enabled strategy:
-        - If in position: check exit
-        - If not in position: check entry
+        Two passes over the enabled strategies:
+        1. Evaluate - one Decision per strategy (exit check if in position,
+           entry check if flat), all strategies concurrently
+        2. Execute - place the orders for every 'enter'/'exit' decision,
+           also concurrently
         """
+        # Hoist hot attributes into locals (LOAD_FAST instead of LOAD_ATTR per strategy)
+        log = self.logger
+        sm = self.state_manager
+        strategies = self.strategies
+
         self.loop_count += 1
-        current_time = datetime.now(pytz.UTC)
+        current_time = datetime.now(UTC)
 
-        self.logger.info(f"=== Loop {self.loop_count} - {current_time.strftime('%Y-%m-%d %H:%M:%S UTC')} ===")
+        log.info("=== Loop %d - %s ===", self.loop_count, current_time.strftime('%Y-%m-%d %H:%M:%S UTC'))
 
         try:
-            if self._check_stop_file():
-                self.is_running = False
-                return
-
             if self.is_paused:
-                self.logger.warning("Bot is PAUSED - use /enable to resume")
+                log.warning("Bot is PAUSED - use /enable to resume")
                 return
 
-            self._check_daily_reset()
-
-            # Get current price
-            current_price = self.exchange.get_btc_price()
-            self.logger.info(f"BTC Price: ${current_price:,.2f}")
+            # Daily reset (may fetch the balance) and the price fetch are independent -
+            # run them together so a reset day costs one round trip, not two
+            _, current_price = await asyncio.gather(
+                asyncio.to_thread(self._check_daily_reset, current_time),
+                asyncio.to_thread(self.exchange.get_btc_price)
+            )
+            log.info("BTC Price: $%.2f", current_price)
 
             # Get enabled strategies
-            enabled_strategies = self.state_manager.get_enabled_strategies()
+            enabled_strategies = sm.get_enabled_strategies()
 
             if not enabled_strategies:
-                self.logger.info("No strategies enabled")
+                log.info("No strategies enabled")
             else:
-                self.logger.info(f"Enabled strategies: {', '.join(enabled_strategies)}")
+                log.info("Enabled strategies: %s", ', '.join(enabled_strategies))
 
-            # Handle BH strategy specially (if enabled) - it has its own signal loop
-            if 'bh' in enabled_strategies and 'bh' in self.strategies:
-                self._handle_bh_strategy(current_time)
+            # Handle BH strategy specially (if enabled) - it has its own signal loop.
+            # Both special handlers trade too, so they hold the lock like the generic ones
+            if 'bh' in enabled_strategies and 'bh' in strategies:
+                async with self._strategy_lock:
+                    await asyncio.to_thread(self._handle_bh_strategy, current_time)
 
             # Handle Pastel Melon strategy specially (if enabled) - it trades on Solana DEX
-            if 'pastel_melon' in enabled_strategies and 'pastel_melon' in self.strategies:
-                self._handle_melon_strategy(current_time)
-
-            # Process each enabled strategy (except BH and Pastel Melon which are handled above)
-            for strategy_name in enabled_strategies:
-                if strategy_name in ('bh', 'pastel_melon'):
-                    continue  # Handled above
-
-                if strategy_name not in self.strategies:
-                    self.logger.warning(f"Strategy {strategy_name} enabled but not loaded")
-                    continue
-
-                strategy = self.strategies[strategy_name]
-
-                # Check if in position for this strategy
-                if self.state_manager.is_in_position(strategy_name):
-                    self._handle_strategy_exit(strategy_name, strategy, current_price, current_time)
-                else:
-                    self._handle_strategy_entry(strategy_name, strategy, current_price, current_time)
+            if 'pastel_melon' in enabled_strategies and 'pastel_melon' in strategies:
+                async with self._strategy_lock:
+                    await asyncio.to_thread(self._handle_melon_strategy, current_time)
+
+            # Evaluate every generic strategy (BH and Pastel Melon are handled above).
+            # The checks block (Binance OI fetch etc.), so each runs on a worker thread.
+            # Holding the lock keeps the tick-driven exit watcher off the same positions
+            async with self._strategy_lock:
+                state_view = sm.snapshot()
+                tick_high = self.exchange.take_btc_tick_high()
+                decisions = await asyncio.gather(*(
+                    asyncio.to_thread(self._evaluate_strategy, strategy_name, strategy,
+                                      current_price, current_time, state_view, tick_high)
+                    for strategy_name, strategy in self._dispatch
+                ))
+
+                # Place the resulting orders concurrently
+                await self._execute_decisions(decisions, current_time)
 
             # Heartbeat disabled - only send alerts on entries/exits/errors
-            # self._send_heartbeat(current_price)
+            # self._send_heartbeat(current_price, current_time)
+
+            self._consecutive_errors = 0
 
         except Exception as e:
-            self.logger.error(f"ERROR in loop iteration: {e}", exc_info=True)
-            self.notifier.send_error_alert(
-                f"Loop error: {str(e)}",
-                None
-            )
+            max_errors = self.config['bot'].get('max_consecutive_errors', 5)
+
+            if self._is_transient_error(e):
+                self._consecutive_errors += 1
+                if self._consecutive_errors < max_errors:
+                    # Network blip - log and retry next iteration instead of pausing
+                    log.warning("Transient error in loop iteration (%d/%d): %s",
+                                self._consecutive_errors, max_errors, e)
+                    return
+                error_msg = f"Loop error ({self._consecutive_errors} failures in a row): {str(e)}"
+            else:
+                error_msg = f"Loop error: {str(e)}"
+
+            log.error("ERROR in loop iteration: %s", e, exc_info=True)
+            self.notifier.queue_error_alert(error_msg, None)
             self.is_paused = True
 
     # ===== TELEGRAM COMMAND METHODS =====
@@ -817,6 +1283,7 @@ class TradingBot:
     def enable_trading(self):
         """Enable trading (unpause bot)"""
         self.is_paused = False
+        self._consecutive_errors = 0
         self.logger.info("Trading ENABLED via Telegram command")
 
     def disable_trading(self):
@@ -824,6 +1291,28 @@ class TradingBot:
         self.is_paused = True
         self.logger.info("Trading DISABLED via Telegram command")
 
+    def _get_balance_for_command(self):
+        """
+        Fetch account balance for a Telegram command with a short timeout.
+
+        Reuses a balance fetched in the last minute (see
+        HyperLiquidClient.get_cached_account_balance). If the request fails
+        (timeout, connection error, HTTP error such as a 429/5xx, or an
+        unreadable body), falls back to the last balance seen by a previous
+        command (None if there isn't one yet).
+
+        Returns:
+            Account balance in USD, or None if unknown
+        """
+        try:
+            balance = self.exchange.get_cached_account_balance(timeout=BALANCE_CHECK_TIMEOUT)
+        except requests.RequestException as e:
+            self.logger.warning("Balance check failed, using last known balance: %s", e)
+            return self.last_known_balance
+
+        self.last_known_balance = balance
+        return balance
+
     def enable_strategy(self, strategy_name: str, capital_usd: float) -> str:
         """
         Enable a strategy with allocated capital
@@ -836,15 +1325,12 @@ class TradingBot:
             Status message
         """
         if strategy_name not in STRATEGY_CLASSES:
-            available = ', '.join(STRATEGY_CLASSES.keys())
+            available = ', '.join(STRATEGY_NAMES)
             return f"Unknown strategy: {strategy_name}\n\nAvailable: {available}"
 
         # Check total allocation doesn't exceed balance
         current_total = self.state_manager.get_total_allocated_capital()
-        try:
-            account_balance = self.exchange.get_account_balance()
-        except:
-            account_balance = None
+        account_balance = self._get_balance_for_command()
 
         if account_balance and (current_total + capital_usd) > account_balance:
             return (f"Cannot allocate ${capital_usd:,.0f}\n\n"
@@ -854,15 +1340,17 @@ class TradingBot:
 
         # Enable the strategy
         self.state_manager.enable_strategy(strategy_name, capital_usd)
+        self._rebuild_dispatch()
 
         # Update config
-        if 'strategies' not in self.config:
-            self.config['strategies'] = {}
-        if strategy_name not in self.config['strategies']:
-            self.config['strategies'][strategy_name] = {}
-        self.config['strategies'][strategy_name]['enabled'] = True
-        self.config['strategies'][strategy_name]['allocated_capital_usd'] = capital_usd
-        self.save_config()
+        with self._config_lock:
+            if 'strategies' not in self.config:
+                self.config['strategies'] = {}
+            if strategy_name not in self.config['strategies']:
+                self.config['strategies'][strategy_name] = {}
+            self.config['strategies'][strategy_name]['enabled'] = True
+            self.config['strategies'][strategy_name]['allocated_capital_usd'] = capital_usd
+        self._mark_config_dirty()
 
         self.logger.info(f"Strategy '{strategy_name}' enabled with ${capital_usd:,.0f}")
 
@@ -885,7 +1373,7 @@ class TradingBot:
             Status message
         """
         if strategy_name not in STRATEGY_CLASSES:
-            available = ', '.join(STRATEGY_CLASSES.keys())
+            available = ', '.join(STRATEGY_NAMES)
             return f"Unknown strategy: {strategy_name}\n\nAvailable: {available}"
 
         # Get current allocation for this strategy
@@ -896,10 +1384,7 @@ class TradingBot:
         current_total = self.state_manager.get_total_allocated_capital()
         other_strategies_total = current_total - current_allocation
 
-        try:
-            account_balance = self.exchange.get_account_balance()
-        except:
-            account_balance = None
+        account_balance = self._get_balance_for_command()
 
         if account_balance and (other_strategies_total + new_capital) > account_balance:
             available = account_balance - other_strategies_total
@@ -911,11 +1396,13 @@ class TradingBot:
         # Update the allocation
         old_capital = current_allocation
         self.state_manager.enable_strategy(strategy_name, new_capital)
+        self._rebuild_dispatch()
 
         # Update config
-        if 'strategies' in self.config and strategy_name in self.config['strategies']:
-            self.config['strategies'][strategy_name]['allocated_capital_usd'] = new_capital
-        self.save_config()
+        with self._config_lock:
+            if 'strategies' in self.config and strategy_name in self.config['strategies']:
+                self.config['strategies'][strategy_name]['allocated_capital_usd'] = new_capital
+        self._mark_config_dirty()
 
         self.logger.info(f"Strategy '{strategy_name}' reallocated: ${old_capital:,.0f} → ${new_capital:,.0f}")
 
@@ -941,11 +1428,13 @@ class TradingBot:
                     f"Close position first with /close {strategy_name}")
 
         self.state_manager.disable_strategy(strategy_name)
+        self._rebuild_dispatch()
 
         # Update config
-        if 'strategies' in self.config and strategy_name in self.config['strategies']:
-            self.config['strategies'][strategy_name]['enabled'] = False
-        self.save_config()
+        with self._config_lock:
+            if 'strategies' in self.config and strategy_name in self.config['strategies']:
+                self.config['strategies'][strategy_name]['enabled'] = False
+        self._mark_config_dirty()
 
         self.logger.info(f"Strategy '{strategy_name}' disabled")
 
@@ -975,54 +1464,79 @@ class TradingBot:
             if not positions:
                 return "No positions to close"
 
-            results = []
-            for pos in positions:
-                result = self._close_position(pos['strategy'], pos)
-                results.append(result)
+            # One price fetch shared by every close
+            try:
+                current_price = self.exchange.get_btc_price()
+            except Exception as e:
+                self.logger.error("Emergency close-all failed to fetch price: %s", e)
+                return f"Close failed - could not fetch BTC price: {str(e)}"
+
+            # Close concurrently - N positions take ~one order's latency instead of N
+            # (_close_position never raises, it returns a failure message instead)
+            with ThreadPoolExecutor(max_workers=len(positions)) as pool:
+                results = list(pool.map(
+                    lambda pos: self._close_position(pos['strategy'], pos, current_price),
+                    positions
+                ))
 
             return "\n\n".join(results)
 
-    def _close_position(self, strategy_name: str, position: dict) -> str:
-        """Close a specific position"""
+    def _close_position(self, strategy_name: str, position: dict,
+                        current_price: Optional[float] = None) -> str:
+        """
+        Close a specific position
+
+        Args:
+            strategy_name: Strategy whose position to close
+            position: Position details from the state manager
+            current_price: BTC price to size the order with (fetched if None)
+        """
         try:
             size_btc = position['size_btc']
             entry_price = position['entry_price']
 
-            current_price = self.exchange.get_btc_price()
-
-            profit_pct = ((current_price - entry_price) / entry_price) * 100
-            profit_usd = (current_price - entry_price) * size_btc
+            if current_price is None:
+                current_price = self.exchange.get_btc_price()
 
-            self.logger.info(f"[{strategy_name}] Emergency close: Selling {size_btc:.4f} BTC")
+            self.logger.info("[%s] Emergency close: Selling %.4f BTC", strategy_name, size_btc)
             order_id, fill_price, fill_size = self.exchange.place_market_order(
                 'SELL',
                 size_btc * current_price
             )
 
+            # P&L from the actual fill, not the pre-order price
+            profit_pct = ((fill_price - entry_price) / entry_price) * 100
+            profit_usd = (fill_price - entry_price) * size_btc
+
             self.state_manager.exit_position(
                 strategy_name=strategy_name,
-                exit_time=datetime.now(pytz.UTC),
+                exit_time=datetime.now(UTC),
                 exit_price=fill_price,
                 profit_pct=profit_pct
             )
 
-            self.logger.info(f"[{strategy_name}] Emergency close completed")
+            self.logger.info("[%s] Emergency close completed", strategy_name)
 
             emoji = "🟢" if profit_pct >= 0 else "🔴"
-            return (f"{emoji} <b>[{strategy_name.upper()}] CLOSED</b>\n\n"
-                    f"<b>Entry:</b> ${entry_price:,.2f}\n"
-                    f"<b>Exit:</b> ${fill_price:,.2f}\n"
-                    f"<b>P&L:</b> {profit_pct:+.2f}% (${profit_usd:+,.2f})")
+            return _CLOSE_TMPL.format_map({
+                'emoji': emoji,
+                'name': STRATEGY_LABELS.get(strategy_name) or strategy_name.upper(),
+                'entry': entry_price,
+                'exit': fill_price,
+                'pct': profit_pct,
+                'usd': profit_usd
+            })
 
         except Exception as e:
-            self.logger.error(f"[{strategy_name}] Emergency close failed: {e}")
+            self.logger.error("[%s] Emergency close failed: %s", strategy_name, e)
             return f"Close failed for {strategy_name}: {str(e)}"
 
     def get_strategies_summary(self) -> list:
         """Get summary of all strategies for display"""
+        states = self.state_manager.get_all_strategy_states()
         summaries = []
-        for name in STRATEGY_CLASSES.keys():
-            state = self.state_manager.get_strategy_state(name)
+        for name in STRATEGY_NAMES:
+            state = states.get(name, {})
             summaries.append({
                 'name': name,
                 'description': STRATEGY_DESCRIPTIONS.get(name, ''),
@@ -1040,34 +1554,27 @@ class TradingBot:
             return "Cannot switch account - close all positions first"
 
         try:
-            account_key_var = f"{account_name.upper()}_API_KEY"
-            account_secret_var = f"{account_name.upper()}_API_SECRET"
-
-            new_api_key = os.getenv(account_key_var)
-            new_api_secret = os.getenv(account_secret_var)
-
-            if not new_api_key or not new_api_secret:
+            account_key = account_name.upper()
+            account = self._credentials.accounts.get(account_key)
+            if account is None:
                 return f"Account '{account_name}' not found in .env"
 
-            self.exchange = HyperLiquidClient(
-                api_key=new_api_key,
-                api_secret=new_api_secret,
-                testnet=self.config['exchange']['testnet'],
-                retry_attempts=self.config['exchange']['retry_attempts'],
-                timeout=self.config['exchange']['request_timeout_seconds']
-            )
+            new_api_key, new_api_secret = account
+
+            # Rotate keys on the existing client - keeps its connection pool and price stream
+            self.exchange.set_credentials(new_api_key, new_api_secret)
 
             new_balance = self.exchange.get_account_balance()
-            self.logger.info(f"Switched to account: {account_name}")
+            self.logger.info("Switched to account: %s", account_name)
 
             return f"Account switched to {account_name}\nBalance: ${new_balance:,.2f}"
 
         except Exception as e:
-            self.logger.error(f"Account switch failed: {e}")
+            self.logger.error("Account switch failed: %s", e)
             return f"Switch failed: {str(e)}"
 
-    def run(self):
-        """Main bot loop - runs forever"""
+    async def run(self):
+        """Main bot loop - runs forever (start with asyncio.run(bot.run()))"""
         self.logger.info("=" * 70)
         self.logger.info("MULTI-STRATEGY TRADING BOT STARTED")
         self.logger.info("=" * 70)
@@ -1075,7 +1582,7 @@ class TradingBot:
         enabled = self.state_manager.get_enabled_strategies()
         strategies_info = f"{len(enabled)} strategies enabled" if enabled else "No strategies enabled"
 
-        self.notifier.send_message(
+        self.notifier.queue_message(
             "🤖 <b>Bot Started</b>\n\n"
             f"Environment: {'TESTNET' if self.config['exchange']['testnet'] else 'MAINNET'}\n"
             f"Strategies: {strategies_info}\n"
@@ -1083,28 +1590,96 @@ class TradingBot:
             "Use /strategy to configure strategies."
         )
 
+        # Graceful shutdown on signals (the STOP file is watched by _stop_file_watch_loop)
+        loop = asyncio.get_running_loop()
+        stop_signals = [signal.SIGTERM, signal.SIGINT]
+        if hasattr(signal, 'SIGUSR1'):  # Not available on Windows
+            stop_signals.append(signal.SIGUSR1)
+        for sig in stop_signals:
+            try:
+                loop.add_signal_handler(sig, self._request_stop, sig)
+            except NotImplementedError:
+                # Windows event loops don't support signal handlers - Ctrl+C still works
+                break
+
+        config_flush_task = asyncio.create_task(self._config_flush_loop())
+        stop_file_task = asyncio.create_task(self._stop_file_watch_loop())
+
+        # Telegram commands share the event loop; the strategy lock keeps a
+        # command (e.g. /close) from running while a strategy is being evaluated
+        command_task = asyncio.create_task(self.notifier.listen_for_commands(
+            self.command_handler,
+            poll_interval=self.config['bot'].get('command_poll_interval_seconds', 0.5),
+            lock=self._strategy_lock
+        ))
+        self.logger.info("Telegram command listener started")
+
+        # Tick-driven trailing-stop checks (needs the websocket price stream)
+        exit_watch_task = None
+        if self.config['exchange'].get('price_stream', True):
+            self.exchange.set_price_listener(lambda: self._on_price_tick(loop))
+            exit_watch_task = asyncio.create_task(self._exit_watch_loop())
+
         try:
+            # Fixed-rate schedule: each check starts loop_interval_seconds after the
+            # previous one STARTED, so iteration time doesn't accumulate as drift
+            next_tick = time.monotonic()
+
             while self.is_running:
-                self.run_loop_iteration()
+                interval = self.config['bot']['loop_interval_seconds']
+                next_tick += interval
+
+                await self.run_loop_iteration()
 
-                sleep_seconds = self.config['bot']['loop_interval_seconds']
-                self.logger.info(f"Sleeping {sleep_seconds}s until next check...\n")
-                time.sleep(sleep_seconds)
+                now = time.monotonic()
+                if now > next_tick:
+                    # Iteration overran the interval - skip missed ticks rather than bursting
+                    self.logger.warning("Loop iteration overran interval by %.1fs", now - next_tick)
+                    next_tick = now
 
-        except KeyboardInterrupt:
-            self.logger.info("\nShutdown requested by user (Ctrl+C)")
+                sleep_seconds = next_tick - now
+                self.logger.info("Sleeping %.0fs until next check...\n", sleep_seconds)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=sleep_seconds)
+                except asyncio.TimeoutError:
+                    pass
 
         finally:
+            # Wait for any in-flight tick exit or command to finish (its order
+            # may still fill) before stopping the tasks and closing the state
+            async with self._strategy_lock:
+                if exit_watch_task is not None:
+                    self.exchange.set_price_listener(None)
+                    exit_watch_task.cancel()
+
+                stop_file_task.cancel()
+                command_task.cancel()
+
+                # Write out any config change made since the last flush
+                config_flush_task.cancel()
+                if self._config_dirty:
+                    self.save_config()
+
+                # Fold the state changelog into a final snapshot
+                self.state_manager.close()
+
             self.logger.info("=" * 70)
             self.logger.info("TRADING BOT STOPPED")
             self.logger.info("=" * 70)
 
-            self.notifier.send_message(
+            self.notifier.queue_message(
                 "🛑 <b>Bot Stopped</b>\n\n"
                 f"Final state: {self.state_manager}\n\n"
                 "Bot is no longer monitoring."
             )
 
+            # Flush queued alerts (including the stop message) before exiting
+            await asyncio.to_thread(self.notifier.stop_background_sender)
+
+            # Flush queued log records
+            if self._log_listener:
+                self._log_listener.stop()
+
 
 # Entry point
 if __name__ == '__main__':
@@ -1129,5 +1704,10 @@ if __name__ == '__main__':
             print("Cancelled.")
             sys.exit(0)
 
+    # Use the libuv event loop when available, asyncio's default otherwise
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    print(f"Event loop: {'uvloop' if uvloop is not None else 'asyncio'}")
+
     bot = TradingBot()
-    bot.run()
+    asyncio.run(bot.run())
@@ -15,11 +15,103 @@ Key difference from backtest:
 - Live: Poll for new data, react in real-time
 """
 
+import logging
 import re
-from datetime import datetime, timedelta
+import time
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
-import pytz
 import clickhouse_connect
+from clickhouse_connect.driver import httputil
+
+UTC = timezone.utc
+
+logger = logging.getLogger('TradingBot')
+
+# New BH Insights messages from {since} (bound server-side by clickhouse-connect).
+# PREWHERE reads only the chat_name column first, so the wide raw column is
+# only read for granules that hold BH Insights rows.
+MESSAGES_QUERY = """
+    SELECT created_at, raw, user_name, message_id
+    FROM messages
+    PREWHERE chat_name = 'BH Insights'
+    WHERE created_at >= {since:DateTime}
+    ORDER BY created_at ASC
+    LIMIT 100
+"""
+
+# Joins messages for one batched pattern scan (see _parse_messages)
+MESSAGE_SEPARATOR = '\n\x00\n'
+
+# Parsed messages remembered for reposts (see _parse_messages)
+PARSE_CACHE_SIZE = 1024
+
+# Recent message_ids remembered so the inclusive since-bound doesn't re-fetch them
+SEEN_MESSAGE_IDS = 2048
+
+# Signal patterns (same as bh_insights_v2.py backtest). {ap} is replaced with
+# the tracked-asset alternation, e.g. (btc|eth), once at startup.
+
+# ========== LONG ENTRY PATTERNS ==========
+LONG_TEMPLATES = (
+    r'longed\s+{ap}',
+    r're-?longed\s+{ap}',
+    r'giga\s+longed\s+.*?{ap}',
+    r'long\s+{ap}\s+(?:with|at|@|from)',
+    r'entered\s+(?:a\s+)?long\s+(?:on\s+|in\s+)?{ap}',
+    r'left\s+curve[d]?\s+(?:some\s+)?{ap}',
+    r'bought\s+(?:some\s+|a\s+decent\s+amount\s+(?:of\s+)?)?{ap}',
+    r'started\s+(?:a\s+)?twap\s+(?:on\s+)?{ap}',
+    r'twap\s+(?:on\s+)?{ap}',
+    r'twaping\s+{ap}',
+    r'back\s+in\s+{ap}',
+    r'positioned\s+long\s+(?:on\s+|with\s+)?{ap}',
+    r'nibble\s+(?:some\s+)?(?:ltf\s+)?longs?\s+(?:on\s+)?{ap}',
+    r'added\s+(?:to\s+)?(?:my\s+)?{ap}',
+    r'long\s+on\s+{ap}',
+    r'longed\s+some\s+{ap}',
+)
+
+# ========== SHORT ENTRY PATTERNS ==========
+SHORT_TEMPLATES = (
+    r'shorted\s+{ap}',
+    r'shorting\s+{ap}',
+    r'short\s+{ap}\s+(?:with|at|@|from)',
+    r'entered\s+(?:a\s+)?short\s+(?:on\s+|in\s+)?{ap}',
+    r'short\s+trigger\s+(?:on\s+)?{ap}',
+)
+
+# ========== EXIT PATTERNS ==========
+EXIT_TEMPLATES = (
+    r"tp'?d\s+.*?{ap}",
+    r'took\s+(?:some\s+)?profit[s]?\s+(?:on\s+|from\s+)?{ap}',
+    r'sold\s+(?:a\s+significant\s+amount\s+of\s+)?{ap}',
+    r'sold\s+(?:some\s+)?(?:more\s+)?(?:of\s+)?(?:my\s+)?{ap}',
+    r'closed\s+.*?longs?\s+(?:on\s+)?.*?{ap}',
+    r'closed\s+(?:my\s+)?{ap}',
+    r'exited\s+{ap}',
+    r'covered\s+(?:my\s+)?(?:\w+\s+)?shorts?\s+(?:on\s+)?{ap}',
+    r'(?:mostly\s+)?out\s+of\s+{ap}',
+    r'scaled\s+out\s+.*?{ap}',
+)
+
+# False positive patterns to filter out (LONG signals only)
+FALSE_POSITIVE_TEMPLATES = (
+    r'positioned\s+in\s+{ap}\s+and',
+    r'did\s+with\s+{ap}',
+    r'like\s+{ap}\s+did',
+)
+
+
+@dataclass(slots=True)
+class Signal:
+    """A trading signal parsed from one BH Insights message"""
+    timestamp: datetime
+    asset: str        # e.g. 'BTC'
+    action: str       # 'LONG', 'SHORT' or 'EXIT'
+    raw_text: str     # first 200 chars of the message
 
 
 class BHInsightsStrategy:
@@ -70,12 +162,30 @@ class BHInsightsStrategy:
 
         # Trading settings
         self.tracked_assets = config.get('tracked_assets', ['BTC', 'ETH'])
+        self._tracked_set = frozenset(self.tracked_assets)   # O(1) membership in _parse_messages
         self.poll_interval = config.get('poll_interval_seconds', 30)
 
+        # Signal regexes (tracked assets are fixed, so compile once)
+        self._build_patterns()
+
+        # Message text -> [(asset, action), ...], oldest evicted first
+        self._parse_cache: Dict[str, List[Tuple[str, str]]] = {}
+
         # State tracking
         self.last_message_timestamp = None
-        self.pending_signals: Dict[str, dict] = {}  # asset -> signal info
+        self._seen_ids = deque(maxlen=SEEN_MESSAGE_IDS)   # eviction order for _seen_set
+        self._seen_set = set()
+        self.pending_signals: Dict[str, Signal] = {}  # asset -> signal info
         self.client = None
+        self._fetch_ctx = None
+
+        # Keep-alive HTTPS pool, kept across client rebuilds so a reconnect
+        # reuses open connections instead of a fresh TLS handshake
+        self._pool_mgr = httputil.get_pool_manager(maxsize=4, num_pools=1, block=False)
+
+        # Reconnect backoff (doubles from 1s up to 30s while Clickhouse is down)
+        self._connect_retry_delay = 1
+        self._next_connect_time = 0   # monotonic time of next allowed connect attempt
 
         # Initialize Clickhouse client
         self._init_clickhouse()
@@ -89,12 +199,48 @@ class BHInsightsStrategy:
                 username=self.ch_user,
                 password=self.ch_password,
                 database=self.ch_database,
-                secure=True
+                secure=True,
+                pool_mgr=self._pool_mgr,
+                connect_timeout=10,
+                send_receive_timeout=30
+            )
+            # Query context built once per client - each poll only rebinds since
+            self._fetch_ctx = self.client.create_query_context(
+                query=MESSAGES_QUERY,
+                parameters={'since': datetime.now(UTC)}
             )
-            print(f"[BH] Connected to Clickhouse: {self.ch_host}")
+            self._connect_retry_delay = 1
+            logger.info("[BH] Connected to Clickhouse: %s", self.ch_host)
         except Exception as e:
-            print(f"[BH] Failed to connect to Clickhouse: {e}")
+            logger.warning("[BH] Failed to connect to Clickhouse (retry in %ss): %s", self._connect_retry_delay, e)
             self.client = None
+            self._next_connect_time = time.monotonic() + self._connect_retry_delay
+            self._connect_retry_delay = min(self._connect_retry_delay * 2, 30)
+
+    def _build_patterns(self):
+        """
+        Compile the signal patterns for the tracked assets
+
+        Called once from __init__ - _parse_messages() runs for every new
+        message and would otherwise rebuild and recompile ~30 regexes each time.
+        """
+        # Build asset pattern for tracked assets only
+        asset_pattern = '(' + '|'.join(a.lower() for a in self.tracked_assets) + ')'
+
+        # Every signal pattern needs a tracked asset in the text, so messages
+        # without one (most of them) can skip the full pattern scan
+        self._asset_gate = re.compile(asset_pattern)
+
+        self._long_res = [re.compile(t.format(ap=asset_pattern)) for t in LONG_TEMPLATES]
+        self._short_res = [re.compile(t.format(ap=asset_pattern)) for t in SHORT_TEMPLATES]
+        self._exit_res = [re.compile(t.format(ap=asset_pattern)) for t in EXIT_TEMPLATES]
+
+        # One combined false-positive regex per asset
+        self._fp_res_per_asset = {
+            asset.upper(): re.compile('|'.join(t.format(ap=f'({asset.lower()})')
+                                               for t in FALSE_POSITIVE_TEMPLATES))
+            for asset in self.tracked_assets
+        }
 
     def _fetch_new_messages(self) -> List[dict]:
         """
@@ -104,68 +250,66 @@ class BHInsightsStrategy:
             List of message dicts with timestamp and content
         """
         if not self.client:
+            if time.monotonic() < self._next_connect_time:
+                return []
             self._init_clickhouse()
             if not self.client:
                 return []
 
         try:
-            # Build query - get messages from BH Insights chat
+            # Get messages from BH Insights chat
             # Column mapping from Clickhouse schema:
             # - created_at (DateTime64) = message timestamp
             # - raw (String) = message text (message_content is often empty)
             # - user_name (String) = author name
             # - chat_name (String) = chat/group name (e.g., 'BH Insights')
             if self.last_message_timestamp:
-                # Add 1 second to avoid re-processing the same message
-                since_ts = self.last_message_timestamp + timedelta(seconds=1)
-                query = f"""
-                    SELECT created_at, raw, user_name, message_id
-                    FROM messages
-                    WHERE chat_name = 'BH Insights'
-                    AND created_at > '{since_ts.strftime('%Y-%m-%d %H:%M:%S')}'
-                    ORDER BY created_at ASC
-                    LIMIT 100
-                """
+                # Inclusive bound so messages sharing the last second aren't
+                # missed - the ones already processed are skipped by message_id
+                since_ts = self.last_message_timestamp
             else:
                 # First run - only get messages from last 24 hours to avoid
                 # processing old signals
-                since_ts = datetime.now(pytz.UTC) - timedelta(hours=24)
-                query = f"""
-                    SELECT created_at, raw, user_name, message_id
-                    FROM messages
-                    WHERE chat_name = 'BH Insights'
-                    AND created_at > '{since_ts.strftime('%Y-%m-%d %H:%M:%S')}'
-                    ORDER BY created_at ASC
-                    LIMIT 100
-                """
-
-            result = self.client.query(query)
+                since_ts = datetime.now(UTC) - timedelta(hours=24)
 
             messages = []
-            for row in result.result_rows:
-                msg = {
-                    'timestamp': row[0] if isinstance(row[0], datetime) else datetime.fromisoformat(str(row[0])),
-                    'content': row[1],
-                    'author': row[2],
-                    'message_id': row[3]
-                }
-                messages.append(msg)
-
-                # Update last processed timestamp
-                if msg['timestamp']:
-                    if not self.last_message_timestamp or msg['timestamp'] > self.last_message_timestamp:
-                        self.last_message_timestamp = msg['timestamp']
+
+            # Stream rows as they arrive instead of buffering the whole result first
+            # since is bound server-side, so the query text is the same every poll
+            # created_at comes back from the driver as a datetime already
+            self._fetch_ctx.set_parameter('since', since_ts)
+            with self.client.query_rows_stream(context=self._fetch_ctx) as stream:
+                for created_at, raw, user_name, message_id in stream:
+                    if message_id in self._seen_set:
+                        continue
+                    if len(self._seen_ids) == SEEN_MESSAGE_IDS:
+                        self._seen_set.discard(self._seen_ids[0])
+                    self._seen_ids.append(message_id)
+                    self._seen_set.add(message_id)
+
+                    messages.append({
+                        'timestamp': created_at,
+                        'content': raw,
+                        'author': user_name,
+                        'message_id': message_id
+                    })
 
             if messages:
-                print(f"[BH] Fetched {len(messages)} new messages")
+                # Rows are ordered by created_at, so the last one is the newest
+                self.last_message_timestamp = messages[-1]['timestamp']
+                logger.info("[BH] Fetched %d new messages", len(messages))
 
             return messages
 
         except Exception as e:
-            print(f"[BH] Error fetching messages: {e}")
+            logger.error("[BH] Error fetching messages: %s", e)
+            # Keep the client for query errors - only rebuild if the server is unreachable
+            if not self.client.ping():
+                logger.warning("[BH] Clickhouse unreachable, reconnecting next poll")
+                self.client = None
             return []
 
-    def _parse_message(self, content: str, timestamp: datetime) -> List[dict]:
+    def _parse_message(self, content: str, timestamp: datetime) -> List[Signal]:
         """
         Parse a message for trading signals
 
@@ -176,146 +320,130 @@ class BHInsightsStrategy:
             timestamp: Message timestamp
 
         Returns:
-            List of signal dicts with asset, action, timestamp
+            List of Signals with asset, action, timestamp
         """
-        if not content or not isinstance(content, str):
-            return []
+        return self._parse_messages([{'content': content, 'timestamp': timestamp}])
 
-        signals = []
-        content_lower = content.lower()
+    def _parse_messages(self, messages: List[dict]) -> List[Signal]:
+        """
+        Parse a batch of messages for trading signals
 
-        # Build asset pattern for tracked assets only
-        tracked_lower = [a.lower() for a in self.tracked_assets]
-        asset_pattern = '(' + '|'.join(tracked_lower) + ')'
-
-        # ========== LONG ENTRY PATTERNS ==========
-        long_patterns = [
-            rf'longed\s+{asset_pattern}',
-            rf're-?longed\s+{asset_pattern}',
-            rf'giga\s+longed\s+.*?{asset_pattern}',
-            rf'long\s+{asset_pattern}\s+(?:with|at|@|from)',
-            rf'entered\s+(?:a\s+)?long\s+(?:on\s+|in\s+)?{asset_pattern}',
-            rf'left\s+curve[d]?\s+(?:some\s+)?{asset_pattern}',
-            rf'bought\s+(?:some\s+|a\s+decent\s+amount\s+(?:of\s+)?)?{asset_pattern}',
-            rf'started\s+(?:a\s+)?twap\s+(?:on\s+)?{asset_pattern}',
-            rf'twap\s+(?:on\s+)?{asset_pattern}',
-            rf'twaping\s+{asset_pattern}',
-            rf'back\s+in\s+{asset_pattern}',
-            rf'positioned\s+long\s+(?:on\s+|with\s+)?{asset_pattern}',
-            rf'nibble\s+(?:some\s+)?(?:ltf\s+)?longs?\s+(?:on\s+)?{asset_pattern}',
-            rf'added\s+(?:to\s+)?(?:my\s+)?{asset_pattern}',
-            rf'long\s+on\s+{asset_pattern}',
-            rf'longed\s+some\s+{asset_pattern}',
-        ]
-
-        # ========== SHORT ENTRY PATTERNS ==========
-        short_patterns = [
-            rf'shorted\s+{asset_pattern}',
-            rf'shorting\s+{asset_pattern}',
-            rf'short\s+{asset_pattern}\s+(?:with|at|@|from)',
-            rf'entered\s+(?:a\s+)?short\s+(?:on\s+|in\s+)?{asset_pattern}',
-            rf'short\s+trigger\s+(?:on\s+)?{asset_pattern}',
-        ]
-
-        # ========== EXIT PATTERNS ==========
-        exit_patterns = [
-            rf"tp'?d\s+.*?{asset_pattern}",
-            rf'took\s+(?:some\s+)?profit[s]?\s+(?:on\s+|from\s+)?{asset_pattern}',
-            rf'sold\s+(?:a\s+significant\s+amount\s+of\s+)?{asset_pattern}',
-            rf'sold\s+(?:some\s+)?(?:more\s+)?(?:of\s+)?(?:my\s+)?{asset_pattern}',
-            rf'closed\s+.*?longs?\s+(?:on\s+)?.*?{asset_pattern}',
-            rf'closed\s+(?:my\s+)?{asset_pattern}',
-            rf'exited\s+{asset_pattern}',
-            rf'covered\s+(?:my\s+)?(?:\w+\s+)?shorts?\s+(?:on\s+)?{asset_pattern}',
-            rf'(?:mostly\s+)?out\s+of\s+{asset_pattern}',
-            rf'scaled\s+out\s+.*?{asset_pattern}',
-        ]
-
-        # False positive patterns to filter out
-        false_positive_patterns = [
-            rf'positioned\s+in\s+{asset_pattern}\s+and',
-            rf'did\s+with\s+{asset_pattern}',
-            rf'like\s+{asset_pattern}\s+did',
-        ]
-
-        found_signals = set()
-
-        def is_false_positive(asset_name: str) -> bool:
-            """Check if match is a false positive"""
-            asset_lower = asset_name.lower()
-            for fp_pattern in false_positive_patterns:
-                fp_check = fp_pattern.replace(asset_pattern, f'({asset_lower})')
-                if re.search(fp_check, content_lower):
-                    return True
-            return False
-
-        # Check LONG patterns
-        for pattern in long_patterns:
-            matches = re.findall(pattern, content_lower)
-            for match in matches:
-                asset = match.upper()
-                if asset in self.tracked_assets and (asset, 'LONG') not in found_signals:
-                    if not is_false_positive(asset):
-                        signals.append({
-                            'timestamp': timestamp,
-                            'asset': asset,
-                            'action': 'LONG',
-                            'raw_text': content[:200]
-                        })
-                        found_signals.add((asset, 'LONG'))
-
-        # Check SHORT patterns
-        for pattern in short_patterns:
-            matches = re.findall(pattern, content_lower)
-            for match in matches:
-                asset = match.upper()
-                if asset in self.tracked_assets and (asset, 'SHORT') not in found_signals:
-                    signals.append({
-                        'timestamp': timestamp,
-                        'asset': asset,
-                        'action': 'SHORT',
-                        'raw_text': content[:200]
-                    })
-                    found_signals.add((asset, 'SHORT'))
-
-        # Check EXIT patterns
-        for pattern in exit_patterns:
-            matches = re.findall(pattern, content_lower)
-            for match in matches:
-                asset = match.upper()
-                if asset in self.tracked_assets and (asset, 'EXIT') not in found_signals:
-                    signals.append({
-                        'timestamp': timestamp,
-                        'asset': asset,
-                        'action': 'EXIT',
-                        'raw_text': content[:200]
-                    })
-                    found_signals.add((asset, 'EXIT'))
+        Results are cached by message text, so reposted or edited-back
+        messages that Clickhouse returns again are not re-parsed.
 
+        Messages that mention a tracked asset are joined into one string
+        so each signal pattern is scanned once per poll instead of once per
+        message. Match offsets are mapped back to their message with bisect.
+        The separator holds a newline on both sides of a NUL: '.' stops at
+        the newline and '\\s+' / '\\w+' stop at the NUL, so no pattern can
+        match across two messages.
+
+        Args:
+            messages: Message dicts with content and timestamp
+
+        Returns:
+            List of Signals in message order (same order as parsing each
+            message on its own)
+        """
+        # (asset, action) pairs per message, filled from the cache or the scan
+        results = [[] for _ in messages]
+        batch = []          # (message index, content_lower) per message to scan
+        for idx, msg in enumerate(messages):
+            content = msg['content']
+            if not content or not isinstance(content, str):
+                continue
+            cached = self._parse_cache.get(content)
+            if cached is not None:
+                results[idx] = cached
+                continue
+            content_lower = content.lower()
+            if self._asset_gate.search(content_lower):
+                batch.append((idx, content_lower))
+            else:
+                self._cache_parse(content, results[idx])
+
+        if batch:
+            self._scan_batch(batch, results)
+            for idx, _ in batch:
+                self._cache_parse(messages[idx]['content'], results[idx])
+
+        signals = []
+        for msg, pairs in zip(messages, results):
+            if not pairs:
+                continue
+            # One slice shared by every signal from this message
+            raw_text = msg['content'][:200]
+            for asset, action in pairs:
+                signals.append(Signal(msg['timestamp'], asset, action, raw_text))
         return signals
 
-    def check_for_signals(self) -> List[dict]:
+    def _scan_batch(self, batch: List[Tuple[int, str]], results: List[list]):
+        """
+        Run every signal pattern once over the joined batch text
+
+        Args:
+            batch: (message index, lowercased content) for each message to scan
+            results: Per-message (asset, action) lists, appended to in place
+        """
+        # Start offset of each message in the joined text
+        starts = []
+        offset = 0
+        for _, content_lower in batch:
+            starts.append(offset)
+            offset += len(content_lower) + len(MESSAGE_SEPARATOR)
+        joined = MESSAGE_SEPARATOR.join(content_lower for _, content_lower in batch)
+
+        found_signals = set()        # (batch position, asset, action)
+        false_positives = {}         # (batch position, asset) -> bool
+
+        for action, patterns in (('LONG', self._long_res),
+                                 ('SHORT', self._short_res),
+                                 ('EXIT', self._exit_res)):
+            for pattern in patterns:
+                for match in pattern.finditer(joined):
+                    i = bisect_right(starts, match.start()) - 1
+                    asset = match.group(1).upper()
+                    if asset not in self._tracked_set or (i, asset, action) in found_signals:
+                        continue
+
+                    # False positive filter applies to LONG signals only
+                    if action == 'LONG':
+                        key = (i, asset)
+                        if key not in false_positives:
+                            false_positives[key] = self._fp_res_per_asset[asset].search(batch[i][1]) is not None
+                        if false_positives[key]:
+                            continue
+
+                    results[batch[i][0]].append((asset, action))
+                    found_signals.add((i, asset, action))
+
+    def _cache_parse(self, content: str, pairs: list):
+        """Remember the parse result for content, dropping the oldest entry when full"""
+        if len(self._parse_cache) >= PARSE_CACHE_SIZE:
+            del self._parse_cache[next(iter(self._parse_cache))]
+        self._parse_cache[content] = pairs
+
+    def check_for_signals(self) -> List[Signal]:
         """
         Poll Clickhouse and check for new trading signals
 
         Called by the main bot loop. Returns any new signals found.
 
         Returns:
-            List of signal dicts with asset, action, timestamp
+            List of Signals with asset, action, timestamp
         """
         all_signals = []
 
         # Fetch new messages
         messages = self._fetch_new_messages()
 
-        # Parse each message for signals
-        for msg in messages:
-            signals = self._parse_message(msg['content'], msg['timestamp'])
-            if signals:
-                for sig in signals:
-                    print(f"[BH] Signal detected: {sig['action']} {sig['asset']}")
-                    print(f"     Text: {sig['raw_text'][:100]}...")
-                all_signals.extend(signals)
+        # Parse the whole batch for signals
+        signals = self._parse_messages(messages)
+        for sig in signals:
+            logger.info("[BH] Signal detected: %s %s", sig.action, sig.asset)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[BH]      Text: %s...", sig.raw_text[:100])
+        all_signals.extend(signals)
 
         return all_signals
 
@@ -338,14 +466,14 @@ class BHInsightsStrategy:
         if asset in self.pending_signals:
             signal = self.pending_signals[asset]
 
-            if signal['action'] == 'LONG':
+            if signal.action == 'LONG':
                 # Clear the pending signal
                 del self.pending_signals[asset]
-                return True, f"BH Insights LONG signal: {signal['raw_text'][:100]}"
+                return True, f"BH Insights LONG signal: {signal.raw_text[:100]}"
 
-            elif signal['action'] == 'SHORT':
+            elif signal.action == 'SHORT':
                 del self.pending_signals[asset]
-                return True, f"BH Insights SHORT signal: {signal['raw_text'][:100]}"
+                return True, f"BH Insights SHORT signal: {signal.raw_text[:100]}"
 
         return False, "No BH Insights signal"
 
@@ -369,10 +497,10 @@ class BHInsightsStrategy:
         if asset in self.pending_signals:
             signal = self.pending_signals[asset]
 
-            if signal['action'] == 'EXIT':
+            if signal.action == 'EXIT':
                 # Clear the pending signal
                 del self.pending_signals[asset]
-                return True, f"BH Insights EXIT signal: {signal['raw_text'][:100]}"
+                return True, f"BH Insights EXIT signal: {signal.raw_text[:100]}"
 
         # No signal-based exit
         profit_pct = ((current_price - entry_price) / entry_price) * 100
@@ -381,25 +509,25 @@ class BHInsightsStrategy:
 
         return False, f"Holding - {profit_pct:+.2f}% from entry, waiting for BH exit signal"
 
-    def process_new_signals(self, signals: List[dict]):
+    def process_new_signals(self, signals: List[Signal]):
         """
         Process new signals and queue them for entry/exit
 
         Called after check_for_signals() to store pending signals.
 
         Args:
-            signals: List of signal dicts from check_for_signals()
+            signals: List of Signals from check_for_signals()
         """
         for signal in signals:
-            asset = signal['asset']
-            action = signal['action']
+            asset = signal.asset
+            action = signal.action
 
             # Store the signal for the asset
             # If there's already a pending signal, the new one overrides
             self.pending_signals[asset] = signal
-            print(f"[BH] Queued signal: {action} {asset}")
+            logger.info("[BH] Queued signal: %s %s", action, asset)
 
-    def get_pending_signals(self) -> Dict[str, dict]:
+    def get_pending_signals(self) -> Dict[str, Signal]:
         """Get all pending signals"""
         return self.pending_signals.copy()
 
@@ -425,6 +553,7 @@ if __name__ == '__main__':
 
     # Load credentials from master file
     load_dotenv('/Users/chrisl/Claude Code/master-credentials.env')
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     config = {
         'clickhouse_host': os.getenv('CLICKHOUSE_HOST', 'ch.ops.xexlab.com'),
@@ -445,6 +574,6 @@ if __name__ == '__main__':
     if signals:
         print(f"\nFound {len(signals)} signals:")
         for sig in signals:
-            print(f"  {sig['action']} {sig['asset']} at {sig['timestamp']}")
+            print(f"  {sig.action} {sig.asset} at {sig.timestamp}")
     else:
         print("No signals found in last 24 hours")
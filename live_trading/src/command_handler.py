@@ -12,9 +12,108 @@ Flow:
 
 import os
 import platform
-from datetime import datetime, timedelta
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Dict
-import pytz
+
+UTC = timezone.utc
+
+
+def _parse_utc(timestamp: str) -> datetime:
+    """Parse an ISO timestamp from state - older entries were saved naive, in UTC"""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+# Reply for messages that get no answer (unauthorized chat, abandoned flow)
+NO_REPLY = ("", None)
+
+# Thousands separators and dollar signs allowed in typed amounts ("$50,000")
+AMOUNT_STRIP = str.maketrans('', '', ',$')
+
+# An unanswered capital prompt expires after this long, so a later message
+# is handled as a normal command instead of being parsed as an amount
+CONVERSATION_TIMEOUT_SECONDS = 300
+
+# Reply fragments for /positions and /history - fixed text is built once and
+# the per-trade lines are single format() calls instead of several appends
+SECTION_RULE = f"\n{'─'*25}\n"
+
+POSITION_LINES = (
+    "   {emoji} Position: {size:.4f} BTC @ ${entry:,.0f}\n"
+    "   {emoji} Unrealized: {pct:+.2f}% (${pnl:+,.0f})\n"
+)
+
+TRADE_LINES = (
+    "  {emoji} {label}{date} UTC\n"
+    "     ${entry:,.0f} → ${exit:,.0f}  {pct:+.2f}% (${usd:+,.2f})\n"
+)
+
+HISTORY_TOTALS = (
+    "\n<b>Gross P&L:</b> ${gross:+,.2f}"
+    "\n<b>Fees:</b> -${fees:,.2f}"
+    "\n<b>Net P&L:</b> ${net:+,.2f}"
+)
+
+# Commands and buttons that only read state (or open a prompt) - the
+# listener runs these without the bot's strategy lock
+READ_ONLY_COMMANDS = frozenset({
+    '/start', '/help', '/status', '/positions', '/position', '/balance',
+    '/history', '/strategy', '/deposit',
+})
+READ_ONLY_CALLBACK_PREFIXES = (
+    'strategy_list', 'back_to_strategies', 'strategy_view_',
+    'strategy_deploy_', 'strategy_reallocate_',
+)
+
+# Static replies - no per-call content, so built once
+START_TEXT = """🤖 <b>TRADING BOT</b>
+
+Multi-strategy BTC trading bot on HyperLiquid.
+
+<b>Quick Start:</b>
+• /status - Check bot status
+• /strategy - Deploy a strategy
+• /positions - View P&amp;L
+
+Send /help for all commands."""
+
+HELP_TEXT = """
+📚 <b>COMMANDS</b>
+
+<b>Status</b>
+/status - Bot status & environment
+/positions - View all positions & P&L
+/history - Trade history
+/balance - Quick balance check
+
+<b>Trading</b>
+/strategy - Manage strategies
+/enable - Unpause bot
+/disable - Pause bot 🔒
+/close - Close all positions 🔒
+
+<b>Funds</b>
+/deposit - Get deposit address
+/withdraw &lt;amount&gt; - Withdraw USDC 🔒
+
+/auth &lt;pin&gt; - Authenticate
+
+🔒 = Requires PIN
+"""
+
+
+@dataclass(slots=True)
+class ConversationState:
+    """What a chat is in the middle of (e.g. entering capital for a strategy)"""
+    action: str          # 'awaiting_capital' or 'awaiting_reallocate'
+    strategy: str
+    expires_at: float    # time.monotonic() deadline
 
 
 class CommandHandler:
@@ -32,23 +131,95 @@ class CommandHandler:
         self.pin = os.getenv('TELEGRAM_PIN')
         self.pin_timeout_minutes = config.get('security', {}).get('pin_timeout_minutes', 5)
         self.allowed_chat_ids = config.get('security', {}).get('allowed_chat_ids', [])
+        self._allowed_chat_id_set = frozenset(str(cid) for cid in self.allowed_chat_ids)
+        self._unauthorized_chats = set()   # already logged, so repeats stay quiet
 
         # Conversation state - tracks what user is doing
-        # e.g., {'chat_id': {'action': 'awaiting_capital', 'strategy': 'oi'}}
-        self.conversation_state: Dict[str, dict] = {}
+        # e.g., {'chat_id': ConversationState('awaiting_capital', 'oi', expires_at)}
+        self.conversation_state: Dict[str, ConversationState] = {}
+
+        # Strategy detail text, built once per strategy (see _strategy_description)
+        self._strategy_descriptions: Dict[str, str] = {}
+
+        # (list key, (message, keyboard)) of the last /strategy reply
+        self._strategy_list_cache: Optional[tuple] = None
 
         # Protected commands
-        self.protected_commands = ['/disable', '/close', '/withdraw']
+        self.protected_commands = frozenset({'/disable', '/close', '/withdraw'})
+
+        # Command dispatch: command -> handler(args, chat_id) returning (message, keyboard)
+        self._commands = {
+            '/start': lambda args, chat_id: (START_TEXT, None),
+            '/help': lambda args, chat_id: (HELP_TEXT, None),
+            '/status': lambda args, chat_id: (self._bot_status_message(), None),
+            '/positions': lambda args, chat_id: (self._positions_message(), None),
+            '/position': lambda args, chat_id: (self._positions_message(), None),
+            '/balance': lambda args, chat_id: (self._balance_message(), None),
+            '/history': lambda args, chat_id: (self._history_message(args), None),
+            '/strategy': lambda args, chat_id: self._strategy_list(),
+            '/auth': lambda args, chat_id: (self._handle_auth(args, chat_id), None),
+            '/enable': lambda args, chat_id: (self._handle_enable(), None),
+            '/disable': lambda args, chat_id: (self._handle_disable(), None),
+            '/close': lambda args, chat_id: (self._handle_close(), None),
+            '/deposit': lambda args, chat_id: (self._deposit_message(), None),
+            '/withdraw': lambda args, chat_id: (self._handle_withdraw(args), None),
+        }
+
+        # Callback dispatch: exact callback_data, then '<prefix>_<strategy>' buttons
+        # keyed by prefix - handler(chat_id, strategy_name) returning (message, keyboard)
+        self._callbacks_exact = {
+            'strategy_list': self._strategy_list,
+            'back_to_strategies': self._strategy_list,
+        }
+        self._callbacks_by_prefix = {
+            'strategy_view': lambda chat_id, name: self._strategy_details(name),
+            'strategy_deploy': self._ask_for_capital,
+            'strategy_reallocate': self._ask_for_reallocate,
+            'strategy_disable': lambda chat_id, name: self._disable_strategy(name),
+            'close': lambda chat_id, name: (self.bot.emergency_close_position(name), None),
+        }
 
     def is_authorized_chat(self, chat_id: str) -> bool:
-        if not self.allowed_chat_ids:
+        if not self._allowed_chat_id_set:
+            return True
+        chat_id = str(chat_id)
+        if chat_id in self._allowed_chat_id_set:
+            return True
+
+        # Log each unknown chat once - a chat spamming the bot shouldn't flood the log
+        if chat_id not in self._unauthorized_chats and len(self._unauthorized_chats) < 1000:
+            self._unauthorized_chats.add(chat_id)
+            self.bot.logger.warning("Ignoring updates from unauthorized chat %s", chat_id)
+        return False
+
+    def changes_state(self, text: str, chat_id: str, is_callback: bool = False) -> bool:
+        """
+        Whether a command may change strategy or position state
+
+        The Telegram listener holds the bot's strategy lock only for these.
+
+        Args:
+            text: Message text or callback data
+            chat_id: Chat the update came from
+            is_callback: True for button clicks
+
+        Returns:
+            False for read-only commands, True otherwise (including an
+            amount typed in answer to a capital prompt)
+        """
+        if is_callback:
+            return not text.strip().startswith(READ_ONLY_CALLBACK_PREFIXES)
+
+        if str(chat_id) in self.conversation_state:
             return True
-        return str(chat_id) in [str(cid) for cid in self.allowed_chat_ids]
+
+        parts = text.split()
+        return not parts or parts[0].lower() not in READ_ONLY_COMMANDS
 
     def is_authenticated(self) -> bool:
         if not self.authenticated_until:
             return False
-        return datetime.now(pytz.UTC) < self.authenticated_until
+        return datetime.now(UTC) < self.authenticated_until
 
     def process_command(self, message_text: str, chat_id: str):
         """
@@ -58,14 +229,28 @@ class CommandHandler:
             Tuple of (message, keyboard)
         """
         if not self.is_authorized_chat(chat_id):
-            return ("", None)
+            return NO_REPLY
 
         chat_id = str(chat_id)
         text = message_text.strip()
 
         # Check if user is in a conversation flow (e.g., entering capital)
-        if chat_id in self.conversation_state:
-            return self._handle_conversation_input(chat_id, text)
+        now = time.monotonic()
+        if len(self.conversation_state) > 100:
+            # Drop flows abandoned by other chats
+            for cid in [cid for cid, s in self.conversation_state.items() if s.expires_at <= now]:
+                del self.conversation_state[cid]
+
+        state = self.conversation_state.get(chat_id)
+        if state is not None:
+            if now < state.expires_at:
+                try:
+                    return self._handle_conversation_input(chat_id, text)
+                except Exception as e:
+                    self.bot.logger.error("Error: %s", e, exc_info=True)
+                    return (f"Error: {str(e)}", None)
+            # Prompt timed out - handle this message as a normal command
+            del self.conversation_state[chat_id]
 
         # Check authentication for protected commands
         parts = text.split()
@@ -75,35 +260,12 @@ class CommandHandler:
             if not self.is_authenticated():
                 return ("🔒 <b>Authentication Required</b>\n\nSend: /auth <pin>", None)
 
+        handler = self._commands.get(command)
+        if handler is None:
+            return (f"Unknown command. Send /help", None)
+
         try:
-            if command == '/start':
-                return (self._start_message(), None)
-            elif command == '/help':
-                return (self._help_message(), None)
-            elif command == '/status':
-                return (self._bot_status_message(), None)
-            elif command == '/positions' or command == '/position':
-                return (self._positions_message(), None)
-            elif command == '/balance':
-                return (self._balance_message(), None)
-            elif command == '/history':
-                return (self._history_message(parts[1:]), None)
-            elif command == '/strategy':
-                return self._strategy_list()
-            elif command == '/auth':
-                return (self._handle_auth(parts[1:], chat_id), None)
-            elif command == '/enable':
-                return (self._handle_enable(), None)
-            elif command == '/disable':
-                return (self._handle_disable(), None)
-            elif command == '/close':
-                return (self._handle_close(), None)
-            elif command == '/deposit':
-                return (self._deposit_message(), None)
-            elif command == '/withdraw':
-                return (self._handle_withdraw(parts[1:]), None)
-            else:
-                return (f"Unknown command. Send /help", None)
+            return handler(parts[1:], chat_id)
 
         except Exception as e:
             self.bot.logger.error(f"Error: {e}", exc_info=True)
@@ -116,46 +278,29 @@ class CommandHandler:
         Returns:
             Tuple of (message, keyboard)
         """
+        if not self.is_authorized_chat(chat_id):
+            return NO_REPLY
+
         chat_id = str(chat_id)
         data = callback_data.strip()
 
         try:
-            # Strategy list
-            if data == 'strategy_list':
-                return self._strategy_list()
-
-            # View specific strategy
-            elif data.startswith('strategy_view_'):
-                strategy_name = data.replace('strategy_view_', '')
-                return self._strategy_details(strategy_name)
-
-            # Deploy strategy (ask for capital)
-            elif data.startswith('strategy_deploy_'):
-                strategy_name = data.replace('strategy_deploy_', '')
-                return self._ask_for_capital(chat_id, strategy_name)
-
-            # Reallocate strategy capital
-            elif data.startswith('strategy_reallocate_'):
-                strategy_name = data.replace('strategy_reallocate_', '')
-                return self._ask_for_reallocate(chat_id, strategy_name)
-
-            # Disable strategy
-            elif data.startswith('strategy_disable_'):
-                strategy_name = data.replace('strategy_disable_', '')
-                return self._disable_strategy(strategy_name)
-
-            # Close position for strategy
-            elif data.startswith('close_'):
-                strategy_name = data.replace('close_', '')
-                result = self.bot.emergency_close_position(strategy_name)
-                return (result, None)
-
-            # Back to strategy list
-            elif data == 'back_to_strategies':
-                return self._strategy_list()
-
-            else:
+            # Strategy list / back to strategy list
+            exact = self._callbacks_exact.get(data)
+            if exact is not None:
+                return exact()
+
+            # '<prefix>_<strategy>' buttons - strategy names may contain '_'
+            # (e.g. pastel_melon), so only split off the prefix words
+            prefix, _, strategy_name = data.partition('_')
+            if prefix == 'strategy':
+                action, _, strategy_name = strategy_name.partition('_')
+                prefix = f"strategy_{action}"
+
+            handler = self._callbacks_by_prefix.get(prefix)
+            if handler is None or not strategy_name:
                 return (f"Unknown action: {data}", None)
+            return handler(chat_id, strategy_name)
 
         except Exception as e:
             self.bot.logger.error(f"Callback error: {e}", exc_info=True)
@@ -166,19 +311,19 @@ class CommandHandler:
         state = self.conversation_state.get(chat_id)
 
         if not state:
-            return ("", None)
+            return NO_REPLY
 
-        action = state.get('action')
+        action = state.action
 
         if action == 'awaiting_capital':
-            strategy_name = state.get('strategy')
+            strategy_name = state.strategy
 
             # Clear conversation state
             del self.conversation_state[chat_id]
 
             # Parse amount
             try:
-                amount = float(text.replace(',', '').replace('$', '').strip())
+                amount = float(text.translate(AMOUNT_STRIP))
             except ValueError:
                 return (f"❌ Invalid amount: {text}\n\nPlease enter a number (e.g., 50000)", None)
 
@@ -198,14 +343,14 @@ class CommandHandler:
             return (f"✅ {result}", keyboard)
 
         elif action == 'awaiting_reallocate':
-            strategy_name = state.get('strategy')
+            strategy_name = state.strategy
 
             # Clear conversation state
             del self.conversation_state[chat_id]
 
             # Parse amount
             try:
-                amount = float(text.replace(',', '').replace('$', '').strip())
+                amount = float(text.translate(AMOUNT_STRIP))
             except ValueError:
                 return (f"Invalid amount: {text}\n\nPlease enter a number (e.g., 100)", None)
 
@@ -225,44 +370,7 @@ class CommandHandler:
 
         # Unknown state
         del self.conversation_state[chat_id]
-        return ("", None)
-
-    def _start_message(self) -> str:
-        return """🤖 <b>TRADING BOT</b>
-
-Multi-strategy BTC trading bot on HyperLiquid.
-
-<b>Quick Start:</b>
-• /status - Check bot status
-• /strategy - Deploy a strategy
-• /positions - View P&amp;L
-
-Send /help for all commands."""
-
-    def _help_message(self) -> str:
-        return """
-📚 <b>COMMANDS</b>
-
-<b>Status</b>
-/status - Bot status & environment
-/positions - View all positions & P&L
-/history - Trade history
-/balance - Quick balance check
-
-<b>Trading</b>
-/strategy - Manage strategies
-/enable - Unpause bot
-/disable - Pause bot 🔒
-/close - Close all positions 🔒
-
-<b>Funds</b>
-/deposit - Get deposit address
-/withdraw &lt;amount&gt; - Withdraw USDC 🔒
-
-/auth &lt;pin&gt; - Authenticate
-
-🔒 = Requires PIN
-"""
+        return NO_REPLY
 
     def _bot_status_message(self) -> str:
         """Simple bot status - running state and environment"""
@@ -282,35 +390,49 @@ Send /help for all commands."""
         except Exception as e:
             return f"Error: {str(e)}"
 
+    def _safe_price(self) -> Optional[float]:
+        """BTC price for display, or None if the exchange read fails"""
+        try:
+            return self.bot.exchange.get_btc_price()
+        except Exception:
+            return None
+
+    def _safe_balance(self) -> Optional[float]:
+        """Cached account balance for display, or None if the exchange read fails"""
+        try:
+            return self.bot.exchange.get_cached_account_balance()
+        except Exception:
+            return None
+
     def _positions_message(self) -> str:
         try:
-            try:
-                current_price = self.bot.exchange.get_btc_price()
-            except:
-                current_price = None
+            # Price and balance are independent exchange reads - on cache
+            # misses fetch both at once so the reply waits for one round trip
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                price_future = pool.submit(self._safe_price)
+                balance_future = pool.submit(self._safe_balance)
 
-            try:
-                balance = self.bot.exchange.get_account_balance()
-            except:
-                balance = None
+            current_price = price_future.result()
+            balance = balance_future.result()
 
-            msg = f"📊 <b>POSITIONS</b>\n\n"
+            parts = [f"📊 <b>POSITIONS</b>\n\n"]
 
             if current_price:
-                msg += f"<b>BTC:</b> ${current_price:,.2f}\n"
+                parts.append(f"<b>BTC:</b> ${current_price:,.2f}\n")
             if balance:
-                msg += f"<b>Balance:</b> ${balance:,.2f}\n"
+                parts.append(f"<b>Balance:</b> ${balance:,.2f}\n")
 
             # Get all strategy states for detailed view
             enabled_strategies = self.bot.state_manager.get_enabled_strategies()
 
             if enabled_strategies:
-                msg += f"\n{'─'*25}\n"
-                msg += f"<b>ACTIVE STRATEGIES</b>\n"
+                parts.append(SECTION_RULE)
+                parts.append(f"<b>ACTIVE STRATEGIES</b>\n")
 
                 total_allocated = 0
                 total_unrealized = 0
                 total_realized = 0
+                now = datetime.now(UTC)
 
                 for strategy_name in enabled_strategies:
                     state = self.bot.state_manager.get_strategy_state(strategy_name)
@@ -324,44 +446,42 @@ Send /help for all commands."""
                     total_allocated += capital
                     total_realized += realized_pnl
 
-                    msg += f"\n<b>▸ {strategy_name.upper()}</b>\n"
-                    msg += f"   Capital: ${capital:,.0f}\n"
+                    parts.append(f"\n<b>▸ {strategy_name.upper()}</b>\n")
+                    parts.append(f"   Capital: ${capital:,.0f}\n")
 
                     # Running since
                     if enabled_since:
                         try:
-                            start = datetime.fromisoformat(enabled_since)
-                            days = (datetime.utcnow() - start).days
+                            days = (now - _parse_utc(enabled_since)).days
                             if days == 0:
-                                msg += f"   Running: Today\n"
+                                parts.append(f"   Running: Today\n")
                             elif days == 1:
-                                msg += f"   Running: 1 day\n"
+                                parts.append(f"   Running: 1 day\n")
                             else:
-                                msg += f"   Running: {days} days\n"
+                                parts.append(f"   Running: {days} days\n")
                         except:
                             pass
 
-                    msg += f"   Trades: {trade_count}\n"
+                    parts.append(f"   Trades: {trade_count}\n")
 
                     # Last trade time
                     last_trade_time = state.get('last_trade_time')
                     if last_trade_time:
                         try:
-                            last_trade = datetime.fromisoformat(last_trade_time)
-                            time_ago = datetime.utcnow() - last_trade
+                            time_ago = now - _parse_utc(last_trade_time)
                             hours_ago = int(time_ago.total_seconds() // 3600)
                             if hours_ago < 1:
                                 mins_ago = int(time_ago.total_seconds() // 60)
-                                msg += f"   Last trade: {mins_ago}m ago\n"
+                                parts.append(f"   Last trade: {mins_ago}m ago\n")
                             elif hours_ago < 24:
-                                msg += f"   Last trade: {hours_ago}h ago\n"
+                                parts.append(f"   Last trade: {hours_ago}h ago\n")
                             else:
                                 days_ago = hours_ago // 24
-                                msg += f"   Last trade: {days_ago}d ago\n"
+                                parts.append(f"   Last trade: {days_ago}d ago\n")
                         except:
                             pass
                     else:
-                        msg += f"   Last trade: None yet\n"
+                        parts.append(f"   Last trade: None yet\n")
 
                     # Position & P&L
                     if in_position:
@@ -374,50 +494,51 @@ Send /help for all commands."""
                             total_unrealized += unrealized_pnl
 
                             emoji = "🟢" if unrealized_pnl >= 0 else "🔴"
-                            msg += f"   {emoji} Position: {size:.4f} BTC @ ${entry:,.0f}\n"
-                            msg += f"   {emoji} Unrealized: {unrealized_pct:+.2f}% (${unrealized_pnl:+,.0f})\n"
+                            parts.append(POSITION_LINES.format(
+                                emoji=emoji, size=size, entry=entry,
+                                pct=unrealized_pct, pnl=unrealized_pnl))
                     else:
-                        msg += f"   Position: None\n"
+                        parts.append(f"   Position: None\n")
                         # Show what conditions we're monitoring for
                         if strategy_name == 'overnight':
                             params = self.config.get('strategies', {}).get('overnight', {}).get('params', {})
                             max_price = params.get('max_entry_price_usd', 90000)
-                            msg += f"   ⏳ Waiting: 20:00 GMT + BTC &lt; ${max_price:,.0f}\n"
+                            parts.append(f"   ⏳ Waiting: 20:00 GMT + BTC &lt; ${max_price:,.0f}\n")
                         elif strategy_name == 'oi':
                             params = self.config.get('strategies', {}).get('oi', {}).get('params', {})
                             oi_thresh = abs(params.get('oi_drop_threshold', 0.15))
                             price_thresh = abs(params.get('price_drop_threshold', 0.3))
-                            msg += f"   👁️ Monitoring: OI drop ≥{oi_thresh}% + Price drop ≥{price_thresh}%\n"
+                            parts.append(f"   👁️ Monitoring: OI drop ≥{oi_thresh}% + Price drop ≥{price_thresh}%\n")
 
                     # Realized P&L
                     if realized_pnl != 0:
                         roi = (realized_pnl / capital * 100) if capital > 0 else 0
                         emoji = "🟢" if realized_pnl >= 0 else "🔴"
-                        msg += f"   {emoji} Realized: ${realized_pnl:+,.0f} ({roi:+.1f}% ROI)\n"
+                        parts.append(f"   {emoji} Realized: ${realized_pnl:+,.0f} ({roi:+.1f}% ROI)\n")
 
                 # Totals
-                msg += f"\n{'─'*25}\n"
-                msg += f"<b>TOTALS</b>\n"
-                msg += f"   Allocated: ${total_allocated:,.0f}\n"
+                parts.append(SECTION_RULE)
+                parts.append(f"<b>TOTALS</b>\n")
+                parts.append(f"   Allocated: ${total_allocated:,.0f}\n")
                 if total_unrealized != 0:
                     emoji = "🟢" if total_unrealized >= 0 else "🔴"
-                    msg += f"   {emoji} Unrealized: ${total_unrealized:+,.0f}\n"
+                    parts.append(f"   {emoji} Unrealized: ${total_unrealized:+,.0f}\n")
                 if total_realized != 0:
                     emoji = "🟢" if total_realized >= 0 else "🔴"
-                    msg += f"   {emoji} Realized: ${total_realized:+,.0f}\n"
+                    parts.append(f"   {emoji} Realized: ${total_realized:+,.0f}\n")
 
             else:
-                msg += f"\n<b>Strategies:</b> None active\n"
-                msg += f"Use /strategy to deploy"
+                parts.append(f"\n<b>Strategies:</b> None active\n")
+                parts.append(f"Use /strategy to deploy")
 
-            return msg
+            return ''.join(parts)
 
         except Exception as e:
             return f"Error: {str(e)}"
 
     def _balance_message(self) -> str:
         try:
-            balance = self.bot.exchange.get_account_balance()
+            balance = self.bot.exchange.get_cached_account_balance()
             allocated = self.bot.state_manager.get_total_allocated_capital()
             available = balance - allocated
 
@@ -442,7 +563,7 @@ Send /help for all commands."""
             if not local_trades and not api_trades:
                 return "📜 No trade history yet"
 
-            msg = "📜 <b>TRADE HISTORY</b>\n"
+            parts = ["📜 <b>TRADE HISTORY</b>\n"]
             total_pnl = 0
             total_fees = 0
             wins = 0
@@ -450,19 +571,23 @@ Send /help for all commands."""
 
             # Group local trades by strategy
             by_strategy = {}
-            local_exit_times = set()
+            local_exit_epochs = []
             for t in local_trades:
                 name = t.get('strategy', 'unknown')
                 if name not in by_strategy:
                     by_strategy[name] = []
                 by_strategy[name].append(t)
-                # Track exit times to identify API-only trades
+                # Track exit times (epoch seconds, parsed once) to identify API-only trades
                 if t.get('exit_time'):
-                    local_exit_times.add(t['exit_time'])
+                    try:
+                        local_exit_epochs.append(_parse_utc(t['exit_time']).timestamp())
+                    except (TypeError, ValueError):
+                        pass
+            local_exit_epochs.sort()
 
             # Show each strategy's trades
             for strategy_name, trades in by_strategy.items():
-                msg += f"\n<b>▸ {strategy_name.upper()}</b>\n"
+                parts.append(f"\n<b>▸ {strategy_name.upper()}</b>\n")
 
                 for t in trades:
                     emoji = "🟢" if t['profit_pct'] >= 0 else "🔴"
@@ -477,40 +602,34 @@ Send /help for all commands."""
                     except:
                         date_str = "?"
 
-                    msg += f"  {emoji} {date_str} UTC\n"
-                    msg += f"     ${t['entry_price']:,.0f} → ${t['exit_price']:,.0f}"
-                    msg += f"  {t['profit_pct']:+.2f}% (${t.get('profit_usd', 0):+,.2f})\n"
+                    parts.append(TRADE_LINES.format(
+                        emoji=emoji, label="", date=date_str,
+                        entry=t['entry_price'], exit=t['exit_price'],
+                        pct=t['profit_pct'], usd=t.get('profit_usd', 0)))
 
             # Find API trades not in local history (pre-tracking)
             unmatched_api = []
             for api_t in api_trades:
-                # Convert API ms timestamp to ISO for comparison
-                try:
-                    api_exit_iso = datetime.utcfromtimestamp(
-                        api_t['exit_time_ms'] / 1000
-                    ).isoformat()
-                except:
-                    api_exit_iso = None
-
-                # Check if this trade is already in local history
+                # Check if this trade is already in local history - match
+                # within 60 seconds of the nearest local exit on either side
                 matched = False
-                if api_exit_iso:
-                    for local_time in local_exit_times:
-                        # Match within 60 seconds
-                        try:
-                            local_dt = datetime.fromisoformat(local_time)
-                            api_dt = datetime.fromisoformat(api_exit_iso)
-                            if abs((local_dt - api_dt).total_seconds()) < 60:
-                                matched = True
-                                break
-                        except:
-                            pass
-                if not matched:
+                try:
+                    api_epoch = api_t['exit_time_ms'] / 1000
+                    i = bisect_left(local_exit_epochs, api_epoch)
+                    matched = any(abs(local_exit_epochs[j] - api_epoch) < 60
+                                  for j in (i - 1, i) if 0 <= j < len(local_exit_epochs))
+                except (KeyError, TypeError):
+                    pass
+
+                if matched:
+                    # Shown from local history already - only its fees count here
+                    total_fees += api_t.get('fees', 0)
+                else:
                     unmatched_api.append(api_t)
 
             # Show pre-tracking trades from API
             if unmatched_api:
-                msg += f"\n<b>▸ EARLIER (pre-tracking)</b>\n"
+                parts.append(f"\n<b>▸ EARLIER (pre-tracking)</b>\n")
                 for t in unmatched_api:
                     emoji = "🟢" if t['profit_pct'] >= 0 else "🔴"
                     if t['profit_pct'] >= 0:
@@ -525,26 +644,20 @@ Send /help for all commands."""
                     except:
                         date_str = "?"
 
-                    msg += f"  {emoji} {t['coin']} {date_str} UTC\n"
-                    msg += f"     ${t['entry_price']:,.0f} → ${t['exit_price']:,.0f}"
-                    msg += f"  {t['profit_pct']:+.2f}% (${t.get('profit_usd', 0):+,.2f})\n"
-
-            # Also tally fees from API trades that matched local ones
-            for api_t in api_trades:
-                if api_t not in unmatched_api:
-                    total_fees += api_t.get('fees', 0)
+                    parts.append(TRADE_LINES.format(
+                        emoji=emoji, label=f"{t['coin']} ", date=date_str,
+                        entry=t['entry_price'], exit=t['exit_price'],
+                        pct=t['profit_pct'], usd=t.get('profit_usd', 0)))
 
             # Summary
-            msg += f"\n{'─'*25}\n"
-            msg += f"<b>Trades:</b> {trade_count}"
+            parts.append(SECTION_RULE)
+            parts.append(f"<b>Trades:</b> {trade_count}")
             if trade_count:
-                msg += f" | <b>Win Rate:</b> {wins}/{trade_count} ({wins/trade_count*100:.0f}%)"
-            net_pnl = total_pnl - total_fees
-            msg += f"\n<b>Gross P&L:</b> ${total_pnl:+,.2f}"
-            msg += f"\n<b>Fees:</b> -${total_fees:,.2f}"
-            msg += f"\n<b>Net P&L:</b> ${net_pnl:+,.2f}"
+                parts.append(f" | <b>Win Rate:</b> {wins}/{trade_count} ({wins/trade_count*100:.0f}%)")
+            parts.append(HISTORY_TOTALS.format(
+                gross=total_pnl, fees=total_fees, net=total_pnl - total_fees))
 
-            return msg
+            return ''.join(parts)
 
         except Exception as e:
             return f"Error: {str(e)}"
@@ -554,6 +667,12 @@ Send /help for all commands."""
         try:
             summaries = self.bot.get_strategies_summary()
 
+            # The list only shows name, enabled and capital - reuse the last
+            # reply while none of those have changed
+            key = tuple((s['name'], s['enabled'], s['allocated_capital_usd']) for s in summaries)
+            if self._strategy_list_cache and self._strategy_list_cache[0] == key:
+                return self._strategy_list_cache[1]
+
             msg = "📈 <b>STRATEGIES</b>\n\n"
             msg += "Select a strategy to view details:\n"
 
@@ -575,11 +694,113 @@ Send /help for all commands."""
 
             keyboard = {"inline_keyboard": buttons}
 
+            self._strategy_list_cache = (key, (msg, keyboard))
             return (msg, keyboard)
 
         except Exception as e:
             return (f"Error: {str(e)}", None)
 
+    def _strategy_description(self, strategy_name: str) -> str:
+        """
+        Overview / entry / exit / backtest text for a strategy
+
+        Built from config params on first view and cached - params only
+        change with a config edit and restart.
+        """
+        cached = self._strategy_descriptions.get(strategy_name)
+        if cached is not None:
+            return cached
+
+        parts = []
+
+        if strategy_name == 'overnight':
+            params = self.config.get('strategies', {}).get('overnight', {}).get('params', {})
+            entry_hour = params.get('entry_hour', 15)
+            trailing_stop = params.get('trailing_stop_pct', 1.0)
+            max_price = params.get('max_entry_price_usd', 90000)
+
+            parts.append(f"<b>🎯 Overview:</b>\n")
+            parts.append(f"Capitalize on Bitcoin's tendency to recover overnight after intraday weakness. ")
+            parts.append(f"Enters at a fixed time daily and holds until trailing stop hits.\n\n")
+
+            parts.append(f"<b>📥 ENTRY CONDITIONS:</b>\n")
+            parts.append(f"• <b>Time:</b> {entry_hour}:00 EST (20:00 GMT) daily\n")
+            parts.append(f"• <b>Price Filter:</b> BTC must be below ${max_price:,.0f}\n")
+            parts.append(f"• <b>Position Check:</b> Not already in a position\n")
+            parts.append(f"• <b>Action:</b> Market buy with allocated capital\n\n")
+
+            parts.append(f"<b>📤 EXIT CONDITIONS:</b>\n")
+            parts.append(f"• <b>Trailing Stop:</b> {trailing_stop}% from peak price\n")
+            parts.append(f"• <b>Protection:</b> NEVER sells at a loss\n")
+            parts.append(f"• <b>Peak Tracking:</b> Continuously updates highest price\n")
+            parts.append(f"• <b>Trigger:</b> Price drops {trailing_stop}% from peak → sell\n\n")
+
+            parts.append(f"<b>📊 BACKTEST (Dec 2024, 1-month):</b>\n")
+            parts.append(f"• <b>Return:</b> +17.95%\n")
+            parts.append(f"• <b>Win Rate:</b> 76.9% (20/26 trades)\n")
+            parts.append(f"• <b>Max Drawdown:</b> -3.25%\n")
+            parts.append(f"• <b>Avg Win:</b> +1.2% | <b>Largest:</b> +3.8%\n")
+
+        elif strategy_name == 'oi':
+            params = self.config.get('strategies', {}).get('oi', {}).get('params', {})
+            oi_drop = abs(params.get('oi_drop_threshold', 0.15))
+            price_drop = abs(params.get('price_drop_threshold', 0.3))
+            profit_target = params.get('profit_target_pct', 1.0)
+            cooldown = params.get('cooldown_minutes', 60)
+
+            parts.append(f"<b>🎯 Overview:</b>\n")
+            parts.append(f"Detects forced liquidations via Open Interest drops. ")
+            parts.append(f"When OI drops sharply with price, it signals forced selling → buy the dip.\n\n")
+
+            parts.append(f"<b>📥 ENTRY CONDITIONS:</b>\n")
+            parts.append(f"• <b>OI Drop:</b> ≥{oi_drop}% in 5 minutes\n")
+            parts.append(f"• <b>Price Drop:</b> ≥{price_drop}% in 5 minutes\n")
+            parts.append(f"• <b>Cooldown:</b> {cooldown} min between trades\n")
+            parts.append(f"• <b>Action:</b> Market buy on signal\n\n")
+
+            parts.append(f"<b>📤 EXIT CONDITIONS:</b>\n")
+            parts.append(f"• <b>Profit Target:</b> +{profit_target}% from entry\n")
+            parts.append(f"• <b>Stop Loss:</b> NONE (never sell at loss)\n")
+            parts.append(f"• <b>Hold:</b> Until profit target reached\n\n")
+
+            parts.append(f"<b>📊 BACKTEST (Dec 2024, 1-month):</b>\n")
+            parts.append(f"• <b>Return:</b> +8.2%\n")
+            parts.append(f"• <b>Win Rate:</b> 100% (12/12 trades)\n")
+            parts.append(f"• <b>Max Drawdown:</b> -4.1%\n")
+            parts.append(f"• <b>Avg Hold:</b> 2-6 hours\n")
+
+        elif strategy_name == 'pastel_melon':
+            params = self.config.get('strategies', {}).get('pastel_melon', {}).get('params', {})
+            targets = params.get('tranche_targets', [2, 5, 10])
+            position_pct = params.get('position_size_pct', 0.10) * 100
+            min_liq = params.get('min_liquidity_usd', 10000)
+
+            parts.append(f"<b>🎯 Overview:</b>\n")
+            parts.append(f"Follows Melon's token calls in Pastel degen channel. ")
+            parts.append(f"Trades on Solana via Jupiter aggregator.\n\n")
+
+            parts.append(f"<b>📥 ENTRY CONDITIONS:</b>\n")
+            parts.append(f"• <b>Signal:</b> Melon posts token address → Rick bot responds\n")
+            parts.append(f"• <b>Chain:</b> Solana only (91% of Melon's calls)\n")
+            parts.append(f"• <b>Min Liquidity:</b> ${min_liq:,}\n")
+            parts.append(f"• <b>Position Size:</b> {position_pct:.0f}% of capital per trade\n\n")
+
+            parts.append(f"<b>📤 EXIT CONDITIONS (Tiered):</b>\n")
+            parts.append(f"• <b>{targets[0]}x:</b> Sell 33% at 2x entry price\n")
+            parts.append(f"• <b>{targets[1]}x:</b> Sell 33% at 5x entry price\n")
+            parts.append(f"• <b>{targets[2]}x:</b> Sell 34% at 10x entry price\n")
+            parts.append(f"• <b>Dead Token:</b> Stop monitoring if liquidity = 0\n\n")
+
+            parts.append(f"<b>📊 BACKTEST (Mar-Oct 2025):</b>\n")
+            parts.append(f"• <b>Win Rate:</b> 65.1% (hit at least 2x)\n")
+            parts.append(f"• <b>Expected ROI:</b> +208% per trade\n")
+            parts.append(f"• <b>Frequency:</b> ~2.7 calls/month\n")
+            parts.append(f"• <b>Best Performer:</b> KWEEN (44.1x)\n")
+
+        description = ''.join(parts)
+        self._strategy_descriptions[strategy_name] = description
+        return description
+
     def _strategy_details(self, strategy_name: str) -> Tuple[str, dict]:
         """Show strategy details with action buttons"""
         try:
@@ -595,114 +816,32 @@ Send /help for all commands."""
 
             status = "🟢 DEPLOYED" if enabled else "⚪ NOT DEPLOYED"
 
-            msg = f"📊 <b>{strategy_name.upper()}</b>\n"
-            msg += f"{status}\n\n"
-
-            # Strategy-specific FULL descriptions
-            if strategy_name == 'overnight':
-                params = self.config.get('strategies', {}).get('overnight', {}).get('params', {})
-                entry_hour = params.get('entry_hour', 15)
-                trailing_stop = params.get('trailing_stop_pct', 1.0)
-                max_price = params.get('max_entry_price_usd', 90000)
-
-                msg += f"<b>🎯 Overview:</b>\n"
-                msg += f"Capitalize on Bitcoin's tendency to recover overnight after intraday weakness. "
-                msg += f"Enters at a fixed time daily and holds until trailing stop hits.\n\n"
-
-                msg += f"<b>📥 ENTRY CONDITIONS:</b>\n"
-                msg += f"• <b>Time:</b> {entry_hour}:00 EST (20:00 GMT) daily\n"
-                msg += f"• <b>Price Filter:</b> BTC must be below ${max_price:,.0f}\n"
-                msg += f"• <b>Position Check:</b> Not already in a position\n"
-                msg += f"• <b>Action:</b> Market buy with allocated capital\n\n"
-
-                msg += f"<b>📤 EXIT CONDITIONS:</b>\n"
-                msg += f"• <b>Trailing Stop:</b> {trailing_stop}% from peak price\n"
-                msg += f"• <b>Protection:</b> NEVER sells at a loss\n"
-                msg += f"• <b>Peak Tracking:</b> Continuously updates highest price\n"
-                msg += f"• <b>Trigger:</b> Price drops {trailing_stop}% from peak → sell\n\n"
-
-                msg += f"<b>📊 BACKTEST (Dec 2024, 1-month):</b>\n"
-                msg += f"• <b>Return:</b> +17.95%\n"
-                msg += f"• <b>Win Rate:</b> 76.9% (20/26 trades)\n"
-                msg += f"• <b>Max Drawdown:</b> -3.25%\n"
-                msg += f"• <b>Avg Win:</b> +1.2% | <b>Largest:</b> +3.8%\n"
-
-            elif strategy_name == 'oi':
-                params = self.config.get('strategies', {}).get('oi', {}).get('params', {})
-                oi_drop = abs(params.get('oi_drop_threshold', 0.15))
-                price_drop = abs(params.get('price_drop_threshold', 0.3))
-                profit_target = params.get('profit_target_pct', 1.0)
-                cooldown = params.get('cooldown_minutes', 60)
-
-                msg += f"<b>🎯 Overview:</b>\n"
-                msg += f"Detects forced liquidations via Open Interest drops. "
-                msg += f"When OI drops sharply with price, it signals forced selling → buy the dip.\n\n"
-
-                msg += f"<b>📥 ENTRY CONDITIONS:</b>\n"
-                msg += f"• <b>OI Drop:</b> ≥{oi_drop}% in 5 minutes\n"
-                msg += f"• <b>Price Drop:</b> ≥{price_drop}% in 5 minutes\n"
-                msg += f"• <b>Cooldown:</b> {cooldown} min between trades\n"
-                msg += f"• <b>Action:</b> Market buy on signal\n\n"
-
-                msg += f"<b>📤 EXIT CONDITIONS:</b>\n"
-                msg += f"• <b>Profit Target:</b> +{profit_target}% from entry\n"
-                msg += f"• <b>Stop Loss:</b> NONE (never sell at loss)\n"
-                msg += f"• <b>Hold:</b> Until profit target reached\n\n"
-
-                msg += f"<b>📊 BACKTEST (Dec 2024, 1-month):</b>\n"
-                msg += f"• <b>Return:</b> +8.2%\n"
-                msg += f"• <b>Win Rate:</b> 100% (12/12 trades)\n"
-                msg += f"• <b>Max Drawdown:</b> -4.1%\n"
-                msg += f"• <b>Avg Hold:</b> 2-6 hours\n"
-
-            elif strategy_name == 'pastel_melon':
-                params = self.config.get('strategies', {}).get('pastel_melon', {}).get('params', {})
-                targets = params.get('tranche_targets', [2, 5, 10])
-                position_pct = params.get('position_size_pct', 0.10) * 100
-                min_liq = params.get('min_liquidity_usd', 10000)
-
-                msg += f"<b>🎯 Overview:</b>\n"
-                msg += f"Follows Melon's token calls in Pastel degen channel. "
-                msg += f"Trades on Solana via Jupiter aggregator.\n\n"
-
-                msg += f"<b>📥 ENTRY CONDITIONS:</b>\n"
-                msg += f"• <b>Signal:</b> Melon posts token address → Rick bot responds\n"
-                msg += f"• <b>Chain:</b> Solana only (91% of Melon's calls)\n"
-                msg += f"• <b>Min Liquidity:</b> ${min_liq:,}\n"
-                msg += f"• <b>Position Size:</b> {position_pct:.0f}% of capital per trade\n\n"
-
-                msg += f"<b>📤 EXIT CONDITIONS (Tiered):</b>\n"
-                msg += f"• <b>{targets[0]}x:</b> Sell 33% at 2x entry price\n"
-                msg += f"• <b>{targets[1]}x:</b> Sell 33% at 5x entry price\n"
-                msg += f"• <b>{targets[2]}x:</b> Sell 34% at 10x entry price\n"
-                msg += f"• <b>Dead Token:</b> Stop monitoring if liquidity = 0\n\n"
-
-                msg += f"<b>📊 BACKTEST (Mar-Oct 2025):</b>\n"
-                msg += f"• <b>Win Rate:</b> 65.1% (hit at least 2x)\n"
-                msg += f"• <b>Expected ROI:</b> +208% per trade\n"
-                msg += f"• <b>Frequency:</b> ~2.7 calls/month\n"
-                msg += f"• <b>Best Performer:</b> KWEEN (44.1x)\n"
+            parts = [f"📊 <b>{strategy_name.upper()}</b>\n"]
+            parts.append(f"{status}\n\n")
+
+            # Strategy-specific FULL description (static after startup)
+            parts.append(self._strategy_description(strategy_name))
 
             if enabled:
-                msg += f"\n<b>💰 Allocated Capital:</b> ${capital:,.0f}\n"
+                parts.append(f"\n<b>💰 Allocated Capital:</b> ${capital:,.0f}\n")
 
             # Position info
             if in_position:
                 entry = strategy['entry_price']
                 size = strategy['position_size_btc']
 
-                try:
-                    price = self.bot.exchange.get_btc_price()
+                price = self._safe_price()
+                if price and entry:
                     pnl_pct = ((price - entry) / entry) * 100
                     pnl_usd = (price - entry) * size
                     emoji = "🟢" if pnl_pct >= 0 else "🔴"
 
-                    msg += f"\n{emoji} <b>POSITION:</b>\n"
-                    msg += f"   Entry: ${entry:,.0f}\n"
-                    msg += f"   Size: {size:.4f} BTC\n"
-                    msg += f"   P&L: {pnl_pct:+.2f}% (${pnl_usd:+,.0f})\n"
-                except:
-                    msg += f"\n<b>Position:</b> {size:.4f} BTC @ ${entry:,.0f}\n"
+                    parts.append(f"\n{emoji} <b>POSITION:</b>\n")
+                    parts.append(f"   Entry: ${entry:,.0f}\n")
+                    parts.append(f"   Size: {size:.4f} BTC\n")
+                    parts.append(f"   P&L: {pnl_pct:+.2f}% (${pnl_usd:+,.0f})\n")
+                else:
+                    parts.append(f"\n<b>Position:</b> {size:.4f} BTC @ ${entry:,.0f}\n")
 
             # Build action buttons
             buttons = []
@@ -739,7 +878,7 @@ Send /help for all commands."""
 
             keyboard = {"inline_keyboard": buttons}
 
-            return (msg, keyboard)
+            return (''.join(parts), keyboard)
 
         except Exception as e:
             return (f"Error: {str(e)}", None)
@@ -747,10 +886,9 @@ Send /help for all commands."""
     def _ask_for_capital(self, chat_id: str, strategy_name: str) -> Tuple[str, dict]:
         """Ask user to enter capital amount"""
         # Set conversation state
-        self.conversation_state[chat_id] = {
-            'action': 'awaiting_capital',
-            'strategy': strategy_name
-        }
+        self.conversation_state[chat_id] = ConversationState(
+            'awaiting_capital', strategy_name, time.monotonic() + CONVERSATION_TIMEOUT_SECONDS
+        )
 
         try:
             # Pastel Melon uses Solana wallet, others use HyperLiquid
@@ -765,7 +903,7 @@ Send /help for all commands."""
                 msg += f"Enter USDC amount to allocate:\n\n"
                 msg += f"<i>Example: 200</i>"
             else:
-                balance = self.bot.exchange.get_account_balance()
+                balance = self.bot.exchange.get_cached_account_balance()
                 allocated = self.bot.state_manager.get_total_allocated_capital()
                 available = balance - allocated
 
@@ -790,10 +928,9 @@ Send /help for all commands."""
 
     def _ask_for_reallocate(self, chat_id: str, strategy_name: str) -> Tuple[str, dict]:
         """Ask user to enter new capital amount for reallocation"""
-        self.conversation_state[chat_id] = {
-            'action': 'awaiting_reallocate',
-            'strategy': strategy_name
-        }
+        self.conversation_state[chat_id] = ConversationState(
+            'awaiting_reallocate', strategy_name, time.monotonic() + CONVERSATION_TIMEOUT_SECONDS
+        )
 
         try:
             current_capital = self.bot.state_manager.get_strategy_capital(strategy_name)
@@ -811,7 +948,7 @@ Send /help for all commands."""
                 msg += f"Enter new USDC amount:\n\n"
                 msg += f"<i>Example: {int(usdc_balance)}</i>"
             else:
-                balance = self.bot.exchange.get_account_balance()
+                balance = self.bot.exchange.get_cached_account_balance()
                 total_allocated = self.bot.state_manager.get_total_allocated_capital()
                 other_allocated = total_allocated - current_capital
                 available = balance - other_allocated
@@ -862,7 +999,7 @@ Send /help for all commands."""
             return "Usage: /auth <pin>"
 
         if args[0] == self.pin:
-            self.authenticated_until = datetime.now(pytz.UTC) + timedelta(minutes=self.pin_timeout_minutes)
+            self.authenticated_until = datetime.now(UTC) + timedelta(minutes=self.pin_timeout_minutes)
             self.failed_auth_attempts[chat_id] = 0
             return f"✅ Authenticated for {self.pin_timeout_minutes} minutes"
         else:
@@ -886,7 +1023,7 @@ Send /help for all commands."""
     def _deposit_message(self) -> str:
         """Show deposit information"""
         try:
-            balance = self.bot.exchange.get_account_balance()
+            balance = self.bot.exchange.get_cached_account_balance()
             wallet = self.bot.exchange.wallet_address
 
             msg = "💰 <b>DEPOSIT USDC</b>\n\n"
@@ -915,7 +1052,7 @@ Send /help for all commands."""
         try:
             if not args:
                 # Show current balance and usage
-                balance = self.bot.exchange.get_account_balance()
+                balance = self.bot.exchange.get_cached_account_balance()
                 allocated = self.bot.state_manager.get_total_allocated_capital()
                 available = balance - allocated
 
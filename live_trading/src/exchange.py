@@ -9,12 +9,17 @@ The SDK handles:
 - Proper request formatting
 - Connection management
 
+Prices:
+- Optional websocket stream (allMids) keeps a live mid price for every asset
+- REST all_mids() is the fallback when the stream is off or stale
+
 Error handling:
 - Automatic retries with exponential backoff
 - Detailed error logging
 """
 
 import math
+import threading
 import time
 from typing import Dict, Optional, Tuple
 from eth_account import Account
@@ -22,6 +27,7 @@ from eth_account import Account
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
 from hyperliquid.utils import constants
+from hyperliquid.websocket_manager import WebsocketManager
 
 
 class HyperLiquidClient:
@@ -46,6 +52,7 @@ class HyperLiquidClient:
         """
         self.wallet_address = api_key  # Renamed for clarity
         self.private_key = api_secret  # Renamed for clarity
+        self._credentials_lock = threading.Lock()  # See set_credentials()
         self.retry_attempts = retry_attempts
         self.timeout = timeout
         self.testnet = testnet
@@ -58,7 +65,7 @@ class HyperLiquidClient:
 
         # Initialize SDK clients
         # Info client - for read-only operations (no signing needed)
-        self.info = Info(self.api_url, skip_ws=True)
+        self.info = Info(self.api_url, skip_ws=True, timeout=self.timeout)
 
         # Exchange client - for trading (requires signing)
         # Create account from private key for signing
@@ -66,9 +73,15 @@ class HyperLiquidClient:
         self.exchange = Exchange(
             self.account,
             self.api_url,
-            account_address=self.wallet_address
+            account_address=self.wallet_address,
+            timeout=self.timeout
         )
 
+        # Share one keep-alive session between Info and Exchange, so the
+        # connection warmed by the metadata fetch below is reused for orders
+        self.exchange.session.close()
+        self.exchange.session = self.info.session
+
         # Cache asset metadata (szDecimals) from the exchange
         self._sz_decimals = {}
         self._load_asset_metadata()
@@ -79,6 +92,169 @@ class HyperLiquidClient:
         self._price_cache_time = 0   # timestamp of last fetch
         self._price_cache_ttl = 30   # seconds before cache expires
 
+        # Balance cache - for display/validation reads via get_cached_account_balance()
+        # Dropped whenever an order or withdrawal could have changed the balance
+        self._balance_cache = None        # last fetched balance
+        self._balance_cache_time = 0      # monotonic time of last fetch
+        self._balance_cache_ttl = 60      # seconds before cache expires
+
+        # Websocket price stream (see start_price_stream) - mids kept as raw strings,
+        # only the assets actually read get converted to float
+        self._ws = None
+        self._stream_enabled = False
+        self._stream_mids = {}        # {asset: mid price string}
+        self._stream_time = 0         # monotonic time of last stream update
+        self._stream_max_age = 30     # seconds before stream is considered stale
+        self._ws_started = 0          # monotonic time of last (re)connect attempt
+        self._ws_retry_delay = 1      # reconnect backoff (doubles up to 60s)
+        self._reconnect_lock = threading.Lock()  # one thread restarts a stale stream at a time
+        self._price_listener = None   # called (no args) after each stream update
+        self._tick_high = None        # highest BTC mid since last take_btc_tick_high()
+        self._tick_lock = threading.Lock()
+
+    def close(self):
+        """Stop the price stream and close pooled HTTP connections (client can't be used afterwards)"""
+        self.stop_price_stream()
+        self.info.session.close()
+
+    def set_credentials(self, api_key: str, api_secret: str):
+        """
+        Switch this client to a different account in place
+
+        Keeps the pooled HTTP session, asset metadata and the price stream
+        (none of which are account specific), so an account switch costs no
+        new connections or metadata fetches.
+
+        Args:
+            api_key: New wallet address (0x...)
+            api_secret: New API wallet private key (0x...)
+
+        Raises:
+            Exception: If the private key is invalid (credentials unchanged)
+        """
+        try:
+            account = Account.from_key(api_secret)
+        except Exception as e:
+            raise Exception(f"Invalid API secret: {e}") from e
+
+        with self._credentials_lock:
+            self.account = account
+            self.wallet_address = api_key
+            self.private_key = api_secret
+            # The SDK signs with .wallet and trades for .account_address
+            self.exchange.wallet = account
+            self.exchange.account_address = api_key
+            self._balance_cache = None
+
+    def start_price_stream(self):
+        """
+        Subscribe to HyperLiquid's allMids websocket feed
+
+        Keeps a persistent connection open and caches every mid price as it
+        updates, so get_price() is a memory read instead of a 200-500ms REST
+        call. get_price() falls back to REST (and reconnects the stream) if
+        no update has arrived for 30 seconds.
+        """
+        self._stream_enabled = True
+        if self._ws is not None and self._ws.is_alive():
+            return
+
+        self._close_ws()
+
+        ws = WebsocketManager(self.api_url)
+        # SDK threads are non-daemon - don't let them keep the process alive on shutdown
+        ws.daemon = True
+        ws.ping_sender.daemon = True
+        ws.start()
+        ws.subscribe({"type": "allMids"}, self._on_all_mids)
+
+        self._ws = ws
+        self._ws_started = time.monotonic()
+
+    def set_price_listener(self, callback):
+        """
+        Register a callback to run after every price stream update
+
+        The callback runs on the websocket thread and takes no arguments -
+        read the new price with get_price(). Keep it cheap (e.g. set an
+        event). Pass None to remove it.
+
+        Args:
+            callback: Zero-argument callable, or None
+        """
+        self._price_listener = callback
+
+    def stop_price_stream(self):
+        """Close the websocket price stream (get_price() reverts to REST)"""
+        self._stream_enabled = False
+        self._close_ws()
+
+    def _close_ws(self):
+        """Close the websocket connection and its SDK threads"""
+        if self._ws is not None:
+            try:
+                self._ws.stop()
+            except Exception as e:
+                print(f"Warning: Error closing price stream: {e}")
+            self._ws = None
+
+    def _on_all_mids(self, message: Dict):
+        """Websocket callback (runs on the SDK's websocket thread)"""
+        mids = message.get('data', {}).get('mids')
+        if mids:
+            self._stream_mids = mids
+            self._stream_time = time.monotonic()
+            self._ws_retry_delay = 1
+
+            btc = mids.get('BTC')
+            if btc is not None:
+                price = float(btc)
+                with self._tick_lock:
+                    if self._tick_high is None or price > self._tick_high:
+                        self._tick_high = price
+
+            listener = self._price_listener
+            if listener is not None:
+                listener()
+
+    def take_btc_tick_high(self) -> Optional[float]:
+        """
+        Get the highest BTC mid seen on the price stream since the last call
+
+        Exit checks run every few seconds at most, so a short spike between
+        two checks would otherwise never reach the trailing stop's peak.
+
+        Returns:
+            Highest streamed BTC price, or None if no stream updates arrived
+        """
+        with self._tick_lock:
+            high, self._tick_high = self._tick_high, None
+        return high
+
+    def _reconnect_stale_stream(self, now: float):
+        """Restart a dead or silent price stream, backing off between attempts"""
+        # get_price() runs on several threads - if one is already reconnecting,
+        # the others fall back to REST rather than starting a second stream
+        if not self._reconnect_lock.acquire(blocking=False):
+            return
+        try:
+            # A connected stream gets the full max-age window to deliver data, a dead one just the backoff
+            is_alive = self._ws is not None and self._ws.is_alive()
+            wait = self._ws_retry_delay + (self._stream_max_age if is_alive else 0)
+            if now - self._ws_started < wait:
+                return
+
+            print(f"Price stream stale - reconnecting (backoff {self._ws_retry_delay}s)")
+            self._ws_retry_delay = min(self._ws_retry_delay * 2, 60)
+            try:
+                self._close_ws()
+                self.start_price_stream()
+            except Exception as e:
+                self._ws_started = now
+                print(f"Warning: Price stream reconnect failed: {e}")
+        finally:
+            self._reconnect_lock.release()
+
     def _load_asset_metadata(self):
         """
         Fetch asset metadata from HyperLiquid (szDecimals for each asset).
@@ -173,7 +349,8 @@ class HyperLiquidClient:
                         sleep_time = 2 * (2 ** attempt)
                         time.sleep(sleep_time)
 
-        raise Exception(f"{operation_name} failed after retries: {str(last_error)}")
+        # Chain the original error so callers can tell network blips from real failures
+        raise Exception(f"{operation_name} failed after retries: {str(last_error)}") from last_error
 
     def get_btc_price(self) -> float:
         """
@@ -193,7 +370,8 @@ class HyperLiquidClient:
         """
         Get current market price for any asset.
 
-        Uses a 30-second cache so multiple price lookups within the same
+        Reads the websocket stream when it's running and fresh. Otherwise
+        uses a 30-second REST cache so multiple price lookups within the same
         bot loop iteration reuse one API call instead of hammering all_mids().
 
         Args:
@@ -202,6 +380,16 @@ class HyperLiquidClient:
         Returns:
             Current price in USDC
         """
+        # Live price from the websocket stream (if running and fresh)
+        if self._stream_enabled:
+            now_mono = time.monotonic()
+            if now_mono - self._stream_time < self._stream_max_age:
+                mid = self._stream_mids.get(asset)
+                if mid is not None:
+                    return float(mid)
+            else:
+                self._reconnect_stale_stream(now_mono)
+
         now = time.time()
 
         # Return cached price if fresh enough
@@ -222,13 +410,32 @@ class HyperLiquidClient:
         except Exception as e:
             raise Exception(f"Failed to get {asset} price: {str(e)}")
 
-    def get_account_balance(self) -> float:
+    def _info_request(self, payload: Dict, timeout: float) -> Dict:
+        """
+        POST to the /info endpoint with a per-call timeout.
+
+        The SDK only supports one timeout per Info instance, so quick
+        interactive lookups go through its pooled session directly.
+        Network errors (requests.Timeout, requests.ConnectionError) are
+        raised as-is so callers can tell them apart from API errors.
+        """
+        response = self.info.session.post(f"{self.api_url}/info", json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def get_account_balance(self, timeout: Optional[float] = None) -> float:
         """
         Get available USDC balance from perp clearinghouse
 
         HyperLiquid stores USDC in the perpetual trading clearinghouse,
         not the spot clearinghouse. This queries the perp account.
 
+        Args:
+            timeout: Optional per-request timeout in seconds. When set, the
+                     balance is fetched in a single attempt (no retries) and
+                     network errors propagate unwrapped. Used on the Telegram
+                     command path where a slow exchange must not block replies.
+
         Returns:
             Available USDC balance (account value)
 
@@ -237,9 +444,15 @@ class HyperLiquidClient:
             >>> print(f"Balance: ${balance:,.2f}")
             Balance: $100,000.00
         """
+        def query_state(request_type: str) -> Dict:
+            # request_type is 'clearinghouseState' (perp) or 'spotClearinghouseState'
+            if timeout is None:
+                return self.info.post("/info", {"type": request_type, "user": self.wallet_address})
+            return self._info_request({"type": request_type, "user": self.wallet_address}, timeout)
+
         def fetch_balance():
             # Get user state from perp clearinghouse
-            user_state = self.info.user_state(self.wallet_address)
+            user_state = query_state('clearinghouseState')
 
             if 'marginSummary' in user_state:
                 margin = user_state['marginSummary']
@@ -247,7 +460,7 @@ class HyperLiquidClient:
                 return account_value
 
             # Fallback: try spot clearinghouse
-            spot_state = self.info.spot_user_state(self.wallet_address)
+            spot_state = query_state('spotClearinghouseState')
             if 'balances' in spot_state:
                 for balance in spot_state['balances']:
                     if balance['coin'] == 'USDC':
@@ -255,10 +468,41 @@ class HyperLiquidClient:
 
             return 0.0
 
-        try:
-            return self._retry_operation(fetch_balance, "Get account balance")
-        except Exception as e:
-            raise Exception(f"Failed to get account balance: {str(e)}")
+        if timeout is not None:
+            balance = fetch_balance()
+        else:
+            try:
+                balance = self._retry_operation(fetch_balance, "Get account balance")
+            except Exception as e:
+                raise Exception(f"Failed to get account balance: {str(e)}")
+
+        self._balance_cache = balance
+        self._balance_cache_time = time.monotonic()
+        return balance
+
+    def get_cached_account_balance(self, timeout: Optional[float] = None) -> float:
+        """
+        Get account balance, reusing a fetch from the last 60 seconds
+
+        For display and allocation checks where a slightly old balance is
+        fine. The cache is dropped after every order and withdrawal, so it
+        never hides a balance change made by this bot. Use
+        get_account_balance() when a fresh value is required.
+
+        Args:
+            timeout: Passed to get_account_balance() on a cache miss
+
+        Returns:
+            Available USDC balance (account value)
+        """
+        balance = self._balance_cache
+        if balance is not None and time.monotonic() - self._balance_cache_time < self._balance_cache_ttl:
+            return balance
+        return self.get_account_balance(timeout=timeout)
+
+    def invalidate_balance_cache(self):
+        """Force the next get_cached_account_balance() to hit the API"""
+        self._balance_cache = None
 
     def place_market_order(self, side: str, size_usd: float, asset: str = 'BTC') -> Tuple[str, float, float]:
         """
@@ -340,10 +584,13 @@ class HyperLiquidClient:
                 raise Exception(f"Order failed: {result}")
 
         try:
-            return self._retry_operation(execute_order, f"Place {side} {asset} order")
+            result = self._retry_operation(execute_order, f"Place {side} {asset} order")
         except Exception as e:
             raise Exception(f"Failed to place {side} {asset} order: {str(e)}")
 
+        self.invalidate_balance_cache()
+        return result
+
     def get_positions(self) -> Dict:
         """
         Get current open positions
@@ -555,6 +802,7 @@ class HyperLiquidClient:
             # HyperLiquid SDK withdraw method
             # Withdraws from perp account to L1 (Arbitrum)
             result = self.exchange.withdraw(amount)
+            self.invalidate_balance_cache()
 
             if result.get('status') == 'ok':
                 return {
@@ -17,11 +17,12 @@ How it works:
 """
 
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
-import pytz
 import clickhouse_connect
 
+UTC = timezone.utc
+
 
 class MelonStrategy:
     """
@@ -205,7 +206,7 @@ class MelonStrategy:
                 """
             else:
                 # First run - only get messages from last 24 hours
-                since_ts = datetime.now(pytz.UTC) - timedelta(hours=24)
+                since_ts = datetime.now(UTC) - timedelta(hours=24)
                 query = f"""
                     SELECT created_at, raw, user_name, message_id
                     FROM messages
@@ -363,7 +364,7 @@ class MelonStrategy:
             'total_size': tokens_bought,
             'remaining_size': tokens_bought,
             'usdc_spent': usdc_spent,
-            'entry_time': datetime.now(pytz.UTC).isoformat(),
+            'entry_time': datetime.now(UTC).isoformat(),
             'tranches': tranches,
             'last_price_check': None,
             'peak_price': entry_price,
@@ -392,7 +393,7 @@ class MelonStrategy:
             return []
 
         position = self.active_positions[address]
-        position['last_price_check'] = datetime.now(pytz.UTC).isoformat()
+        position['last_price_check'] = datetime.now(UTC).isoformat()
 
         # Update peak price
         if current_price > position['peak_price']:
@@ -436,7 +437,7 @@ class MelonStrategy:
         for tranche in position['tranches']:
             if tranche['target_multiple'] == target_multiple and not tranche['sold']:
                 tranche['sold'] = True
-                tranche['sold_at'] = datetime.now(pytz.UTC).isoformat()
+                tranche['sold_at'] = datetime.now(UTC).isoformat()
                 tranche['sold_price'] = sold_price
                 tranche['usdc_received'] = usdc_received
 
@@ -15,10 +15,19 @@ WHY THIS MATTERS:
 - Heartbeat confirms bot is running (if you don't get one, bot crashed)
 """
 
+import asyncio
+import logging
+import queue
+import threading
+import time
+import orjson
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo
+
+# sendMessage bodies are pre-encoded with orjson (see _send_message)
+JSON_HEADERS = {'Content-Type': 'application/json'}
 
 
 class ConflictError(Exception):
@@ -31,6 +40,48 @@ class ConflictError(Exception):
     pass
 
 
+def _run_in_daemon_thread(func, *args):
+    """
+    Run a blocking call on a daemon thread and await its result
+
+    Unlike asyncio.to_thread, an abandoned call (e.g. a 25s Telegram long
+    poll when the bot shuts down) doesn't hold up interpreter exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        if not future.done():  # Awaiting task may have been cancelled
+            setter(value)
+
+    def runner():
+        try:
+            result = func(*args)
+        except Exception as e:
+            callback = (deliver, future.set_exception, e)
+        else:
+            callback = (deliver, future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
+# Marks the end of the background send queue (see stop_background_sender)
+_STOP_SENDER = object()
+
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+# Timezones shown in alerts (looked up once, not per message)
+UTC = timezone.utc
+LONDON_TZ = ZoneInfo('Europe/London')
+NY_TZ = ZoneInfo('America/New_York')
+
+
 class TelegramNotifier:
     """
     Sends notifications via Telegram Bot API
@@ -58,7 +109,22 @@ class TelegramNotifier:
         # Track last heartbeat to avoid spam
         self.last_heartbeat = None
 
-    def _send_message(self, text: str, parse_mode: str = 'HTML', reply_markup: dict = None) -> bool:
+        # Persistent HTTPS connection to api.telegram.org (keep-alive, no handshake per message)
+        self._session = requests.Session()
+
+        # Separate keep-alive connection for the command listener (long polls,
+        # button acks and command replies), so it never contends with the
+        # background sender - the listener uses it for one request at a time
+        self._poll_session = requests.Session()
+
+        # Background sender (see start_background_sender)
+        self._send_queue = None
+        self._sender_thread = None
+        self.batch_window_seconds = 0.2   # Wait this long for more messages to coalesce
+        self.batch_max_messages = 4       # Max messages combined into one send
+
+    def _send_message(self, text: str, parse_mode: str = 'HTML', reply_markup: dict = None,
+                      session: Optional[requests.Session] = None) -> bool:
         """
         Send message to Telegram
 
@@ -66,11 +132,11 @@ class TelegramNotifier:
             text: Message text (supports HTML formatting)
             parse_mode: 'HTML' or 'Markdown'
             reply_markup: Optional inline keyboard or reply keyboard markup
+            session: Session to send on (default: the alert session)
 
         Returns:
             True if sent successfully, False otherwise
         """
-        import json as json_module
         import logging
 
         logger = logging.getLogger('TradingBot')
@@ -91,7 +157,10 @@ class TelegramNotifier:
             if reply_markup:
                 payload['reply_markup'] = reply_markup
 
-            response = requests.post(url, json=payload, timeout=10)
+            # orjson writes emoji as raw UTF-8 (requests' json= escapes each one
+            # to a 12-byte surrogate pair) and encodes the keyboard dicts faster
+            response = (session or self._session).post(url, data=orjson.dumps(payload),
+                                                       headers=JSON_HEADERS, timeout=10)
 
             # Check for errors in response
             if response.status_code != 200:
@@ -123,8 +192,8 @@ class TelegramNotifier:
             Stop: 1% trailing stop
             Strategy: Overnight Recovery
         """
-        london_time = entry_time.astimezone(pytz.timezone('Europe/London'))
-        est_time = entry_time.astimezone(pytz.timezone('America/New_York'))
+        london_time = entry_time.astimezone(LONDON_TZ)
+        est_time = entry_time.astimezone(NY_TZ)
 
         message = f"""
 🟢 <b>ENTRY EXECUTED</b>
@@ -153,10 +222,10 @@ class TelegramNotifier:
             Hold: 18h 15m
             Reason: Trailing stop hit
         """
-        london_entry = entry_time.astimezone(pytz.timezone('Europe/London'))
-        london_exit = exit_time.astimezone(pytz.timezone('Europe/London'))
-        est_entry = entry_time.astimezone(pytz.timezone('America/New_York'))
-        est_exit = exit_time.astimezone(pytz.timezone('America/New_York'))
+        london_entry = entry_time.astimezone(LONDON_TZ)
+        london_exit = exit_time.astimezone(LONDON_TZ)
+        est_entry = entry_time.astimezone(NY_TZ)
+        est_exit = exit_time.astimezone(NY_TZ)
 
         # Calculate hold duration
         hold_duration = exit_time - entry_time
@@ -194,8 +263,8 @@ class TelegramNotifier:
 
             Action: Manual check required
         """
-        now_london = datetime.now(pytz.timezone('Europe/London'))
-        now_est = datetime.now(pytz.timezone('America/New_York'))
+        now_london = datetime.now(LONDON_TZ)
+        now_est = datetime.now(NY_TZ)
 
         message = f"""
 ⚠️ <b>ERROR - BOT PAUSED</b>
@@ -235,7 +304,7 @@ class TelegramNotifier:
             Current: No position
             Next entry: Today 20:00 GMT (15:00 EST)
         """
-        now_london = datetime.now(pytz.timezone('Europe/London'))
+        now_london = datetime.now(LONDON_TZ)
 
         position_status = "In position" if stats.get('in_position') else "No position"
         next_entry = "Today 20:00 GMT (15:00 EST)" if not stats.get('in_position') else "After current exit"
@@ -267,7 +336,7 @@ class TelegramNotifier:
             Entry: $87,432 (1h ago)
             Current: $88,200 (+0.88%)
         """
-        now = datetime.now(pytz.timezone('UTC'))
+        now = datetime.now(UTC)
 
         # Check if we should send (1 hour since last)
         if self.last_heartbeat:
@@ -276,8 +345,8 @@ class TelegramNotifier:
             if time_since_last < 3600 and not state.get('in_position'):
                 return False
 
-        now_london = now.astimezone(pytz.timezone('Europe/London'))
-        now_est = now.astimezone(pytz.timezone('America/New_York'))
+        now_london = now.astimezone(LONDON_TZ)
+        now_est = now.astimezone(NY_TZ)
 
         if state.get('in_position'):
             entry_price = state['entry_price']
@@ -286,7 +355,7 @@ class TelegramNotifier:
             profit_pct = ((current_price - entry_price) / entry_price) * 100
 
             entry_time = datetime.fromisoformat(state['entry_time'])
-            time_in_position = now - entry_time.replace(tzinfo=pytz.UTC)
+            time_in_position = now - entry_time.replace(tzinfo=UTC)
             hours = int(time_in_position.total_seconds() // 3600)
 
             message = f"""
@@ -388,7 +457,7 @@ Bot is ready to trade.
 
         try:
             url = f"{self.base_url}/setMyCommands"
-            response = requests.post(url, json={"commands": commands}, timeout=10)
+            response = self._session.post(url, json={"commands": commands}, timeout=10)
 
             if response.status_code == 200:
                 result = response.json()
@@ -430,7 +499,7 @@ Bot is ready to trade.
             if offset:
                 params['offset'] = offset
 
-            response = requests.get(url, params=params, timeout=timeout + 5)
+            response = self._poll_session.get(url, params=params, timeout=timeout + 5)
 
             # Check for 409 Conflict - means another instance is polling
             if response.status_code == 409:
@@ -460,107 +529,304 @@ Bot is ready to trade.
             return []
 
 
-    def start_listening_for_commands(self, command_handler):
+    def _read_update(self, update: dict, command_handler) -> Optional[tuple]:
         """
-        Start listening for incoming Telegram commands in background thread
+        Pull the command out of one Telegram update (command message or button click)
 
         Args:
+            update: Update dict from getUpdates
             command_handler: CommandHandler instance to process commands
 
-        This starts a background thread that continuously polls Telegram
-        for new messages and processes them as commands.
+        Returns:
+            Tuple of (chat_id, text, callback_id) - callback_id is None for
+            messages - or None if the update needs no processing
+        """
+        logger = logging.getLogger('TradingBot')
+
+        # Handle callback queries (button clicks)
+        if 'callback_query' in update:
+            callback = update['callback_query']
+            chat_id = callback['message']['chat']['id']
+            data = callback['data']
+
+            # Drop other chats before any logging or API calls (the handler logs them once)
+            if hasattr(command_handler, 'is_authorized_chat') and not command_handler.is_authorized_chat(chat_id):
+                return None
+
+            logger.info(f"Button clicked: {data} from chat {chat_id}")
+            return chat_id, data, callback['id']
+
+        # Extract message
+        if 'message' not in update:
+            return None
+
+        message = update['message']
+
+        # Only process text messages
+        if 'text' not in message:
+            return None
+
+        # Extract details
+        chat_id = message['chat']['id']
+        text = message['text']
+
+        if hasattr(command_handler, 'is_authorized_chat') and not command_handler.is_authorized_chat(chat_id):
+            return None
+
+        # Log received command
+        logger.info(f"Received command: '{text}' from chat {chat_id}")
+        return chat_id, text, None
+
+    def _answer_callback(self, callback_id: str):
+        """Answer a button click so Telegram removes its loading state"""
+        answer_url = f"{self.base_url}/answerCallbackQuery"
+        self._poll_session.post(answer_url, json={'callback_query_id': callback_id}, timeout=10)
+
+    def _process_update(self, chat_id, text: str, callback_id: Optional[str], command_handler):
         """
-        import threading
-        import logging
-        import sys
+        Run a command or button click through the command handler
+
+        Returns:
+            Tuple of (response message, keyboard)
+        """
+        if callback_id is not None and hasattr(command_handler, 'process_callback'):
+            return command_handler.process_callback(text, str(chat_id))
+        return command_handler.process_command(text, str(chat_id))
+
+    def _send_reply(self, chat_id, text: str, response_msg: str, keyboard: Optional[dict]):
+        """Send the reply to a processed command"""
+        logger = logging.getLogger('TradingBot')
+
+        if response_msg:
+            logger.info(f"Sending response to chat {chat_id}")
+            success = self._send_message(response_msg, reply_markup=keyboard,
+                                         session=self._poll_session)
+            if not success:
+                logger.error(f"Failed to send response to chat {chat_id}")
+        else:
+            logger.warning(f"No response generated for command: {text}")
 
-        # Get logger for the polling thread
+    async def listen_for_commands(self, command_handler, poll_interval: float = 0.5,
+                                  long_poll_timeout: int = 25, lock: Optional[asyncio.Lock] = None):
+        """
+        Poll Telegram for commands and process them (run as an asyncio task)
+
+        Args:
+            command_handler: CommandHandler instance to process commands
+            poll_interval: Minimum seconds between getUpdates calls
+            long_poll_timeout: Seconds Telegram holds each getUpdates open
+            lock: Optional asyncio.Lock held while a state-changing command
+                  runs, so it never interleaves with the bot's own trading work
+
+        Runs on the bot's event loop: the long poll waits on a daemon
+        thread (so shutdown never waits for it), and each command runs on
+        a worker thread. Only commands the handler reports as changing
+        state (see CommandHandler.changes_state) take `lock`, and only
+        while they run - Telegram API calls (button answers, replies)
+        happen outside it, so a slow Telegram never holds up trading.
+        Cancel the task to stop listening.
+
+        WHY poll_interval: getUpdates long-polls, so normally the server
+        blocks for us. But when it fails fast (network down, Telegram
+        errors) get_updates() returns [] immediately and the loop would
+        spin flat out. The interval caps it at a few requests per second.
+        """
+        logger = logging.getLogger('TradingBot')
+        logger.info("Telegram polling loop started")
+
+        offset = None  # Track last update ID
+
+        while True:
+            poll_started = time.monotonic()
+            try:
+                # Get updates from Telegram (long poll - server waits for messages)
+                updates = await _run_in_daemon_thread(self.get_updates, offset, long_poll_timeout)
+
+                for update in updates:
+                    # Update offset to acknowledge this message
+                    offset = update['update_id'] + 1
+
+                    request = self._read_update(update, command_handler)
+                    if request is None:
+                        continue
+
+                    chat_id, text, callback_id = request
+                    if callback_id is not None:
+                        await asyncio.to_thread(self._answer_callback, callback_id)
+
+                    if lock is not None and (not hasattr(command_handler, 'changes_state') or
+                                             command_handler.changes_state(text, str(chat_id), callback_id is not None)):
+                        async with lock:
+                            reply = await asyncio.to_thread(self._process_update, chat_id, text,
+                                                            callback_id, command_handler)
+                    else:
+                        reply = await asyncio.to_thread(self._process_update, chat_id, text,
+                                                        callback_id, command_handler)
+
+                    await asyncio.to_thread(self._send_reply, chat_id, text, *reply)
+
+                # Don't spin if getUpdates returned early (errors / 0s timeout)
+                remaining = poll_interval - (time.monotonic() - poll_started)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+            except ConflictError as e:
+                # Another bot instance is running - exit with clear error
+                logger.error(f"🛑 CONFLICT: {e}")
+                print(f"\n🛑 FATAL ERROR: {e}")
+                print("Telegram polling stopped. Only ONE bot instance can run at a time.")
+                return  # Exit the polling loop, don't retry
+            except Exception as e:
+                logger.error(f"Error in Telegram polling loop: {e}", exc_info=True)
+                await asyncio.sleep(5)  # Wait before retrying
+
+    def start_background_sender(self, maxsize: int = 256):
+        """
+        Start a worker thread that delivers queued notifications
+
+        Telegram can take hundreds of ms to respond (or time out after 10s).
+        Alerts queued with queue_message()/queue_error_alert() are formatted
+        and sent on this thread so the trading loop never waits on Telegram.
+        Plain messages queued close together (within batch_window_seconds)
+        are combined into one Telegram message.
+
+        Args:
+            maxsize: Max queued notifications. When full, the OLDEST one is
+                     dropped so the queue can't grow without bound.
+        """
+        if self._sender_thread is not None:
+            return
+
+        self._send_queue = queue.Queue(maxsize=maxsize)
+        self._sender_thread = threading.Thread(target=self._sender_loop, daemon=True)
+        self._sender_thread.start()
+
+    def stop_background_sender(self, timeout: float = 15):
+        """
+        Flush pending notifications and stop the worker thread
+
+        Call on shutdown so the final "Bot Stopped" message isn't lost.
+
+        Args:
+            timeout: Max seconds to wait for the queue to drain
+        """
+        if self._sender_thread is None:
+            return
+
+        # Sentinel - worker exits after sending everything queued before it
+        try:
+            self._send_queue.put(_STOP_SENDER, timeout=timeout)
+        except queue.Full:
+            pass
+        self._sender_thread.join(timeout)
+
+        # A worker still draining keeps its queue - clearing it would only
+        # send later alerts directly while it is still sending
+        if not self._sender_thread.is_alive():
+            self._sender_thread = None
+            self._send_queue = None
+
+    def _sender_loop(self):
+        """
+        Background thread: send queued notifications in order
+
+        Queue items are either message text (str), a (send_method, args)
+        tuple for other alert types, or the stop sentinel.
+        """
         logger = logging.getLogger('TradingBot')
+        send_queue = self._send_queue  # stop_background_sender() may clear the attribute
+        pending = None  # Item pulled while batching that belongs to the next send
+
+        while True:
+            if pending is not None:
+                item, pending = pending, None
+            else:
+                item = send_queue.get()
 
-        def polling_loop():
-            """Background thread for polling Telegram"""
-            logger.info("Telegram polling loop started")
+            if item is _STOP_SENDER:
+                return
 
-            offset = None  # Track last update ID
+            try:
+                if isinstance(item, str):
+                    batch, pending = self._collect_batch(item, send_queue)
+                    self._send_message("\n\n".join(batch))
+                else:
+                    send_method, args = item
+                    send_method(*args)
+            except Exception as e:
+                logger.error(f"Background Telegram send failed: {e}")
 
-            while True:
+    def _collect_batch(self, first: str, send_queue: queue.Queue):
+        """
+        Gather more queued messages to send together with `first`
+
+        Waits up to batch_window_seconds for up to batch_max_messages
+        messages on `send_queue` that still fit in one Telegram message.
+
+        Returns:
+            Tuple of (list of message texts, next non-batchable item or None)
+        """
+        batch = [first]
+        length = len(first)
+        deadline = time.monotonic() + self.batch_window_seconds
+
+        while len(batch) < self.batch_max_messages:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = send_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            if not isinstance(item, str) or length + len(item) + 2 > TELEGRAM_MAX_MESSAGE_LENGTH:
+                return batch, item
+
+            batch.append(item)
+            length += len(item) + 2
+
+        return batch, None
+
+    def _enqueue(self, send_queue: queue.Queue, item):
+        """Put an item on the send queue, dropping the oldest entry if full"""
+        while True:
+            try:
+                send_queue.put_nowait(item)
+                return
+            except queue.Full:
                 try:
-                    # Get updates from Telegram
-                    updates = self.get_updates(offset, timeout=30)
-
-                    for update in updates:
-                        # Update offset to acknowledge this message
-                        offset = update['update_id'] + 1
-
-                        # Handle callback queries (button clicks)
-                        if 'callback_query' in update:
-                            callback = update['callback_query']
-                            callback_id = callback['id']
-                            chat_id = callback['message']['chat']['id']
-                            data = callback['data']
-
-                            logger.info(f"Button clicked: {data} from chat {chat_id}")
-
-                            # Answer callback to remove loading state
-                            answer_url = f"{self.base_url}/answerCallbackQuery"
-                            requests.post(answer_url, json={'callback_query_id': callback_id})
-
-                            # Process the callback (button click)
-                            if hasattr(command_handler, 'process_callback'):
-                                response_msg, keyboard = command_handler.process_callback(data, str(chat_id))
-                            else:
-                                response_msg, keyboard = command_handler.process_command(data, str(chat_id))
-
-                            if response_msg:
-                                self._send_message(response_msg, reply_markup=keyboard)
-                            continue
-
-                        # Extract message
-                        if 'message' not in update:
-                            continue
-
-                        message = update['message']
-
-                        # Only process text messages
-                        if 'text' not in message:
-                            continue
-
-                        # Extract details
-                        chat_id = message['chat']['id']
-                        text = message['text']
-
-                        # Log received command
-                        logger.info(f"Received command: '{text}' from chat {chat_id}")
-
-                        # Process command
-                        response_msg, keyboard = command_handler.process_command(text, str(chat_id))
-
-                        # Send response
-                        if response_msg:
-                            logger.info(f"Sending response to chat {chat_id}")
-                            success = self._send_message(response_msg, reply_markup=keyboard)
-                            if not success:
-                                logger.error(f"Failed to send response to chat {chat_id}")
-                        else:
-                            logger.warning(f"No response generated for command: {text}")
-
-                except KeyboardInterrupt:
-                    logger.info("Telegram listener stopped by keyboard interrupt")
-                    break
-                except ConflictError as e:
-                    # Another bot instance is running - exit with clear error
-                    logger.error(f"🛑 CONFLICT: {e}")
-                    print(f"\n🛑 FATAL ERROR: {e}")
-                    print("Telegram polling stopped. Only ONE bot instance can run at a time.")
-                    break  # Exit the polling loop, don't retry
-                except Exception as e:
-                    logger.error(f"Error in Telegram polling loop: {e}", exc_info=True)
-                    import time
-                    time.sleep(5)  # Wait before retrying
-
-        # Start polling thread
-        thread = threading.Thread(target=polling_loop, daemon=True)
-        thread.start()
+                    send_queue.get_nowait()
+                    logging.getLogger('TradingBot').warning("Telegram queue full - dropped oldest notification")
+                except queue.Empty:
+                    pass
+
+    def queue_message(self, text: str):
+        """
+        Send a message without blocking the caller
+
+        Falls back to a direct send if the background sender isn't running.
+
+        Args:
+            text: Message text (supports HTML formatting)
+        """
+        send_queue = self._send_queue
+        if send_queue is None:
+            self._send_message(text)
+            return
+        self._enqueue(send_queue, text)
+
+    def queue_error_alert(self, error_msg: str, current_position: Optional[dict] = None):
+        """
+        Send an error alert without blocking the caller
+
+        Same message as send_error_alert(), but formatted and sent on the
+        background sender thread.
+        """
+        send_queue = self._send_queue
+        if send_queue is None:
+            self.send_error_alert(error_msg, current_position)
+            return
+        self._enqueue(send_queue, (self.send_error_alert, (error_msg, current_position)))
 
     def send_message(self, text: str) -> bool:
         """
@@ -601,7 +867,7 @@ if __name__ == '__main__':
         price=87432.50,
         size_btc=1.1435,
         size_usd=100000,
-        entry_time=datetime.now(pytz.UTC),
+        entry_time=datetime.now(UTC),
         trailing_stop_pct=1.0
     )
 
@@ -23,9 +23,15 @@ Key Difference vs Backtest:
 
 import requests
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, List
-import pytz
+
+try:
+    from src.strategy import EntryReason   # imported by bot.py - same module it uses
+except ImportError:
+    from strategy import EntryReason       # run directly: python src/oi_strategy.py
+
+UTC = timezone.utc
 
 
 class BinanceOIFetcher:
@@ -82,7 +88,7 @@ class BinanceOIFetcher:
             oi_data = []
             for item in data:
                 oi_data.append({
-                    'timestamp': datetime.fromtimestamp(item['timestamp'] / 1000, tz=pytz.UTC),
+                    'timestamp': datetime.fromtimestamp(item['timestamp'] / 1000, tz=UTC),
                     'oi': float(item['sumOpenInterest'])  # OI in BTC
                 })
 
@@ -115,7 +121,7 @@ class BinanceOIFetcher:
             price_data = []
             for candle in data:
                 price_data.append({
-                    'timestamp': datetime.fromtimestamp(candle[0] / 1000, tz=pytz.UTC),
+                    'timestamp': datetime.fromtimestamp(candle[0] / 1000, tz=UTC),
                     'close': float(candle[4])
                 })
 
@@ -135,7 +141,7 @@ class BinanceOIFetcher:
         Returns:
             True if data was refreshed successfully
         """
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
 
         # Check cache TTL
         if not force and self._last_fetch:
@@ -278,7 +284,8 @@ class OIStrategy:
         # Track last trade time for cooldown
         self.last_trade_time = None
 
-    def should_enter(self, current_time: datetime, current_price: float) -> Tuple[bool, str]:
+    def should_enter(self, current_time: datetime,
+                     current_price: float) -> Tuple[bool, EntryReason, str]:
         """
         Decide if we should BUY right now
 
@@ -293,41 +300,41 @@ class OIStrategy:
             current_price: Current BTC price (from HyperLiquid)
 
         Returns:
-            (should_buy, reason) - True/False and explanation
+            (should_buy, reason_code, reason) - True/False, EntryReason and explanation
         """
         # Refresh OI data from Binance
         if not self.oi_fetcher.refresh_data():
-            return False, "Failed to fetch OI data from Binance"
+            return False, EntryReason.OTHER_BLOCK, "Failed to fetch OI data from Binance"
 
         # Check cooldown
         if self.last_trade_time:
             hours_since_trade = (current_time - self.last_trade_time).total_seconds() / 3600
             if hours_since_trade < self.min_hours_between_trades:
-                return False, f"Cooldown active ({hours_since_trade:.1f}h < {self.min_hours_between_trades}h)"
+                return False, EntryReason.COOLDOWN, f"Cooldown active ({hours_since_trade:.1f}h < {self.min_hours_between_trades}h)"
 
         # Check OI change
         oi_change = self.oi_fetcher.get_oi_change_pct(self.oi_lookback_hours)
         if oi_change is None:
-            return False, "Could not calculate OI change"
+            return False, EntryReason.OTHER_BLOCK, "Could not calculate OI change"
 
         if oi_change > self.oi_drop_threshold:
-            return False, f"OI not dropping enough ({oi_change:+.2f}% > {self.oi_drop_threshold}%)"
+            return False, EntryReason.OTHER_BLOCK, f"OI not dropping enough ({oi_change:+.2f}% > {self.oi_drop_threshold}%)"
 
         # Check price change (using Binance data for consistency with OI)
         price_change = self.oi_fetcher.get_price_change_pct(self.oi_lookback_hours)
         if price_change is None:
-            return False, "Could not calculate price change"
+            return False, EntryReason.OTHER_BLOCK, "Could not calculate price change"
 
         if price_change > self.price_drop_threshold:
-            return False, f"Price not dropping enough ({price_change:+.2f}% > {self.price_drop_threshold}%)"
+            return False, EntryReason.OTHER_BLOCK, f"Price not dropping enough ({price_change:+.2f}% > {self.price_drop_threshold}%)"
 
         # Check SMA distance
         sma_distance = self.oi_fetcher.get_distance_from_sma_pct(self.sma_hours)
         if sma_distance is None:
-            return False, "Could not calculate SMA distance"
+            return False, EntryReason.OTHER_BLOCK, "Could not calculate SMA distance"
 
         if sma_distance > self.sma_distance_threshold:
-            return False, f"Price not far enough below SMA ({sma_distance:+.2f}% > {self.sma_distance_threshold}%)"
+            return False, EntryReason.OTHER_BLOCK, f"Price not far enough below SMA ({sma_distance:+.2f}% > {self.sma_distance_threshold}%)"
 
         # All conditions met!
         self.last_trade_time = current_time
@@ -337,7 +344,7 @@ class OIStrategy:
                   f"OI: {oi_change:+.2f}% (threshold: {self.oi_drop_threshold}%), "
                   f"Price: {price_change:+.2f}%, "
                   f"Below SMA: {sma_distance:+.2f}% (SMA: ${sma:,.0f})")
-        return True, reason
+        return True, EntryReason.OK, reason
 
     def should_exit(self, current_price: float, entry_price: float,
                     peak_price: float) -> Tuple[bool, str]:
@@ -462,10 +469,10 @@ if __name__ == '__main__':
 
         # Test entry logic
         print("\nTesting Entry Logic:")
-        test_time = datetime.now(pytz.UTC)
+        test_time = datetime.now(UTC)
         test_price = diag['current_price_binance'] or 95000
 
-        should_buy, reason = strategy.should_enter(test_time, test_price)
+        should_buy, _, reason = strategy.should_enter(test_time, test_price)
         print(f"  Should Enter: {should_buy}")
         print(f"  Reason: {reason}")
 
@@ -18,9 +18,10 @@ In our October-November backtest, the strategy lost -27%. A 5% daily loss
 limit would have stopped trading on Day 1, preventing most losses.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Tuple, Dict
-import pytz
+
+UTC = timezone.utc
 
 
 class RiskManager:
@@ -128,17 +129,17 @@ class RiskManager:
             (is_safe, reason)
 
         Example:
-            >>> last_update = datetime.now(pytz.UTC) - timedelta(minutes=15)
+            >>> last_update = datetime.now(UTC) - timedelta(minutes=15)
             >>> is_safe, reason = risk_mgr.check_data_staleness(last_update)
             >>> if not is_safe:
             ...     print(f"CIRCUIT BREAKER: {reason}")
             CIRCUIT BREAKER: Price data stale (15.0 minutes old, max: 10)
         """
-        now = datetime.now(pytz.UTC)
+        now = datetime.now(UTC)
 
         # Ensure last_update is timezone-aware
         if last_update.tzinfo is None:
-            last_update = last_update.replace(tzinfo=pytz.UTC)
+            last_update = last_update.replace(tzinfo=UTC)
 
         # Calculate age
         age = (now - last_update).total_seconds() / 60  # Convert to minutes
@@ -157,7 +158,7 @@ class RiskManager:
             (is_safe, reason) - False if ANY circuit breaker triggered
 
         Example:
-            >>> is_safe, reason = risk_mgr.check_all_conditions(95000, 100000, 2, datetime.now(pytz.UTC))
+            >>> is_safe, reason = risk_mgr.check_all_conditions(95000, 100000, 2, datetime.now(UTC))
             >>> if not is_safe:
             ...     bot.pause_trading()
             ...     notifier.send_circuit_breaker_alert(reason)
@@ -246,7 +247,7 @@ class RiskManager:
             current_balance: Current balance (becomes new initial_balance)
         """
         self.initial_balance = current_balance
-        self.reset_time = datetime.now(pytz.UTC)
+        self.reset_time = datetime.now(UTC)
         print(f"✅ Daily risk limits reset. Starting balance: ${current_balance:,.2f}")
 
     def __str__(self):
@@ -286,11 +287,11 @@ if __name__ == '__main__':
 
     # Test 3: Data staleness
     print("\nTest 3: Data Staleness")
-    fresh_time = datetime.now(pytz.UTC) - timedelta(minutes=2)
+    fresh_time = datetime.now(UTC) - timedelta(minutes=2)
     is_safe, reason = risk_mgr.check_data_staleness(fresh_time)
     print(f"  2 min old: {is_safe} - {reason}")
 
-    stale_time = datetime.now(pytz.UTC) - timedelta(minutes=15)
+    stale_time = datetime.now(UTC) - timedelta(minutes=15)
     is_safe, reason = risk_mgr.check_data_staleness(stale_time)
     print(f"  15 min old: {is_safe} - {reason}")
 
@@ -300,7 +301,7 @@ if __name__ == '__main__':
         current_balance=97000,
         initial_balance=100000,
         consecutive_losses=1,
-        last_data_update=datetime.now(pytz.UTC)
+        last_data_update=datetime.now(UTC)
     )
     print(f"  Normal conditions: {is_safe} - {reason}")
 
@@ -308,7 +309,7 @@ if __name__ == '__main__':
         current_balance=94000,  # -6% loss
         initial_balance=100000,
         consecutive_losses=1,
-        last_data_update=datetime.now(pytz.UTC)
+        last_data_update=datetime.now(UTC)
     )
     print(f"  Excessive loss: {is_safe} - {reason}")
 
@@ -63,6 +63,9 @@ class SolanaDEXClient:
         self.retry_attempts = retry_attempts
         self.priority_fee_lamports = priority_fee_lamports
 
+        # Keep-alive connections to DexScreener and Jupiter, reused across calls
+        self._session = requests.Session()
+
         # Initialize keypair from private key
         try:
             # Private key can be base58 string or list of bytes
@@ -122,7 +125,7 @@ class SolanaDEXClient:
         """
         def fetch_price():
             url = f"{self.DEXSCREENER_API}/tokens/{token_address}"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
 
             if response.status_code == 429:
                 raise Exception("Rate limited (429)")
@@ -155,7 +158,7 @@ class SolanaDEXClient:
         """
         def fetch_info():
             url = f"{self.DEXSCREENER_API}/tokens/{token_address}"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
 
             if response.status_code == 429:
                 raise Exception("Rate limited (429)")
@@ -323,7 +326,7 @@ class SolanaDEXClient:
             "slippageBps": slippage_bps,
         }
 
-        response = requests.get(url, params=params, timeout=30)
+        response = self._session.get(url, params=params, timeout=30)
 
         if response.status_code == 429:
             raise Exception("Jupiter rate limited (429)")
@@ -350,7 +353,7 @@ class SolanaDEXClient:
             "prioritizationFeeLamports": self.priority_fee_lamports,  # High priority for fast execution
         }
 
-        response = requests.post(url, json=payload, timeout=30)
+        response = self._session.post(url, json=payload, timeout=30)
 
         if response.status_code == 429:
             raise Exception("Jupiter rate limited (429)")
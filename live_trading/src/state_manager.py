@@ -9,15 +9,93 @@ Each strategy has its own:
 - Enabled/disabled status
 
 State is persisted to JSON so the bot can resume after restart.
+
+How it works:
+- state.json holds a full snapshot of the state
+- Frequent small changes (peak price updates, entry check results) are
+  appended as one JSON line each to changelog.jsonl instead of rewriting
+  the whole snapshot
+- Every SNAPSHOT_EVERY_CHANGES changes or SNAPSHOT_INTERVAL_SECONDS, and on
+  any entry/exit/config change, a fresh snapshot is written and the
+  changelog is truncated
+- On startup the snapshot is loaded and the changelog replayed on top
+
+WHY: With price streaming the peak price can move many times a minute, and
+rewriting (and backing up) the whole state file with its trade history on
+every tick costs far more than appending a ~80 byte line.
 """
 
-import json
 import os
 import shutil
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, List
 from pathlib import Path
 
+import orjson
+
+
+# Write a full snapshot (and truncate the changelog) after this many
+# changelog entries, or once this much time has passed since the last one
+SNAPSHOT_EVERY_CHANGES = 500
+SNAPSHOT_INTERVAL_SECONDS = 300
+
+
+class StateSnapshot:
+    """
+    Read-only view of strategy state taken at one moment
+
+    Created once per loop iteration by StateManager.snapshot() so the
+    per-strategy handlers read plain dict copies instead of going back to
+    the manager (and its lock) for every field. Mirrors the StateManager
+    getter names, so either can be passed where reads are needed.
+    Writes (enter/exit/peak updates) still go through StateManager.
+    """
+
+    def __init__(self, strategies: Dict[str, Dict], daily_pnl: float):
+        self._strategies = strategies
+        self._daily_pnl = daily_pnl
+
+    def _get(self, strategy_name: str) -> Dict:
+        return self._strategies.get(strategy_name, {})
+
+    def get_enabled_strategies(self) -> List[str]:
+        """Get list of enabled strategy names"""
+        return [name for name, s in self._strategies.items() if s.get('enabled', False)]
+
+    def is_in_position(self, strategy_name: str) -> bool:
+        """Check if a strategy is in a position"""
+        return self._get(strategy_name).get('in_position', False)
+
+    def get_strategy_capital(self, strategy_name: str) -> float:
+        """Get allocated capital for a strategy"""
+        return self._get(strategy_name).get('allocated_capital_usd', 0)
+
+    def get_risk_metrics(self, strategy_name: str) -> Dict:
+        """Get risk metrics for circuit breakers"""
+        s = self._get(strategy_name)
+        return {
+            'daily_pnl': self._daily_pnl,
+            'consecutive_losses': s.get('consecutive_losses', 0),
+            'last_trade_result': s.get('last_trade_result')
+        }
+
+    def get_position_details(self, strategy_name: str) -> Optional[Dict]:
+        """Get current position details (None if flat)"""
+        s = self._get(strategy_name)
+        if not s.get('in_position'):
+            return None
+        return {
+            'strategy': strategy_name,
+            'in_position': True,
+            'entry_time': s['entry_time'],
+            'entry_price': s['entry_price'],
+            'size_btc': s['position_size_btc'],
+            'size_usd': s['position_size_usd'],
+            'peak_price': s['peak_price']
+        }
+
 
 class StateManager:
     """
@@ -36,10 +114,21 @@ class StateManager:
         self.state_dir = Path(state_dir)
         self.state_file = self.state_dir / 'state.json'
         self.backup_file = self.state_dir / 'state_backup.json'
+        self.changelog_file = self.state_dir / 'changelog.jsonl'
 
         # Create directory if doesn't exist
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+        # Append-only log of changes since the last snapshot (unbuffered, so
+        # each entry reaches the OS in a single write as soon as it is made)
+        self._log = open(self.changelog_file, 'ab', buffering=0)
+        self._changes_since_snapshot = 0
+        self._last_snapshot = time.monotonic()
+
+        # Guards state writes - strategies are processed concurrently on worker
+        # threads and Telegram commands (e.g. parallel /close) run on their own
+        self._lock = threading.RLock()
+
         # Current state (in memory)
         self.state = {
             # Per-strategy positions and config
@@ -77,51 +166,142 @@ class StateManager:
         """
         Load state from disk
 
+        Loads the last snapshot, then replays any changelog entries written
+        after it.
+
         Returns:
             State dictionary
         """
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    self.state = json.load(f)
+                self.state = orjson.loads(self.state_file.read_bytes())
                 print(f"State loaded from {self.state_file}")
+                self._replay_changelog()
                 return self.state
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Corrupt state file: {e}")
                 if self.backup_file.exists():
                     try:
-                        with open(self.backup_file, 'r') as f:
-                            self.state = json.load(f)
+                        self.state = orjson.loads(self.backup_file.read_bytes())
                         print(f"State recovered from backup")
+                        self._replay_changelog()
                         self.save_state()
                         return self.state
                     except:
                         print(f"Backup also corrupt, starting fresh")
 
         print(f"No state found, starting fresh")
+        self._replay_changelog()
         return self.state
 
-    def save_state(self):
-        """Save current state to disk"""
-        try:
-            self.state['last_updated'] = datetime.utcnow().isoformat()
+    def _replay_changelog(self):
+        """
+        Apply changelog entries written since the last snapshot
+
+        Entries only set fields, so replaying one that already made it into
+        the snapshot is harmless. A truncated last line (crash mid-write)
+        is skipped.
+        """
+        if not self.changelog_file.exists():
+            return
+
+        applied = 0
+        with open(self.changelog_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    print(f"Skipping corrupt changelog line")
+                    continue
+                self.ensure_strategy_exists(entry['strategy'])
+                self.state['strategies'][entry['strategy']].update(entry['fields'])
+                applied += 1
+
+        if applied:
+            print(f"Replayed {applied} changelog entries")
+            self.save_state()
 
-            if self.state_file.exists():
-                shutil.copy(self.state_file, self.backup_file)
+    def save_state(self, sync: bool = False):
+        """
+        Save a full snapshot of the current state to disk
 
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+        The changelog is truncated afterwards since the snapshot now
+        contains everything in it.
+
+        Args:
+            sync: fsync the snapshot before returning (use for position
+                  entries/exits, which must survive a power loss)
+        """
+        try:
+            with self._lock:
+                self.state['last_updated'] = datetime.utcnow().isoformat()
+
+                if self.state_file.exists():
+                    shutil.copy(self.state_file, self.backup_file)
+
+                data = orjson.dumps(self.state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+                with open(self.state_file, 'wb') as f:
+                    f.write(data)
+                    if sync:
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                # After close() the snapshot alone is the record - nothing to truncate
+                if not self._log.closed:
+                    self._log.seek(0)
+                    self._log.truncate()
+                self._changes_since_snapshot = 0
+                self._last_snapshot = time.monotonic()
 
         except Exception as e:
             print(f"ERROR saving state: {e}")
             raise
 
+    def _append_change(self, op: str, strategy_name: str, fields: Dict):
+        """
+        Record a small change in the changelog instead of rewriting state.json
+
+        Falls back to a full snapshot once enough changes (or time) have
+        built up, which keeps the changelog and startup replay short.
+
+        Args:
+            op: Short label for the change (e.g. 'peak'), for reading the log
+            strategy_name: Strategy whose fields changed
+            fields: Field values to set on the strategy's state
+        """
+        with self._lock:
+            if self._log.closed:
+                # Change landed after close() (e.g. an order that filled during
+                # shutdown) - write it straight into a snapshot instead
+                self.save_state(sync=True)
+                return
+
+            self._log.write(orjson.dumps({
+                'op': op,
+                'strategy': strategy_name,
+                'fields': fields,
+                'ts': datetime.utcnow().isoformat()
+            }, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
+            self._changes_since_snapshot += 1
+
+            if (self._changes_since_snapshot >= SNAPSHOT_EVERY_CHANGES or
+                    time.monotonic() - self._last_snapshot >= SNAPSHOT_INTERVAL_SECONDS):
+                self.save_state()
+
+    def close(self):
+        """Write a final snapshot if there are unsaved changes and close the changelog"""
+        with self._lock:
+            if self._changes_since_snapshot:
+                self.save_state(sync=True)
+            self._log.close()
+
     def ensure_strategy_exists(self, strategy_name: str):
         """Ensure strategy exists in state"""
-        if 'strategies' not in self.state:
-            self.state['strategies'] = {}
-        if strategy_name not in self.state['strategies']:
-            self.state['strategies'][strategy_name] = self._get_default_strategy_state()
+        with self._lock:
+            if 'strategies' not in self.state:
+                self.state['strategies'] = {}
+            if strategy_name not in self.state['strategies']:
+                self.state['strategies'][strategy_name] = self._get_default_strategy_state()
 
     def enable_strategy(self, strategy_name: str, capital_usd: float):
         """
@@ -131,15 +311,16 @@ class StateManager:
             strategy_name: Name of the strategy
             capital_usd: USD amount to allocate
         """
-        self.ensure_strategy_exists(strategy_name)
-        s = self.state['strategies'][strategy_name]
-        s['enabled'] = True
-        s['allocated_capital_usd'] = capital_usd
-        # Only set enabled_since if not already set (preserve original start date)
-        if not s.get('enabled_since'):
-            s['enabled_since'] = datetime.utcnow().isoformat()
-        self.save_state()
-        print(f"Strategy '{strategy_name}' enabled with ${capital_usd:,.0f}")
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            s = self.state['strategies'][strategy_name]
+            s['enabled'] = True
+            s['allocated_capital_usd'] = capital_usd
+            # Only set enabled_since if not already set (preserve original start date)
+            if not s.get('enabled_since'):
+                s['enabled_since'] = datetime.utcnow().isoformat()
+            self.save_state()
+            print(f"Strategy '{strategy_name}' enabled with ${capital_usd:,.0f}")
 
     def disable_strategy(self, strategy_name: str):
         """
@@ -148,10 +329,11 @@ class StateManager:
         Args:
             strategy_name: Name of the strategy
         """
-        self.ensure_strategy_exists(strategy_name)
-        self.state['strategies'][strategy_name]['enabled'] = False
-        self.save_state()
-        print(f"Strategy '{strategy_name}' disabled")
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            self.state['strategies'][strategy_name]['enabled'] = False
+            self.save_state()
+            print(f"Strategy '{strategy_name}' disabled")
 
     def is_strategy_enabled(self, strategy_name: str) -> bool:
         """Check if strategy is enabled"""
@@ -187,18 +369,19 @@ class StateManager:
             size_btc: How much BTC we bought
             size_usd: How much USD we spent
         """
-        self.ensure_strategy_exists(strategy_name)
-        s = self.state['strategies'][strategy_name]
-        s['in_position'] = True
-        s['entry_time'] = entry_time.isoformat()
-        s['last_trade_time'] = entry_time.isoformat()  # Persists after exit
-        s['entry_price'] = entry_price
-        s['position_size_btc'] = size_btc
-        s['position_size_usd'] = size_usd
-        s['peak_price'] = entry_price
-
-        self.save_state()
-        print(f"[{strategy_name}] Position entered: {size_btc:.4f} BTC @ ${entry_price:,.2f}")
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            s = self.state['strategies'][strategy_name]
+            s['in_position'] = True
+            s['entry_time'] = entry_time.isoformat()
+            s['last_trade_time'] = entry_time.isoformat()  # Persists after exit
+            s['entry_price'] = entry_price
+            s['position_size_btc'] = size_btc
+            s['position_size_usd'] = size_usd
+            s['peak_price'] = entry_price
+
+            self.save_state(sync=True)
+            print(f"[{strategy_name}] Position entered: {size_btc:.4f} BTC @ ${entry_price:,.2f}")
 
     def update_peak_price(self, strategy_name: str, new_price: float) -> Optional[float]:
         """
@@ -211,17 +394,18 @@ class StateManager:
         Returns:
             Current peak price
         """
-        self.ensure_strategy_exists(strategy_name)
-        s = self.state['strategies'][strategy_name]
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            s = self.state['strategies'][strategy_name]
 
-        if not s['in_position']:
-            return None
+            if not s['in_position']:
+                return None
 
-        if new_price > s['peak_price']:
-            s['peak_price'] = new_price
-            self.save_state()
+            if new_price > s['peak_price']:
+                s['peak_price'] = new_price
+                self._append_change('peak', strategy_name, {'peak_price': new_price})
 
-        return s['peak_price']
+            return s['peak_price']
 
     def exit_position(self, strategy_name: str, exit_time: datetime, exit_price: float, profit_pct: float):
         """
@@ -233,57 +417,59 @@ class StateManager:
             exit_price: Price we sold at
             profit_pct: Profit percentage
         """
-        self.ensure_strategy_exists(strategy_name)
-        s = self.state['strategies'][strategy_name]
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            s = self.state['strategies'][strategy_name]
 
-        # Calculate PnL
-        pnl_usd = (exit_price - s['entry_price']) * s['position_size_btc']
+            # Calculate PnL
+            pnl_usd = (exit_price - s['entry_price']) * s['position_size_btc']
 
-        # Update daily PnL (global)
-        self.state['daily_pnl'] += pnl_usd
+            # Update daily PnL (global)
+            self.state['daily_pnl'] += pnl_usd
 
-        # Update strategy stats
-        s['trade_count'] = s.get('trade_count', 0) + 1
-        s['total_realized_pnl'] = s.get('total_realized_pnl', 0) + pnl_usd
+            # Update strategy stats
+            s['trade_count'] = s.get('trade_count', 0) + 1
+            s['total_realized_pnl'] = s.get('total_realized_pnl', 0) + pnl_usd
 
-        # Update consecutive losses
-        if profit_pct < 0:
-            s['consecutive_losses'] += 1
-            s['last_trade_result'] = 'loss'
-        else:
-            s['consecutive_losses'] = 0
-            s['last_trade_result'] = 'win'
+            # Update consecutive losses
+            if profit_pct < 0:
+                s['consecutive_losses'] += 1
+                s['last_trade_result'] = 'loss'
+            else:
+                s['consecutive_losses'] = 0
+                s['last_trade_result'] = 'win'
 
-        # Record trade in history
-        if 'trade_history' not in s:
-            s['trade_history'] = []
-        s['trade_history'].append({
-            'entry_time': s['entry_time'],
-            'exit_time': exit_time.isoformat(),
-            'entry_price': s['entry_price'],
-            'exit_price': exit_price,
-            'size': s['position_size_btc'],
-            'profit_pct': round(profit_pct, 2),
-            'profit_usd': round(pnl_usd, 2),
-            'result': 'win' if profit_pct >= 0 else 'loss'
-        })
-
-        # Clear position
-        s['in_position'] = False
-        s['entry_time'] = None
-        s['entry_price'] = None
-        s['position_size_btc'] = None
-        s['position_size_usd'] = None
-        s['peak_price'] = None
-
-        self.save_state()
+            # Record trade in history
+            if 'trade_history' not in s:
+                s['trade_history'] = []
+            s['trade_history'].append({
+                'entry_time': s['entry_time'],
+                'exit_time': exit_time.isoformat(),
+                'entry_price': s['entry_price'],
+                'exit_price': exit_price,
+                'size': s['position_size_btc'],
+                'profit_pct': round(profit_pct, 2),
+                'profit_usd': round(pnl_usd, 2),
+                'result': 'win' if profit_pct >= 0 else 'loss'
+            })
+
+            # Clear position
+            s['in_position'] = False
+            s['entry_time'] = None
+            s['entry_price'] = None
+            s['position_size_btc'] = None
+            s['position_size_usd'] = None
+            s['peak_price'] = None
+
+            self.save_state(sync=True)
         print(f"[{strategy_name}] Position exited: {profit_pct:+.2f}% (${pnl_usd:+,.2f})")
 
     def reset_daily_stats(self):
         """Reset daily statistics (call at midnight EST)"""
-        self.state['daily_pnl'] = 0.0
-        self.save_state()
-        print(f"Daily stats reset")
+        with self._lock:
+            self.state['daily_pnl'] = 0.0
+            self.save_state()
+            print(f"Daily stats reset")
 
     def record_entry_check(self, strategy_name: str, check_time: datetime, result: bool, reason: str):
         """
@@ -295,17 +481,21 @@ class StateManager:
             result: True if entry was executed, False if skipped
             reason: Human-readable reason
         """
-        self.ensure_strategy_exists(strategy_name)
-        s = self.state['strategies'][strategy_name]
-        s['last_entry_check_time'] = check_time.isoformat()
-        s['last_entry_check_result'] = result
-        s['last_entry_check_reason'] = reason
+        with self._lock:
+            self.ensure_strategy_exists(strategy_name)
+            s = self.state['strategies'][strategy_name]
+            fields = {
+                'last_entry_check_time': check_time.isoformat(),
+                'last_entry_check_result': result,
+                'last_entry_check_reason': reason
+            }
 
-        # Track when conditions were last TRUE (backtest-style signal)
-        if result:
-            s['last_signal_time'] = check_time.isoformat()
+            # Track when conditions were last TRUE (backtest-style signal)
+            if result:
+                fields['last_signal_time'] = check_time.isoformat()
 
-        self.save_state()
+            s.update(fields)
+            self._append_change('check', strategy_name, fields)
 
     def get_last_entry_check(self, strategy_name: str = None) -> Optional[Dict]:
         """
@@ -393,6 +583,30 @@ class StateManager:
         self.ensure_strategy_exists(strategy_name)
         return self.state['strategies'][strategy_name].copy()
 
+    def get_all_strategy_states(self) -> Dict[str, Dict]:
+        """
+        Get state for every strategy in one call
+
+        Returns:
+            Dictionary of {strategy_name: copy of its state}
+        """
+        with self._lock:
+            return {name: s.copy() for name, s in self.state.get('strategies', {}).items()}
+
+    def snapshot(self) -> StateSnapshot:
+        """
+        Take a read-only snapshot of all strategy state
+
+        Use at the start of a loop iteration; one lock acquisition covers
+        every read the iteration makes.
+        """
+        with self._lock:
+            strategies = {
+                name: {k: v for k, v in s.items() if k != 'trade_history'}
+                for name, s in self.state.get('strategies', {}).items()
+            }
+            return StateSnapshot(strategies, self.state.get('daily_pnl', 0))
+
     def get_trade_history(self, strategy_name: str = None, limit: int = 20) -> List[Dict]:
         """
         Get trade history, newest first
@@ -533,4 +747,13 @@ if __name__ == '__main__':
         manager.disable_strategy('overnight')
         print(f"After disabling overnight: {manager}")
 
+        # Peak updates go to the changelog and are replayed on load
+        manager.update_peak_price('overnight', 92000)
+        reloaded = StateManager(tmpdir)
+        reloaded.load_state()
+        assert reloaded.get_position_details('overnight')['peak_price'] == 92000
+        print(f"After changelog replay: {reloaded}")
+        reloaded.close()
+        manager.close()
+
         print("\nAll tests passed!")
@@ -18,9 +18,26 @@ Key Difference vs Backtest:
 - Live: Checks current moment and decides action
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo
+
+UTC = timezone.utc
+
+
+class EntryReason(IntEnum):
+    """
+    Machine-readable outcome of should_enter()
+
+    The bot only records entry checks that were actually evaluated, so
+    routine "wrong hour" and "cooldown" rejections are tagged here instead
+    of being recognised by parsing the reason text.
+    """
+    OK = 0
+    NOT_ENTRY_HOUR = 1
+    COOLDOWN = 2
+    OTHER_BLOCK = 3
 
 
 class OvernightRecoveryStrategy:
@@ -51,12 +68,13 @@ class OvernightRecoveryStrategy:
         self.entry_hour = config.get('entry_hour', 15)
         self.max_entry_price = config.get('max_entry_price_usd', 90000)
         self.trailing_stop_pct = config.get('trailing_stop_pct', 1.0)
-        self.timezone = pytz.timezone(config.get('timezone', 'America/New_York'))
+        self.timezone = ZoneInfo(config.get('timezone', 'America/New_York'))
 
         # Track if we already entered today (only 1 trade per day)
         self.last_entry_date = None
 
-    def should_enter(self, current_time: datetime, current_price: float) -> Tuple[bool, str]:
+    def should_enter(self, current_time: datetime,
+                     current_price: float) -> Tuple[bool, EntryReason, str]:
         """
         Decide if we should BUY right now
 
@@ -70,11 +88,11 @@ class OvernightRecoveryStrategy:
             current_price: Current BTC price
 
         Returns:
-            (should_buy, reason) - True/False and explanation
+            (should_buy, reason_code, reason) - True/False, EntryReason and explanation
 
         Example:
             >>> strategy = OvernightRecoveryStrategy(config)
-            >>> should_buy, reason = strategy.should_enter(now, 87500)
+            >>> should_buy, _, reason = strategy.should_enter(now, 87500)
             >>> if should_buy:
             ...     print(f"ENTRY: {reason}")
             ENTRY: All conditions met - Price $87,500 < $90,000 at 3:00 PM EST
@@ -87,23 +105,23 @@ class OvernightRecoveryStrategy:
 
         # Check 1: Is it 3 PM EST? (Allow 5-minute window: 15:00-15:05)
         if current_hour != self.entry_hour:
-            return False, f"Not entry hour (current: {current_hour}:00, target: {self.entry_hour}:00)"
+            return False, EntryReason.NOT_ENTRY_HOUR, f"Not entry hour (current: {current_hour}:00, target: {self.entry_hour}:00)"
 
         if current_minute > 30:
-            return False, f"Entry window closed (current: {current_hour}:{current_minute:02d})"
+            return False, EntryReason.OTHER_BLOCK, f"Entry window closed (current: {current_hour}:{current_minute:02d})"
 
         # Check 2: Already entered today?
         if self.last_entry_date == current_date:
-            return False, f"Already entered today ({current_date})"
+            return False, EntryReason.OTHER_BLOCK, f"Already entered today ({current_date})"
 
         # Check 3: Price filter
         if current_price >= self.max_entry_price:
-            return False, f"Price too high (${current_price:,.0f} >= ${self.max_entry_price:,.0f})"
+            return False, EntryReason.OTHER_BLOCK, f"Price too high (${current_price:,.0f} >= ${self.max_entry_price:,.0f})"
 
         # All conditions met!
         self.last_entry_date = current_date
         reason = f"All conditions met - Price ${current_price:,.0f} < ${self.max_entry_price:,.0f} at {current_hour}:{current_minute:02d} EST"
-        return True, reason
+        return True, EntryReason.OK, reason
 
     def should_exit(self, current_price: float, entry_price: float,
                    peak_price: float) -> Tuple[bool, str]:
@@ -221,18 +239,18 @@ if __name__ == '__main__':
     print(f"Strategy: {strategy}")
 
     # Test entry logic
-    test_time = datetime.now(pytz.UTC)
+    test_time = datetime.now(UTC)
     test_time = test_time.replace(hour=20, minute=2)  # 3:02 PM EST (20:02 UTC)
 
     print(f"\nTest Entry Logic:")
-    print(f"Time: {test_time.astimezone(pytz.timezone('America/New_York'))}")
+    print(f"Time: {test_time.astimezone(ZoneInfo('America/New_York'))}")
 
     # Test case 1: Good entry
-    should_buy, reason = strategy.should_enter(test_time, 87000)
+    should_buy, _, reason = strategy.should_enter(test_time, 87000)
     print(f"\nPrice $87,000: {should_buy} - {reason}")
 
     # Test case 2: Price too high
-    should_buy, reason = strategy.should_enter(test_time, 92000)
+    should_buy, _, reason = strategy.should_enter(test_time, 92000)
     print(f"Price $92,000: {should_buy} - {reason}")
 
     # Test exit logic